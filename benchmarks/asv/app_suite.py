@@ -15,18 +15,39 @@
 Define asv benchmark suite that estimates the speed of applications.
 """
 
-import pennylane as qml
 from pennylane import numpy as np
-from pennylane.templates.subroutines import UCCSD
 from functools import partial
-from ..benchmark_functions.vqe import benchmark_vqe
+from ..benchmark_functions.compat import (
+    UCCSD,
+    device as create_device,
+    metric_tensor,
+    num_executions,
+)
+from ..benchmark_functions.convergence import benchmark_qaoa_to_target, benchmark_vqe_to_target
+from ..benchmark_functions.optimizers import OPTIMIZERS, timed_steps
+from ..benchmark_functions.vqe import benchmark_vqe, prepare_vqe, vqe_cost_function
 from ..benchmark_functions.hamiltonians import ham_lih
-from ..benchmark_functions.qaoa import benchmark_qaoa
-from ..benchmark_functions.machine_learning import benchmark_machine_learning
+from ..benchmark_functions.qaoa import benchmark_qaoa, min_vertex_cover_hamiltonians
+from ..benchmark_functions.machine_learning import (
+    benchmark_machine_learning,
+    benchmark_streaming_ml,
+    iterate_batches,
+    stream_dataset,
+)
+from ..benchmark_functions.measurement import (
+    checked_executions,
+    peak_memory,
+    shared_result,
+    wall_time,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
 
 import networkx as nx
 
 
+@with_adaptive_sampling
+@with_resource_tracking
 class VQE_light:
     """Benchmark the VQE algorithm using different number of optimization steps and grouping
     options."""
@@ -47,6 +68,70 @@ class VQE_light:
         benchmark_vqe(hyperparams)
 
 
+@with_adaptive_sampling
+@with_resource_tracking
+class VQE_optimizers:
+    """Benchmark the steps of different optimizers for the VQE algorithm with the UCCSD ansatz
+    for the hydrogen molecule."""
+
+    params = OPTIMIZERS
+    param_names = ["optimizer"]
+    n_steps = 3
+
+    def setup(self, optimizer):
+        def compute():
+            hyperparams = {"n_steps": self.n_steps, "optimizer": optimizer}
+            opt, cost_fn, params, n_steps = prepare_vqe(hyperparams)
+            return timed_steps(opt, cost_fn, params, n_steps)
+
+        # both tracks report the same steps, without the construction of the cost function
+        self.steps = shared_result(self, (optimizer,), compute)
+
+    def time_hydrogen(self, optimizer):
+        """Time the VQE algorithm for the hydrogen molecule."""
+        hyperparams = {"n_steps": self.n_steps, "optimizer": optimizer}
+        benchmark_vqe(hyperparams)
+
+    def track_time_per_step(self, optimizer):
+        """Track the average time of a VQE step."""
+        return self.steps["time"] / self.n_steps
+
+    track_time_per_step.unit = "seconds"
+
+    def track_executions_per_step(self, optimizer):
+        """Track the average number of circuit executions of a VQE step."""
+        return checked_executions(self.steps["executions"]) / self.n_steps
+
+    track_executions_per_step.unit = "executions"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class VQE_metric_tensor:
+    """Benchmark the construction of the metric tensor used by the quantum natural gradient
+    optimizer for the VQE cost function of the hydrogen molecule."""
+
+    params = [False, True]
+    param_names = ["optimize"]
+
+    def setup(self, optimize):
+        self.cost_fn, self.params, _, _ = vqe_cost_function({"optimize": optimize})
+
+    def time_metric_tensor(self, optimize):
+        """Time the metric tensor of the VQE cost function."""
+        metric_tensor(self.cost_fn)(self.params)
+
+    def track_executions(self, optimize):
+        """Track the number of circuit executions needed for the metric tensor."""
+        start = num_executions(self.cost_fn)
+        metric_tensor(self.cost_fn)(self.params)
+        return checked_executions(num_executions(self.cost_fn) - start)
+
+    track_executions.unit = "executions"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
 class VQE_heavy:
     """Benchmark the VQE algorithm using different grouping options for the lithium hydride molecule
     with 2 active electrons and 8 active spin-orbitals. The sto-3g basis set and UCCSD ansatz are
@@ -104,7 +189,7 @@ class VQE_heavy:
             ]
         )
 
-        self.device = qml.device("default.qubit", wires=len(hf_state))
+        self.device = create_device("default.qubit", wires=len(hf_state))
 
     def time_lih(self, optimize):
         """Time the VQE algorithm for the lithium hydride molecule."""
@@ -133,6 +218,41 @@ class VQE_heavy:
         benchmark_vqe(hyperparams)
 
 
+class VQE_to_accuracy:
+    """Benchmark the VQE algorithm for the hydrogen molecule until chemical accuracy is reached,
+    using different optimizers. The step cap is 200 steps."""
+
+    params = OPTIMIZERS
+    param_names = ["optimizer"]
+
+    timeout = 600
+
+    def setup(self, optimizer):
+        self.result = shared_result(
+            self, (optimizer,), lambda: benchmark_vqe_to_target({"optimizer": optimizer})
+        )
+
+    def track_time_to_target(self, optimizer):
+        """Track the time until the energy is within chemical accuracy."""
+        return self.result["time_to_target"]
+
+    track_time_to_target.unit = "seconds"
+
+    def track_steps_to_target(self, optimizer):
+        """Track the number of steps until the energy is within chemical accuracy."""
+        return self.result["steps_to_target"]
+
+    track_steps_to_target.unit = "steps"
+
+    def track_final_error(self, optimizer):
+        """Track the energy error at the end of the optimization."""
+        return self.result["final_error"]
+
+    track_final_error.unit = "Hartree"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
 class QAOA_light:
     """Benchmark the QAOA algorithm for finding the minimum vertex cover of a small graph using
     different number of layers."""
@@ -152,6 +272,8 @@ class QAOA_light:
         benchmark_qaoa(hyperparams)
 
 
+@with_adaptive_sampling
+@with_resource_tracking
 class QAOA_heavy:
     """Benchmark the QAOA algorithm for finding the minimum vertex cover of a large graph."""
 
@@ -161,18 +283,58 @@ class QAOA_heavy:
     repeat = (1, 1, 600)  # Only collect one sample
     number = 1  # one iteration in each sample
 
-    def time_minvertex_heavy(self):
+    def setup_cache(self):
+        # the Hamiltonians are built once and kept in the artifact cache across runs
+        return min_vertex_cover_hamiltonians(list(self.graph.nodes), list(self.graph.edges))
+
+    def time_minvertex_heavy(self, hamiltonians):
         """Time a QAOA algorithm for finding the minimum vertex cover of a large graph."""
-        hyperparams = {"n_layers": self.n_layers, "graph": self.graph}
+        hyperparams = {"n_layers": self.n_layers, "graph": self.graph, "hamiltonians": hamiltonians}
         benchmark_qaoa(hyperparams)
 
-    def peakmem_minvertex_heavy(self):
+    def peakmem_minvertex_heavy(self, hamiltonians):
         """Benchmark the peak memory usage of a QAOA algorithm for finding the minimum vertex cover
         of a large graph."""
-        hyperparams = {"n_layers": self.n_layers, "graph": self.graph}
+        hyperparams = {"n_layers": self.n_layers, "graph": self.graph, "hamiltonians": hamiltonians}
         benchmark_qaoa(hyperparams)
 
 
+class QAOA_to_accuracy:
+    """Benchmark the QAOA algorithm for the minimum vertex cover of a small graph until an
+    approximation ratio of 0.9 is reached, using different optimizers. The step cap is 200 steps."""
+
+    params = (OPTIMIZERS, [2, 4])
+    param_names = ["optimizer", "n_layers"]
+
+    timeout = 600
+
+    def setup(self, optimizer, n_layers):
+        hyperparams = {"optimizer": optimizer, "n_layers": n_layers}
+        self.result = shared_result(
+            self, (optimizer, n_layers), lambda: benchmark_qaoa_to_target(hyperparams)
+        )
+
+    def track_time_to_target(self, optimizer, n_layers):
+        """Track the time until the target approximation ratio is reached."""
+        return self.result["time_to_target"]
+
+    track_time_to_target.unit = "seconds"
+
+    def track_steps_to_target(self, optimizer, n_layers):
+        """Track the number of steps until the target approximation ratio is reached."""
+        return self.result["steps_to_target"]
+
+    track_steps_to_target.unit = "steps"
+
+    def track_final_error(self, optimizer, n_layers):
+        """Track one minus the approximation ratio at the end of the optimization."""
+        return self.result["final_error"]
+
+    track_final_error.unit = "1 - ratio"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
 class ML_light:
     """Benchmark a hybrid quantum-classical machine learning application with a small dataset."""
 
@@ -201,6 +363,8 @@ class ML_light:
         benchmark_machine_learning(hyperparams)
 
 
+@with_adaptive_sampling
+@with_resource_tracking
 class ML_heavy:
     """Benchmark a hybrid quantum-classical machine learning application with a large dataset."""
 
@@ -230,3 +394,92 @@ class ML_heavy:
             "interface": interface,
         }
         benchmark_machine_learning(hyperparams)
+
+
+def _consume_stream(n_samples, n_features, batch_size):
+    """Streams a full dataset in mini-batches without training on it."""
+    for _ in iterate_batches(stream_dataset(n_samples, n_features), batch_size):
+        pass
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class ML_streaming:
+    """Benchmark a full epoch of mini-batch training of a hybrid quantum-classical machine learning
+    application on streamed datasets. The datasets span several chunks, so that the memory of
+    training can be compared across dataset sizes; `StreamingDataset` covers larger datasets."""
+
+    params = (["autograd", "torch", "tf"], [256, 1024])
+    param_names = ["interface", "n_samples"]
+    n_features = 4
+    batch_size = 32
+    chunk_size = 128
+
+    timeout = 600
+
+    def _hyperparams(self, interface, n_samples):
+        return {
+            "n_features": self.n_features,
+            "n_samples": n_samples,
+            "batch_size": self.batch_size,
+            "chunk_size": self.chunk_size,
+            "interface": interface,
+        }
+
+    def time_ml_streaming(self, interface, n_samples):
+        """Time one epoch of mini-batch training on a streamed dataset."""
+        benchmark_streaming_ml(self._hyperparams(interface, n_samples))
+
+    def _timed_epoch(self, interface, n_samples):
+        # both throughputs report the same epoch
+        return shared_result(
+            self,
+            (interface, n_samples),
+            lambda: wall_time(benchmark_streaming_ml, self._hyperparams(interface, n_samples)),
+        )
+
+    def track_samples_per_second(self, interface, n_samples):
+        """Track the number of samples trained on per second."""
+        n_trained, elapsed = self._timed_epoch(interface, n_samples)
+        return n_trained / elapsed
+
+    track_samples_per_second.unit = "samples/s"
+
+    def track_epochs_per_second(self, interface, n_samples):
+        """Track the number of epochs trained per second."""
+        n_trained, elapsed = self._timed_epoch(interface, n_samples)
+        return n_trained / n_samples / elapsed
+
+    track_epochs_per_second.unit = "epochs per second"
+
+    def track_peak_workload_memory(self, interface, n_samples):
+        """Track the peak memory allocated during training, which should not grow with the
+        dataset."""
+        _, peak = peak_memory(benchmark_streaming_ml, self._hyperparams(interface, n_samples))
+        return peak
+
+    track_peak_workload_memory.unit = "bytes"
+
+
+class StreamingDataset:
+    """Benchmark a full pass over streamed datasets of growing size, without training."""
+
+    params = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    param_names = ["n_samples"]
+    n_features = 4
+    batch_size = 32
+
+    def track_samples_per_second(self, n_samples):
+        """Track the number of samples streamed per second."""
+        _, elapsed = wall_time(_consume_stream, n_samples, self.n_features, self.batch_size)
+        return n_samples / elapsed
+
+    track_samples_per_second.unit = "samples/s"
+
+    def track_stream_memory(self, n_samples):
+        """Track the peak memory allocated by a full pass, which should not grow with the
+        dataset."""
+        _, peak = peak_memory(_consume_stream, n_samples, self.n_features, self.batch_size)
+        return peak
+
+    track_stream_memory.unit = "bytes"
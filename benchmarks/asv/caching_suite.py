@@ -0,0 +1,67 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the speed of repeated QNode evaluations.
+"""
+from ..benchmark_functions.caching import MODES, benchmark_qnode_reuse
+from ..benchmark_functions.circuit import benchmark_circuit
+from ..benchmark_functions.measurement import (
+    retained_memory,
+    wall_time,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class QNodeReuse_light:
+    """Benchmark repeated evaluations of a circuit with fresh or reused QNodes."""
+
+    params = ([False, True], [2, 5])
+    param_names = ["reuse_qnode", "n_wires"]
+
+    def time_repeated_circuit(self, reuse_qnode, n_wires):
+        """Time 100 evaluations of a simple default circuit."""
+        hyperparams = {"n_wires": n_wires, "reuse_qnode": reuse_qnode}
+        benchmark_circuit(hyperparams, num_repeats=100)
+
+
+class ExecutionCache:
+    """Benchmark fresh QNodes, reused QNodes and reused QNodes with an execution cache, for
+    parameter sequences with different fractions of repeated parameters."""
+
+    params = (MODES, [0.0, 0.25, 0.5, 0.75, 1.0], [2, 5])
+    param_names = ["mode", "hit_ratio", "n_wires"]
+    n_calls = 200
+
+    def track_latency_per_call(self, mode, hit_ratio, n_wires):
+        """Track the average latency of a single QNode call."""
+        hyperparams = {"n_wires": n_wires}
+        _, elapsed = wall_time(
+            benchmark_qnode_reuse, hyperparams, mode=mode, n_calls=self.n_calls, hit_ratio=hit_ratio
+        )
+        return elapsed / self.n_calls
+
+    track_latency_per_call.unit = "seconds"
+
+    def track_cache_memory(self, mode, hit_ratio, n_wires):
+        """Track the memory retained by the QNode and its execution cache after all calls."""
+        hyperparams = {"n_wires": n_wires}
+        _, retained = retained_memory(
+            benchmark_qnode_reuse, hyperparams, mode=mode, n_calls=self.n_calls, hit_ratio=hit_ratio
+        )
+        return retained
+
+    track_cache_memory.unit = "bytes"
@@ -0,0 +1,100 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates when circuit optimization transforms pay for themselves.
+"""
+from ..benchmark_functions.compilation import (
+    COMPILATION_WORKLOADS,
+    TRANSFORM_PIPELINES,
+    benchmark_compilation,
+)
+from ..benchmark_functions.measurement import shared_result
+
+
+class TransformPipeline:
+    """Benchmark transform pipelines on the circuit families, QAOA and UCCSD, comparing the cost
+    of the transforms with the execution and gradient time they save."""
+
+    params = (COMPILATION_WORKLOADS, list(TRANSFORM_PIPELINES), [4, 8])
+    param_names = ["workload", "pipeline", "n_wires"]
+
+    timeout = 600
+    n_layers = 3
+    num_repeats = 5
+
+    def setup(self, workload, pipeline, n_wires):
+        hyperparams = {
+            "workload": workload,
+            "pipeline": pipeline,
+            "n_wires": n_wires,
+            "n_layers": self.n_layers,
+        }
+        self.result = shared_result(
+            self,
+            (workload, pipeline, n_wires),
+            lambda: benchmark_compilation(hyperparams, num_repeats=self.num_repeats),
+        )
+
+    def track_transform_time(self, workload, pipeline, n_wires):
+        """Track the time of applying the pipeline."""
+        return self.result["transform_time"]
+
+    track_transform_time.unit = "seconds"
+
+    def track_gate_count_reduction(self, workload, pipeline, n_wires):
+        """Track the fraction of gates removed by the pipeline."""
+        before = self.result["gate_count_before"]
+        return (before - self.result["gate_count_after"]) / before
+
+    track_gate_count_reduction.unit = "fraction of gates"
+
+    def track_execution_time(self, workload, pipeline, n_wires):
+        """Track the time of executing the transformed circuit."""
+        return self.result["execution_time_after"]
+
+    track_execution_time.unit = "seconds"
+
+    def track_execution_speedup(self, workload, pipeline, n_wires):
+        """Track the execution time of the original circuit divided by that of the transformed
+        circuit."""
+        return self.result["execution_time_before"] / self.result["execution_time_after"]
+
+    track_execution_speedup.unit = "speedup"
+
+    def track_gradient_time(self, workload, pipeline, n_wires):
+        """Track the time of the parameter-shift gradient of the transformed circuit."""
+        return self.result["gradient_time_after"]
+
+    track_gradient_time.unit = "seconds"
+
+    def track_gradient_speedup(self, workload, pipeline, n_wires):
+        """Track the gradient time of the original circuit divided by that of the transformed
+        circuit."""
+        return self.result["gradient_time_before"] / self.result["gradient_time_after"]
+
+    track_gradient_speedup.unit = "speedup"
+
+    def track_break_even_executions(self, workload, pipeline, n_wires):
+        """Track the number of executions after which the pipeline pays for itself, with no value
+        if it saves no execution time."""
+        return self.result["break_even_executions"]
+
+    track_break_even_executions.unit = "executions"
+
+    def track_break_even_gradients(self, workload, pipeline, n_wires):
+        """Track the number of gradients after which the pipeline pays for itself, with no value
+        if it saves no gradient time."""
+        return self.result["break_even_gradients"]
+
+    track_break_even_gradients.unit = "gradients"
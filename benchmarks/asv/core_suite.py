@@ -16,9 +16,19 @@ Define asv benchmark suite that estimates the speed of core operations.
 """
 from ..benchmark_functions.circuit import benchmark_circuit
 from ..benchmark_functions.gradient import benchmark_gradient
-from ..benchmark_functions.optimization import benchmark_optimization
+from ..benchmark_functions.optimization import benchmark_optimization, prepare_optimization
+from ..benchmark_functions.optimizers import OPTIMIZERS, benchmark_metric_tensor, timed_steps
+from ..benchmark_functions.measurement import (
+    checked_executions,
+    memory_amplification,
+    shared_result,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
 
 
+@with_adaptive_sampling
+@with_resource_tracking
 class CircuitEvaluation_light:
     """Benchmark the evaluation of a circuit using different widths and depths."""
 
@@ -30,7 +40,16 @@ class CircuitEvaluation_light:
         hyperparams = {"n_wires": n_wires, "n_layers": n_layers}
         benchmark_circuit(hyperparams)
 
+    def track_memory_amplification(self, n_wires, n_layers):
+        """Track the number of state copies kept alive by a simple default circuit."""
+        hyperparams = {"n_wires": n_wires, "n_layers": n_layers}
+        return memory_amplification(benchmark_circuit, n_wires, hyperparams)
+
+    track_memory_amplification.unit = "state copies"
 
+
+@with_adaptive_sampling
+@with_resource_tracking
 class GradientComputation_light:
     """Time the computation of a gradient using different widths and depths."""
 
@@ -42,6 +61,47 @@ class GradientComputation_light:
         benchmark_gradient(hyperparams)
 
 
+class MemoryAmplification:
+    """Benchmark how many copies of the state vector are kept alive by circuit evaluations and
+    gradient computations with different differentiation methods and interfaces.
+
+    Memory allocated by TensorFlow and Torch outside of Python's allocators is not traced."""
+
+    params = (
+        [2, 5, 10, 15],
+        ["backprop", "parameter-shift", "adjoint"],
+        ["autograd", "tf", "torch", "jax"],
+    )
+    param_names = ["n_wires", "diff_method", "interface"]
+    n_layers = 3
+
+    def track_circuit_amplification(self, n_wires, diff_method, interface):
+        """Track the number of state copies kept alive by a circuit evaluation."""
+        hyperparams = {
+            "n_wires": n_wires,
+            "n_layers": self.n_layers,
+            "diff_method": diff_method,
+            "interface": interface,
+        }
+        return memory_amplification(benchmark_circuit, n_wires, hyperparams)
+
+    track_circuit_amplification.unit = "state copies"
+
+    def track_gradient_amplification(self, n_wires, diff_method, interface):
+        """Track the number of state copies kept alive by a gradient computation."""
+        hyperparams = {
+            "n_wires": n_wires,
+            "n_layers": self.n_layers,
+            "diff_method": diff_method,
+            "interface": interface,
+        }
+        return memory_amplification(benchmark_gradient, n_wires, hyperparams)
+
+    track_gradient_amplification.unit = "state copies"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
 class Optimization_light:
     """Benchmark the optimization of a circuit."""
 
@@ -52,3 +112,61 @@ class Optimization_light:
         """Time gradient descent on the default circuit using an interface."""
         hyperparams = {"interface": interface}
         benchmark_optimization(hyperparams, n_steps=10)
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class Optimizers_light:
+    """Benchmark the steps of different optimizers on the default circuit."""
+
+    params = (OPTIMIZERS, [2, 5])
+    param_names = ["optimizer", "n_wires"]
+    n_steps = 5
+
+    def setup(self, optimizer, n_wires):
+        def compute():
+            hyperparams = {"optimizer": optimizer, "n_wires": n_wires}
+            opt, circuit, params = prepare_optimization(hyperparams)
+            return timed_steps(opt, circuit, params, self.n_steps)
+
+        # both tracks report the same steps, without the construction of the QNode
+        self.steps = shared_result(self, (optimizer, n_wires), compute)
+
+    def time_optimization(self, optimizer, n_wires):
+        """Time the optimization of the default circuit."""
+        hyperparams = {"optimizer": optimizer, "n_wires": n_wires}
+        benchmark_optimization(hyperparams, n_steps=self.n_steps)
+
+    def track_time_per_step(self, optimizer, n_wires):
+        """Track the average time of an optimization step."""
+        return self.steps["time"] / self.n_steps
+
+    track_time_per_step.unit = "seconds"
+
+    def track_executions_per_step(self, optimizer, n_wires):
+        """Track the average number of circuit executions of an optimization step."""
+        return checked_executions(self.steps["executions"]) / self.n_steps
+
+    track_executions_per_step.unit = "executions"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class MetricTensor_light:
+    """Benchmark the construction of the metric tensor used by the quantum natural gradient
+    optimizer."""
+
+    params = ([2, 5, 10], [3, 6])
+    param_names = ["n_wires", "n_layers"]
+
+    def time_metric_tensor(self, n_wires, n_layers):
+        """Time the metric tensor of the default circuit."""
+        hyperparams = {"n_wires": n_wires, "n_layers": n_layers}
+        benchmark_metric_tensor(hyperparams)
+
+    def track_executions(self, n_wires, n_layers):
+        """Track the number of circuit executions needed for the metric tensor."""
+        hyperparams = {"n_wires": n_wires, "n_layers": n_layers}
+        return checked_executions(benchmark_metric_tensor(hyperparams))
+
+    track_executions.unit = "executions"
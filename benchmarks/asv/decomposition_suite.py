@@ -0,0 +1,111 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the cost of decomposing templates into primitive gates.
+
+Depending on the PennyLane version, templates are decomposed when they are recorded or when the
+tape is expanded, so both steps are timed.
+"""
+from ..benchmark_functions.circuit_families import operation_metadata
+from ..benchmark_functions.decomposition import (
+    LAYERLESS_TEMPLATES,
+    TEMPLATES,
+    decompose_template,
+    excitation_wires,
+    make_template,
+    record_template,
+)
+from ..benchmark_functions.measurement import with_adaptive_sampling, with_resource_tracking
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class TemplateDecomposition:
+    """Benchmark the decomposition of templates with a growing number of wires and layers."""
+
+    params = (TEMPLATES, [4, 8, 12], [1, 4])
+    param_names = ["template", "n_wires", "n_layers"]
+
+    timeout = 300
+
+    def setup(self, template, n_wires, n_layers):
+        # the size of these templates does not depend on the number of layers
+        if template in LAYERLESS_TEMPLATES and n_layers != 1:
+            raise NotImplementedError
+
+        self.template = make_template(template, n_wires, n_layers)
+        self.tape = record_template(self.template)
+
+    def time_record(self, template, n_wires, n_layers):
+        """Time recording the template on a tape."""
+        record_template(self.template)
+
+    def time_decompose(self, template, n_wires, n_layers):
+        """Time expanding the recorded template into primitive gates."""
+        decompose_template(self.tape)
+
+    def track_gate_count(self, template, n_wires, n_layers):
+        """Track the number of primitive gates."""
+        return operation_metadata(decompose_template(self.tape))["gate_count"]
+
+    track_gate_count.unit = "gates"
+
+    def track_two_qubit_gate_count(self, template, n_wires, n_layers):
+        """Track the number of primitive two-qubit gates."""
+        return operation_metadata(decompose_template(self.tape))["two_qubit_gate_count"]
+
+    track_two_qubit_gate_count.unit = "gates"
+
+    def track_depth(self, template, n_wires, n_layers):
+        """Track the depth of the decomposed template."""
+        return operation_metadata(decompose_template(self.tape))["depth"]
+
+    track_depth.unit = "layers"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class UCCSDScaling:
+    """Benchmark the construction and decomposition of UCCSD at half filling, whose number of
+    excitations grows with the fourth power of the number of wires."""
+
+    params = [4, 6, 8, 10, 12]
+    param_names = ["n_wires"]
+
+    timeout = 300
+
+    def setup(self, n_wires):
+        self.template = make_template("uccsd", n_wires)
+        self.tape = record_template(self.template)
+
+    def time_construction(self, n_wires):
+        """Time generating the excitations and recording UCCSD on a tape."""
+        record_template(make_template("uccsd", n_wires))
+
+    def time_decompose(self, n_wires):
+        """Time expanding the recorded UCCSD into primitive gates."""
+        decompose_template(self.tape)
+
+    def track_n_excitations(self, n_wires):
+        """Track the number of single and double excitations."""
+        s_wires, d_wires = excitation_wires(n_wires // 2, n_wires)
+        return len(s_wires) + len(d_wires)
+
+    track_n_excitations.unit = "excitations"
+
+    def track_gate_count(self, n_wires):
+        """Track the number of primitive gates."""
+        return operation_metadata(decompose_template(self.tape))["gate_count"]
+
+    track_gate_count.unit = "gates"
@@ -0,0 +1,100 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the speed of Hessians, metric tensors and Jacobians of
+vector-valued circuits.
+"""
+from ..benchmark_functions.derivatives import benchmark_hessian, benchmark_probs_jacobian
+from ..benchmark_functions.measurement import (
+    checked_executions,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
+from ..benchmark_functions.optimizers import benchmark_metric_tensor
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class Hessian:
+    """Benchmark the Hessian of the default circuit for different sizes and diff methods."""
+
+    params = (["parameter-shift", "backprop"], [2, 4, 6], [1, 3])
+    param_names = ["diff_method", "n_wires", "n_layers"]
+
+    timeout = 300
+
+    def time_hessian(self, diff_method, n_wires, n_layers):
+        """Time the Hessian."""
+        hyperparams = {"diff_method": diff_method, "n_wires": n_wires, "n_layers": n_layers}
+        benchmark_hessian(hyperparams)
+
+    def track_executions(self, diff_method, n_wires, n_layers):
+        """Track the number of circuit executions needed for the Hessian."""
+        hyperparams = {"diff_method": diff_method, "n_wires": n_wires, "n_layers": n_layers}
+        return checked_executions(benchmark_hessian(hyperparams))
+
+    track_executions.unit = "executions"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class MetricTensor:
+    """Benchmark the metric tensor of the default circuit for different sizes and diff methods."""
+
+    params = (["parameter-shift", "backprop"], [2, 5, 10], [3, 6])
+    param_names = ["diff_method", "n_wires", "n_layers"]
+
+    def time_metric_tensor(self, diff_method, n_wires, n_layers):
+        """Time the metric tensor."""
+        hyperparams = {"diff_method": diff_method, "n_wires": n_wires, "n_layers": n_layers}
+        benchmark_metric_tensor(hyperparams)
+
+    def track_executions(self, diff_method, n_wires, n_layers):
+        """Track the number of circuit executions needed for the metric tensor."""
+        hyperparams = {"diff_method": diff_method, "n_wires": n_wires, "n_layers": n_layers}
+        return checked_executions(benchmark_metric_tensor(hyperparams))
+
+    track_executions.unit = "executions"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class ProbsJacobian:
+    """Benchmark the Jacobian of the probabilities of the default circuit on 6 wires for a
+    growing number of outputs."""
+
+    params = (["parameter-shift", "backprop"], [1, 2, 4, 6], [2, 6])
+    param_names = ["diff_method", "n_measured", "n_layers"]
+
+    def time_probs_jacobian(self, diff_method, n_measured, n_layers):
+        """Time the Jacobian of the probabilities of the measured wires."""
+        hyperparams = {
+            "diff_method": diff_method,
+            "n_wires": 6,
+            "n_measured": n_measured,
+            "n_layers": n_layers,
+        }
+        benchmark_probs_jacobian(hyperparams)
+
+    def track_executions(self, diff_method, n_measured, n_layers):
+        """Track the number of circuit executions needed for the Jacobian."""
+        hyperparams = {
+            "diff_method": diff_method,
+            "n_wires": 6,
+            "n_measured": n_measured,
+            "n_layers": n_layers,
+        }
+        return checked_executions(benchmark_probs_jacobian(hyperparams))
+
+    track_executions.unit = "executions"
@@ -14,7 +14,15 @@
 """
 Define asv benchmark suite that estimates the speed of different devices.
 """
-from ..benchmark_functions.circuit import benchmark_circuit
+from ..benchmark_functions.circuit import benchmark_circuit, prepare_circuit
+from ..benchmark_functions.circuit_families import CIRCUIT_FAMILIES, circuit_family_metadata
+from ..benchmark_functions.measurement import (
+    PYTHON_STATE_DEVICES,
+    memory_amplification,
+    wall_time,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
 
 # List of devices to test.
 # The benchmark will fail if a device is not installed.
@@ -31,6 +39,8 @@ DEVICES = [
 ]
 
 
+@with_adaptive_sampling
+@with_resource_tracking
 class CircuitEvaluation:
     """Benchmark the evaluation of a circuit using different widths and depths."""
 
@@ -41,3 +51,69 @@ class CircuitEvaluation:
         """Time a simple default circuit."""
         hyperparams = {"n_wires": n_wires, "n_layers": n_layers, "device": dev}
         benchmark_circuit(hyperparams)
+
+
+class DeviceMemoryAmplification:
+    """Benchmark how many copies of their state the devices that keep it in NumPy arrays make
+    while evaluating a circuit. The state of the other devices is invisible to tracemalloc."""
+
+    params = (list(PYTHON_STATE_DEVICES), [2, 5, 10], [3, 6, 9])
+    param_names = ["device", "n_wires", "n_layers"]
+
+    def track_memory_amplification(self, dev, n_wires, n_layers):
+        """Track the number of state copies kept alive by a simple default circuit."""
+        hyperparams = {"n_wires": n_wires, "n_layers": n_layers, "device": dev}
+        return memory_amplification(benchmark_circuit, n_wires, hyperparams)
+
+    track_memory_amplification.unit = "state copies"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class CircuitFamilies:
+    """Benchmark the evaluation of circuits from different circuit families, so that device
+    comparisons reflect different gate mixes."""
+
+    params = (DEVICES, list(CIRCUIT_FAMILIES), [2, 5, 10])
+    param_names = ["device", "template", "n_wires"]
+    n_layers = 6
+
+    def setup(self, dev, template, n_wires):
+        self.metadata = circuit_family_metadata(template, n_wires, self.n_layers, dev)
+
+    def time_circuit(self, dev, template, n_wires):
+        """Time a circuit of the given family."""
+        hyperparams = {
+            "n_wires": n_wires,
+            "n_layers": self.n_layers,
+            "device": dev,
+            "template": template,
+        }
+        benchmark_circuit(hyperparams)
+
+    def track_time_per_gate(self, dev, template, n_wires):
+        """Track the evaluation time of a circuit of the given family divided by the number of
+        gates the device applies. The device and QNode are constructed before the timer starts."""
+        hyperparams = {
+            "n_wires": n_wires,
+            "n_layers": self.n_layers,
+            "device": dev,
+            "template": template,
+        }
+        circuit = prepare_circuit(hyperparams)
+        _, elapsed = wall_time(circuit)
+        return elapsed / self.metadata["gate_count"]
+
+    track_time_per_gate.unit = "seconds"
+
+    def track_gate_count(self, dev, template, n_wires):
+        """Track the number of gates of the circuit that the device applies."""
+        return self.metadata["gate_count"]
+
+    track_gate_count.unit = "gates"
+
+    def track_depth(self, dev, template, n_wires):
+        """Track the depth of the circuit in the gates the device applies."""
+        return self.metadata["depth"]
+
+    track_depth.unit = "layers"
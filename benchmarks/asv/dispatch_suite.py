@@ -0,0 +1,60 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that isolates the overhead of the interface layer for small circuits.
+"""
+from ..benchmark_functions.dispatch import INTERFACES, benchmark_dispatch, prepare_dispatch
+from ..benchmark_functions.measurement import with_adaptive_sampling, with_resource_tracking
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class InterfaceDispatch:
+    """Benchmark QNode calls through the interfaces on tiny circuits with a growing number of
+    parameters, relative to executing the same circuit on the device with NumPy parameters."""
+
+    params = (INTERFACES, [1, 2], [1, 10, 100])
+    param_names = ["interface", "n_wires", "n_params"]
+
+    timeout = 300
+
+    def setup(self, interface, n_wires, n_params):
+        self.hyperparams = {"n_wires": n_wires, "n_params": n_params}
+        self.forward, _, _ = prepare_dispatch(interface, dict(self.hyperparams))
+        self.backward, _, _ = prepare_dispatch(interface, dict(self.hyperparams), backward=True)
+
+    def time_forward(self, interface, n_wires, n_params):
+        """Time a forward pass."""
+        self.forward()
+
+    def time_backward(self, interface, n_wires, n_params):
+        """Time a backward pass."""
+        self.backward()
+
+    def track_forward_relative(self, interface, n_wires, n_params):
+        """Track the wall time of a forward pass divided by the time of a device execution."""
+        return benchmark_dispatch(interface, dict(self.hyperparams))["relative"]
+
+    track_forward_relative.unit = "device executions"
+
+    def track_backward_relative(self, interface, n_wires, n_params):
+        """Track the wall time of a backward pass divided by the time of as many device
+        executions as it needs, which isolates the cost of the interface layer from the number
+        of shifted circuits."""
+        result = benchmark_dispatch(
+            interface, dict(self.hyperparams), num_repeats=10, backward=True
+        )
+        return result["relative"]
+
+    track_backward_relative.unit = "device executions"
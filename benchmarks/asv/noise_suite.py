@@ -0,0 +1,129 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the cost of noise channels on mixed-state devices.
+"""
+import statistics
+
+from ..benchmark_functions.measurement import (
+    peak_memory,
+    wall_time,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
+from ..benchmark_functions.noise import CHANNELS, benchmark_noisy_circuit, prepare_noisy_circuit
+
+
+# number of interleaved pairs of timings of the noisy and noiseless circuit, whose medians are
+# compared
+N_PAIRS = 5
+
+
+def _prepare_pair(hyperparams, gradient):
+    """Prepares a noisy circuit and the same circuit without channels, so that the cost of the
+    channels is the difference between the two, which includes neither the QNode construction nor
+    the noiseless gates. The circuits are prepared in the tracks rather than in `setup`, which
+    would add to the peak memory of the `peakmem_` benchmarks."""
+    noisy, n_channels = prepare_noisy_circuit(dict(hyperparams), gradient)
+    noiseless, _ = prepare_noisy_circuit(hyperparams, gradient, noiseless=True)
+
+    # the first calls construct the tapes
+    noisy()
+    noiseless()
+
+    return noisy, noiseless, n_channels
+
+
+def _time_per_channel(hyperparams, gradient=False):
+    """Returns the difference of the median wall times of the noisy and noiseless circuit divided
+    by the number of channel applications."""
+    noisy, noiseless, n_channels = _prepare_pair(hyperparams, gradient)
+
+    noisy_times, noiseless_times = [], []
+    for _ in range(N_PAIRS):
+        noisy_times.append(wall_time(noisy)[1])
+        noiseless_times.append(wall_time(noiseless)[1])
+    return (statistics.median(noisy_times) - statistics.median(noiseless_times)) / n_channels
+
+
+def _memory_per_channel(hyperparams):
+    """Returns the difference of the peak memory of the noisy and noiseless circuit divided by the
+    number of channel applications."""
+    noisy, noiseless, n_channels = _prepare_pair(hyperparams, gradient=False)
+    return (peak_memory(noisy)[1] - peak_memory(noiseless)[1]) / n_channels
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class NoisyCircuit:
+    """Benchmark the evaluation of a noisy circuit on 'default.mixed' using different channels,
+    noise densities and widths, up to the memory wall of the 4^n density matrix."""
+
+    params = (CHANNELS, [0.25, 1.0], [2, 4, 6, 8, 10, 12])
+    param_names = ["channel", "density", "n_wires"]
+
+    timeout = 300
+
+    def time_noisy_circuit(self, channel, density, n_wires):
+        """Time a noisy circuit."""
+        hyperparams = {"channel": channel, "density": density, "n_wires": n_wires}
+        benchmark_noisy_circuit(hyperparams)
+
+    def peakmem_noisy_circuit(self, channel, density, n_wires):
+        """Benchmark the peak memory usage of a noisy circuit."""
+        hyperparams = {"channel": channel, "density": density, "n_wires": n_wires}
+        benchmark_noisy_circuit(hyperparams)
+
+    def track_time_per_channel(self, channel, density, n_wires):
+        """Track the evaluation time added per channel application."""
+        hyperparams = {"channel": channel, "density": density, "n_wires": n_wires}
+        return _time_per_channel(hyperparams)
+
+    track_time_per_channel.unit = "seconds"
+
+    def track_memory_per_channel(self, channel, density, n_wires):
+        """Track the peak memory added per channel application."""
+        hyperparams = {"channel": channel, "density": density, "n_wires": n_wires}
+        return _memory_per_channel(hyperparams)
+
+    track_memory_per_channel.unit = "bytes"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class NoisyGradient:
+    """Benchmark the gradient of a noisy circuit on 'default.mixed' using different channels,
+    noise densities and widths."""
+
+    params = (CHANNELS, [0.25, 1.0], [2, 4, 6, 8])
+    param_names = ["channel", "density", "n_wires"]
+
+    timeout = 300
+
+    def time_noisy_gradient(self, channel, density, n_wires):
+        """Time the gradient of a noisy circuit."""
+        hyperparams = {"channel": channel, "density": density, "n_wires": n_wires}
+        benchmark_noisy_circuit(hyperparams, gradient=True)
+
+    def peakmem_noisy_gradient(self, channel, density, n_wires):
+        """Benchmark the peak memory usage of the gradient of a noisy circuit."""
+        hyperparams = {"channel": channel, "density": density, "n_wires": n_wires}
+        benchmark_noisy_circuit(hyperparams, gradient=True)
+
+    def track_time_per_channel(self, channel, density, n_wires):
+        """Track the gradient time added per channel application."""
+        hyperparams = {"channel": channel, "density": density, "n_wires": n_wires}
+        return _time_per_channel(hyperparams, gradient=True)
+
+    track_time_per_channel.unit = "seconds"
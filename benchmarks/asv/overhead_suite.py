@@ -0,0 +1,42 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that isolates the Python overhead of the stages of a circuit evaluation.
+"""
+from ..benchmark_functions.overhead import STAGES, benchmark_overhead_stage
+
+
+class Overhead:
+    """Benchmark the per-operation cost of queuing, expansion, parameter handling and device
+    dispatch for long circuits on few wires."""
+
+    params = (STAGES, [100, 1000, 10000, 100000], [2, 5])
+    param_names = ["stage", "n_ops", "n_wires"]
+
+    timeout = 300
+    # number of operations handled over all repetitions of a stage, spread over at least
+    # ``min_repeats`` repetitions
+    ops_per_sample = 10 ** 5
+    min_repeats = 5
+
+    def setup(self, stage, n_ops, n_wires):
+        hyperparams = {"n_wires": n_wires, "n_ops": n_ops}
+        num_repeats = max(self.min_repeats, self.ops_per_sample // n_ops)
+        self.ns_per_op = benchmark_overhead_stage(stage, hyperparams, num_repeats=num_repeats)
+
+    def track_ns_per_op(self, stage, n_ops, n_wires):
+        """Track the median time spent per operation in the given stage over many repetitions."""
+        return self.ns_per_op
+
+    track_ns_per_op.unit = "ns"
@@ -0,0 +1,85 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the scaling of data-parallel gradient evaluations over
+worker processes.
+"""
+from ..benchmark_functions.data_parallel import benchmark_data_parallel
+from ..benchmark_functions.measurement import shared_result
+
+
+class DataParallelGradient:
+    """Benchmark data-parallel training of a hybrid quantum-classical machine learning application
+    with different numbers of worker processes and dataset sizes. Speedup and efficiency are
+    relative to a serial evaluation in the benchmark process."""
+
+    params = ([1, 2, 4, 8], [32, 128])
+    param_names = ["n_workers", "n_samples"]
+    n_steps = 3
+
+    timeout = 600
+
+    def setup_cache(self):
+        # serial step time for every dataset size
+        return {
+            n_samples: benchmark_data_parallel(
+                {"n_workers": 0, "n_samples": n_samples}, n_steps=self.n_steps
+            )["step_time"]
+            for n_samples in self.params[1]
+        }
+
+    def setup(self, serial_times, n_workers, n_samples):
+        hyperparams = {"n_workers": n_workers, "n_samples": n_samples}
+        self.result = shared_result(
+            self,
+            (n_workers, n_samples),
+            lambda: benchmark_data_parallel(hyperparams, n_steps=self.n_steps),
+        )
+
+    def track_step_time(self, serial_times, n_workers, n_samples):
+        """Track the mean wall time of a training step."""
+        return self.result["step_time"]
+
+    track_step_time.unit = "seconds"
+
+    def track_speedup(self, serial_times, n_workers, n_samples):
+        """Track the serial step time divided by the parallel step time."""
+        return serial_times[n_samples] / self.result["step_time"]
+
+    track_speedup.unit = "speedup"
+
+    def track_efficiency(self, serial_times, n_workers, n_samples):
+        """Track the speedup per worker process."""
+        return serial_times[n_samples] / self.result["step_time"] / n_workers
+
+    track_efficiency.unit = "speedup/worker"
+
+    def track_overhead_per_step(self, serial_times, n_workers, n_samples):
+        """Track the time per step not spent computing gradients in the slowest worker, such as
+        serialization and inter-process communication."""
+        return self.result["overhead_time"]
+
+    track_overhead_per_step.unit = "seconds"
+
+    def track_payload_per_step(self, serial_times, n_workers, n_samples):
+        """Track the number of pickled bytes sent to the workers per step."""
+        return self.result["payload_bytes"]
+
+    track_payload_per_step.unit = "bytes"
+
+    def track_startup_time(self, serial_times, n_workers, n_samples):
+        """Track the time to start the worker pool."""
+        return self.result["startup_time"]
+
+    track_startup_time.unit = "seconds"
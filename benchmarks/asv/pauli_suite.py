@@ -0,0 +1,79 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the speed of arithmetic on large Hamiltonians.
+"""
+from ..benchmark_functions.measurement import (
+    peak_memory,
+    retained_memory,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
+from ..benchmark_functions.pauli_arithmetic import (
+    OPERATIONS,
+    prepare_operation,
+    random_hamiltonian,
+)
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class PauliArithmetic:
+    """Benchmark operations on random Hamiltonians of 4-local Pauli words with a growing number
+    of terms and wires. Simplification, which compares all pairs of terms, is skipped above
+    ``max_simplify_terms`` terms."""
+
+    params = (OPERATIONS, [10 ** 3, 10 ** 4, 10 ** 5], [10, 50])
+    param_names = ["operation", "n_terms", "n_wires"]
+
+    timeout = 600
+    # simplification happens in place, so every timed call needs a fresh Hamiltonian
+    number = 1
+    repeat = (1, 5, 120)
+    warmup_time = 0
+    max_simplify_terms = 10 ** 4
+
+    def setup(self, operation, n_terms, n_wires):
+        if operation == "simplify" and n_terms > self.max_simplify_terms:
+            raise NotImplementedError("Simplification of this many terms exceeds the timeout.")
+        hyperparams = {"n_terms": n_terms, "n_wires": n_wires}
+        self.fn = prepare_operation(operation, hyperparams)
+
+    def time_operation(self, operation, n_terms, n_wires):
+        """Time the operation."""
+        self.fn()
+
+    def track_peak_operation_memory(self, operation, n_terms, n_wires):
+        """Track the peak memory allocated by the operation, without the memory of its operands,
+        which are built in setup."""
+        _, peak = peak_memory(self.fn)
+        return peak
+
+    track_peak_operation_memory.unit = "bytes"
+
+
+class PauliMemory:
+    """Track the memory of random Hamiltonians of 4-local Pauli words."""
+
+    params = ([10 ** 3, 10 ** 4, 10 ** 5], [10, 50])
+    param_names = ["n_terms", "n_wires"]
+
+    timeout = 300
+
+    def track_memory_per_term(self, n_terms, n_wires):
+        """Track the memory retained by a Hamiltonian divided by its number of terms."""
+        _, retained = retained_memory(random_hamiltonian, n_terms, n_wires)
+        return retained / n_terms
+
+    track_memory_per_term.unit = "bytes/term"
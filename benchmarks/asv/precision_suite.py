@@ -0,0 +1,62 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the precision per time of shot-based expectation values.
+"""
+from ..benchmark_functions.measurement import shared_result
+from ..benchmark_functions.precision import benchmark_estimator, estimator_hamiltonian
+
+# devices that sample measurement outcomes from shots
+SHOT_DEVICES = ["default.qubit", "lightning.qubit", "qiskit.aer", "qulacs.simulator"]
+
+
+class EstimatorPrecision:
+    """Benchmark repeated shot-based estimates of the expectation values of molecular and QAOA
+    Hamiltonians for different shot budgets, devices and grouping strategies. A lower product of
+    variance and time means that a given precision is reached faster."""
+
+    params = (["h2", "lih", "qaoa"], [100, 1000, 10000], SHOT_DEVICES, [False, True])
+    param_names = ["hamiltonian", "shots", "device", "optimize"]
+
+    timeout = 1200
+
+    def setup(self, hamiltonian, shots, device, optimize):
+        hyperparams = {
+            "hamiltonian": estimator_hamiltonian(hamiltonian),
+            "shots": shots,
+            "device": device,
+            "optimize": optimize,
+        }
+        # all metrics describe the same estimates, which differ in every run by the shot noise
+        self.result = shared_result(
+            self, (hamiltonian, shots, device, optimize), lambda: benchmark_estimator(hyperparams)
+        )
+
+    def track_std_error(self, hamiltonian, shots, device, optimize):
+        """Track the empirical standard error of the estimates."""
+        return self.result["std_error"]
+
+    track_std_error.unit = "energy"
+
+    def track_time_per_estimate(self, hamiltonian, shots, device, optimize):
+        """Track the wall time of an estimate."""
+        return self.result["time_per_estimate"]
+
+    track_time_per_estimate.unit = "seconds"
+
+    def track_variance_time(self, hamiltonian, shots, device, optimize):
+        """Track the variance of the estimates times the time of an estimate."""
+        return self.result["variance_time"]
+
+    track_variance_time.unit = "energy^2 seconds"
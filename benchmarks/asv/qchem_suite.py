@@ -0,0 +1,133 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that estimates the cost of building molecular Hamiltonians with the
+qchem package.
+"""
+import os
+import tempfile
+
+from ..benchmark_functions.chemistry import (
+    MOLECULES,
+    STAGES,
+    benchmark_qchem,
+    compute_integrals,
+    generate_excitations,
+    map_hamiltonian,
+    reduce_active_space,
+)
+from ..benchmark_functions.compat import qchem_available
+from ..benchmark_functions.measurement import with_adaptive_sampling, with_resource_tracking
+
+QCHEM_MISSING = "The qchem package with the file-based Hamiltonian construction is not installed."
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class QchemHamiltonian:
+    """Benchmark the stages of building the qubit Hamiltonian and UCCSD excitations of molecules
+    from fixed geometries. Every stage after the Hartree-Fock calculation starts from integrals
+    computed once in advance."""
+
+    params = (list(MOLECULES), STAGES)
+    param_names = ["molecule", "stage"]
+
+    timeout = 600
+    number = 1  # the Hartree-Fock calculation must not reuse earlier results
+    repeat = (1, 3, 300)
+
+    def setup_cache(self):
+        if not qchem_available():
+            return None
+
+        # asv runs the benchmarks in the working directory of setup_cache and removes it afterwards
+        outpath = "integrals"
+        os.mkdir(outpath)
+        return {molecule: compute_integrals(molecule, outpath) for molecule in MOLECULES}
+
+    def setup(self, hf_files, molecule, stage):
+        if hf_files is None:
+            raise NotImplementedError(QCHEM_MISSING)
+
+        self.hf_file = hf_files[molecule]
+        if stage == "integrals":
+            # a new directory for every sample, so that the calculation is not skipped
+            self.tmpdir = tempfile.TemporaryDirectory()
+        if stage in ["mapping", "excitations"]:
+            self.core, self.active = reduce_active_space(molecule, self.hf_file)
+
+    def teardown(self, hf_files, molecule, stage):
+        if stage == "integrals":
+            self.tmpdir.cleanup()
+
+    def _run_stage(self, molecule, stage):
+        if stage == "integrals":
+            compute_integrals(molecule, self.tmpdir.name)
+        elif stage == "active_space":
+            reduce_active_space(molecule, self.hf_file)
+        elif stage == "mapping":
+            map_hamiltonian(self.hf_file, self.core, self.active)
+        elif stage == "excitations":
+            generate_excitations(molecule, self.hf_file, self.active)
+
+    def time_stage(self, hf_files, molecule, stage):
+        """Time a stage of the Hamiltonian construction."""
+        self._run_stage(molecule, stage)
+
+    def peakmem_stage(self, hf_files, molecule, stage):
+        """Benchmark the peak memory usage of a stage of the Hamiltonian construction."""
+        self._run_stage(molecule, stage)
+
+
+class QchemHamiltonianSize:
+    """Track the size of the Hamiltonians and excitations of molecules, and the total time to
+    build them."""
+
+    params = list(MOLECULES)
+    param_names = ["molecule"]
+
+    timeout = 1200
+
+    def setup_cache(self):
+        if not qchem_available():
+            return None
+        return {molecule: benchmark_qchem({"molecule": molecule}) for molecule in MOLECULES}
+
+    def setup(self, results, molecule):
+        if results is None:
+            raise NotImplementedError(QCHEM_MISSING)
+
+    def track_n_terms(self, results, molecule):
+        """Track the number of terms of the qubit Hamiltonian."""
+        return results[molecule]["n_terms"]
+
+    track_n_terms.unit = "terms"
+
+    def track_n_qubits(self, results, molecule):
+        """Track the number of qubits of the qubit Hamiltonian."""
+        return results[molecule]["n_qubits"]
+
+    track_n_qubits.unit = "qubits"
+
+    def track_n_excitations(self, results, molecule):
+        """Track the number of single and double excitations of the UCCSD ansatz."""
+        return results[molecule]["n_excitations"]
+
+    track_n_excitations.unit = "excitations"
+
+    def track_total_time(self, results, molecule):
+        """Track the time of all stages of the Hamiltonian construction."""
+        return sum(results[molecule][stage] for stage in STAGES)
+
+    track_total_time.unit = "seconds"
@@ -0,0 +1,77 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that replays captured circuits on different devices.
+"""
+import os
+
+from ..benchmark_functions.circuit import benchmark_circuit
+from ..benchmark_functions.gradient import benchmark_gradient
+from ..benchmark_functions.measurement import (
+    wall_time,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
+from ..benchmark_functions.replay import benchmark_replay, capture_tapes
+from .device_suite import DEVICES
+
+# environment variable pointing to a trace file captured from a production workload
+TRACE_VARIABLE = "PL_BENCHMARK_TRACE"
+
+
+@with_adaptive_sampling
+@with_resource_tracking
+class Replay:
+    """Benchmark the replay of captured circuits on different devices.
+
+    The trace is read from the file given by the PL_BENCHMARK_TRACE environment variable. If it is
+    not set, a trace is captured from evaluations and gradients of the circuit families."""
+
+    params = (DEVICES, [False, True])
+    param_names = ["device", "gradient"]
+
+    timeout = 600
+
+    def setup_cache(self):
+        path = os.environ.get(TRACE_VARIABLE)
+        if path:
+            return path
+
+        # asv runs the benchmarks in the working directory of setup_cache and removes it afterwards
+        path = "trace.jsonl.gz"
+        with capture_tapes(path, diff_method="parameter-shift"):
+            for template in ["basic_entangler", "strongly_entangling", "qft", "long_range"]:
+                hyperparams = {"n_wires": 5, "n_layers": 3, "template": template}
+                benchmark_circuit(dict(hyperparams))
+                hyperparams["diff_method"] = "parameter-shift"
+                benchmark_gradient(hyperparams)
+        return path
+
+    def time_replay(self, path, dev, gradient):
+        """Time the replay of all captured circuits."""
+        hyperparams = {"path": path, "device": dev, "gradient": gradient}
+        benchmark_replay(hyperparams)
+
+    def peakmem_replay(self, path, dev, gradient):
+        """Benchmark the peak memory usage of the replay of all captured circuits."""
+        hyperparams = {"path": path, "device": dev, "gradient": gradient}
+        benchmark_replay(hyperparams)
+
+    def track_time_per_tape(self, path, dev, gradient):
+        """Track the replay time divided by the number of captured circuits."""
+        hyperparams = {"path": path, "device": dev, "gradient": gradient}
+        n_tapes, elapsed = wall_time(benchmark_replay, hyperparams)
+        return elapsed / n_tapes
+
+    track_time_per_tape.unit = "seconds"
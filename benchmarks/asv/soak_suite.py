@@ -0,0 +1,75 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suite that runs the core workloads for many iterations to detect memory leaks
+and latency drift. The suite only runs if the PL_BENCHMARK_SOAK environment variable is set.
+"""
+import os
+
+from ..benchmark_functions.measurement import SOAK_VARIABLE, shared_result, soak
+from ..benchmark_functions.soak import SOAK_WORKLOADS, soak_workload
+
+
+class Soak:
+    """Benchmark the memory growth and latency drift of the core workloads over many iterations
+    on long-lived QNodes, parameters and optimizers.
+
+    The number of iterations is given by the PL_BENCHMARK_SOAK environment variable, like
+    ``PL_BENCHMARK_SOAK=10000``. One soak test runs per workload and interface, in the fresh
+    process of the first metric, and all metrics report fields of it."""
+
+    params = (SOAK_WORKLOADS, ["autograd", "tf", "torch", "jax"])
+    param_names = ["workload", "interface"]
+
+    timeout = 7200
+
+    # the machine learning workload trains on all samples in every iteration
+    n_samples = 4
+    n_features = 2
+
+    def setup(self, workload, interface):
+        n_iterations = os.environ.get(SOAK_VARIABLE, "").strip()
+        if not n_iterations:
+            raise NotImplementedError("Soak tests are only run if PL_BENCHMARK_SOAK is set.")
+        if interface == "jax" and workload in ["optimization", "machine_learning"]:
+            raise NotImplementedError("The workload has no jax version.")
+
+        self.result = shared_result(
+            self, (workload, interface), lambda: self._soak(workload, interface, int(n_iterations))
+        )
+
+    def _soak(self, workload, interface, n_iterations):
+        hyperparams = {"interface": interface}
+        if workload == "machine_learning":
+            hyperparams.update({"n_samples": self.n_samples, "n_features": self.n_features})
+        return soak(soak_workload(workload, hyperparams), n_iterations)
+
+    def track_rss_growth(self, workload, interface):
+        """Track the growth of the resident set size per iteration."""
+        return self.result["rss_growth"]
+
+    track_rss_growth.unit = "bytes per iteration"
+
+    def track_traced_growth(self, workload, interface):
+        """Track the growth of the memory traced by tracemalloc per iteration."""
+        return self.result["traced_growth"]
+
+    track_traced_growth.unit = "bytes per iteration"
+
+    def track_latency_drift(self, workload, interface):
+        """Track the relative change of the latency of an iteration between the start and the
+        end of the soak test."""
+        return self.result["latency_drift"]
+
+    track_latency_drift.unit = "relative change"
@@ -0,0 +1,92 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Define asv benchmark suites generated from the declarative workload specifications in
+`benchmarks/workloads` and the directories listed in the PL_BENCHMARK_WORKLOADS environment variable.
+"""
+import hashlib
+import json
+
+from ..benchmark_functions.measurement import (
+    peak_memory,
+    with_adaptive_sampling,
+    with_resource_tracking,
+)
+from ..benchmark_functions.workloads import load_workload_specs, run_workload
+
+
+def _time_workload(self, *param_values):
+    """Time the workload."""
+    run_workload(self.spec, param_values)
+
+
+def _peakmem_workload(self, *param_values):
+    """Benchmark the peak memory usage of the workload."""
+    run_workload(self.spec, param_values)
+
+
+def _track_peak_workload_memory(self, *param_values):
+    """Track the peak memory allocated by the workload."""
+    _, peak = peak_memory(run_workload, self.spec, param_values)
+    return peak
+
+
+# maps each metric of a specification to the name and body of the generated benchmark method
+_METRIC_METHODS = {
+    "time": ("time_workload", _time_workload, None),
+    "peakmem": ("peakmem_workload", _peakmem_workload, None),
+    "peak_workload_memory": ("track_peak_workload_memory", _track_peak_workload_memory, "bytes"),
+}
+
+
+def make_workload_class(spec):
+    """Creates an asv benchmark class from a workload specification.
+
+    Args:
+            spec (dict): validated workload specification
+    """
+    # changing the specification invalidates earlier results of the generated benchmarks
+    spec_version = hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+    attributes = {
+        "__doc__": spec.get("description", "Workload generated from a specification."),
+        "spec": spec,
+    }
+
+    grid = spec.get("params", {})
+    if grid:
+        attributes["params"] = [list(values) for values in grid.values()]
+        attributes["param_names"] = list(grid)
+
+    for key, value in spec.get("policy", {}).items():
+        attributes[key] = tuple(value) if isinstance(value, list) else value
+
+    for metric in spec.get("metrics", ["time"]):
+        name, body, unit = _METRIC_METHODS[metric]
+
+        def method(self, *param_values, _body=body):
+            return _body(self, *param_values)
+
+        method.__name__ = name
+        method.__doc__ = body.__doc__
+        method.version = spec_version
+        if unit is not None:
+            method.unit = unit
+        attributes[name] = method
+
+    return with_adaptive_sampling(with_resource_tracking(type(spec["name"], (), attributes)))
+
+
+for _spec in load_workload_specs():
+    globals()[_spec["name"]] = make_workload_class(_spec)
@@ -0,0 +1,168 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persistent cache for deterministic objects that are expensive to build but not part of a measured
+workload, like Hamiltonians, graphs, datasets and excitations.
+
+Every entry is stored under the hash of the name of the artifact, its inputs and the source code
+of PennyLane and the versions of NumPy and Python. An entry is therefore never shared between
+commits that change PennyLane, while repeated runs and parameter combinations of one commit
+reuse it. When the cache grows beyond its size limit, the least recently used entries are evicted.
+"""
+import functools
+import glob
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+
+import numpy as np
+
+import pennylane as qml
+
+# environment variable pointing to the cache directory
+CACHE_VARIABLE = "PL_BENCHMARK_CACHE"
+
+# environment variable holding the size limit of the cache in megabytes
+CACHE_SIZE_VARIABLE = "PL_BENCHMARK_CACHE_SIZE"
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pennylane-benchmarks")
+DEFAULT_CACHE_SIZE = 1024
+
+
+def cache_dir():
+    """Returns the cache directory set by the PL_BENCHMARK_CACHE environment variable, or the
+    default directory."""
+    return os.environ.get(CACHE_VARIABLE) or DEFAULT_CACHE_DIR
+
+
+@functools.lru_cache()
+def library_fingerprint():
+    """Returns a hash of the source code of the installed PennyLane package and the versions of
+    NumPy and Python. Development versions of PennyLane keep their version number over many
+    commits, so the version alone does not identify the code."""
+    digest = hashlib.sha256()
+    digest.update(qml.__version__.encode())
+    digest.update(np.__version__.encode())
+    digest.update(sys.version.encode())
+
+    root = os.path.dirname(qml.__file__)
+    for path in sorted(glob.glob(os.path.join(root, "**", "*.py"), recursive=True)):
+        digest.update(os.path.relpath(path, root).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def artifact_key(name, inputs):
+    """Returns the key of an artifact.
+
+    Args:
+            name (str): name of the artifact
+            inputs (list): JSON-serializable inputs the artifact is built from
+    """
+    content = json.dumps([name, inputs, library_fingerprint()], sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def evict(max_bytes):
+    """Deletes the least recently used entries until the cache is at most ``max_bytes`` large.
+
+    Args:
+            max_bytes (int): size limit in bytes
+    """
+    entries = []
+    for path in glob.glob(os.path.join(cache_dir(), "*", "*.pkl")):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def cached_artifact(name, inputs, builder):
+    """Returns an artifact from the cache, or builds and stores it.
+
+    Args:
+            name (str): name of the artifact
+            inputs (list): JSON-serializable inputs that fully determine the artifact
+            builder (callable): function without arguments that builds the artifact
+
+    Returns:
+            object: the artifact
+    """
+    key = artifact_key(name, inputs)
+    path = os.path.join(cache_dir(), key[:2], key + ".pkl")
+
+    try:
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+        # the modification time orders the entries for eviction
+        os.utime(path)
+        return artifact
+    except FileNotFoundError:
+        pass
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # corrupt or unreadable entries are rebuilt
+        pass
+
+    artifact = builder()
+
+    try:
+        data = pickle.dumps(artifact)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return artifact
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # write to a temporary file first, so that concurrent runs never read a partial entry
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    max_megabytes = float(os.environ.get(CACHE_SIZE_VARIABLE) or DEFAULT_CACHE_SIZE)
+    evict(int(max_megabytes * 1024 ** 2))
+
+    return artifact
+
+
+def cached(name):
+    """Decorator that caches the results of a function of JSON-serializable arguments with
+    `cached_artifact`.
+
+    Args:
+            name (str): name of the artifact
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args):
+            return cached_artifact(name, list(args), lambda: fn(*args))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,102 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for repeated evaluations of the same QNode, with and without execution caching.
+"""
+import numpy as np
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from .compat import cached_device_and_qnode_kwargs
+from .default_settings import _core_defaults
+
+MODES = ["fresh", "reused", "cached"]
+
+
+def _parameter_sequence(params, n_calls, hit_ratio, seed=42):
+    """Generates a sequence of parameters in which a fraction ``hit_ratio`` of the entries repeats
+    an earlier entry exactly, and all other entries slightly perturb the initial parameters."""
+    rng = np.random.default_rng(seed)
+    seen = []
+    sequence = []
+    for _ in range(n_calls):
+        if seen and rng.random() < hit_ratio:
+            p = seen[rng.integers(len(seen))]
+        else:
+            p = params + 1e-3 * rng.standard_normal(np.shape(params))
+            seen.append(p)
+        sequence.append(pnp.array(p, requires_grad=True))
+    return sequence
+
+
+def benchmark_qnode_reuse(hyperparams={}, mode="reused", n_calls=100, hit_ratio=0.0):
+    """Evaluates a circuit many times with repeated or slightly changed parameters.
+
+    Unless otherwise specified by the hyperparameters, the circuit consists of 6 layers of `BasicEntanglerLayers`
+    run on 4 qubits, followed by measuring the Pauli-Z observable of the first wire, and is run using
+    a 'default.qubit' device and the autograd interface.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_circuit`.
+                    The 'interface' hyperparameter is ignored.
+
+            mode (str): One of
+
+                    * 'fresh': a new QNode is created for every call,
+
+                    * 'reused': the same QNode is evaluated in every call,
+
+                    * 'cached': the same QNode is evaluated in every call and execution results are cached.
+
+            n_calls (int): Number of QNode evaluations.
+
+            hit_ratio (float): Fraction of the calls that repeat the parameters of an earlier call.
+
+    Returns:
+            tuple: the last evaluated QNode and the execution cache, or None if no cache was used
+    """
+    if mode not in MODES:
+        raise ValueError("Unknown mode {}; choose one of {}.".format(mode, MODES))
+
+    hyperparams["interface"] = "autograd"
+    qnode_kwargs = {}
+    cache = None
+
+    if mode == "cached":
+        device = hyperparams.get("device", "default.qubit")
+        if isinstance(device, str):
+            n_wires = hyperparams.get("n_wires", 4)
+            hyperparams["device"], qnode_kwargs, cache = cached_device_and_qnode_kwargs(
+                device, n_wires, cachesize=n_calls
+            )
+
+    device, diff_method, interface, params, template, measurement = _core_defaults(hyperparams)
+
+    def circuit_fn(params_):
+        template(params_)
+        measurement.queue()
+        return measurement
+
+    circuit = None
+
+    for p in _parameter_sequence(params, n_calls, hit_ratio):
+
+        if circuit is None or mode == "fresh":
+            circuit = qml.QNode(
+                circuit_fn, device, interface=interface, diff_method=diff_method, **qnode_kwargs
+            )
+
+        circuit(p)
+
+    return circuit, cache
@@ -0,0 +1,158 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the construction of molecular Hamiltonians and UCCSD excitations with the
+qchem package, using PySCF as local backend.
+
+The Hartree-Fock calculation and the mapping use the file-based API of older qchem versions
+through `compat`, and raise NotImplementedError if it is not installed.
+"""
+import tempfile
+import time
+
+from .compat import qchem_meanfield, qchem_molecular_data, qchem_package, qchem_qubit_hamiltonian
+from .default_settings import _qchem_defaults
+
+# name: (symbols, coordinates in Bohr, active electrons, active orbitals), where None keeps all
+# electrons or orbitals active
+MOLECULES = {
+    "h2": (["H", "H"], [0.0, 0.0, -0.6614, 0.0, 0.0, 0.6614], None, None),
+    "lih": (["Li", "H"], [0.0, 0.0, 0.0, 0.0, 0.0, 3.0236], 2, 5),
+    "beh2": (["Be", "H", "H"], [0.0, 0.0, 0.0, 0.0, 0.0, -2.5133, 0.0, 0.0, 2.5133], 4, 6),
+    "h2o": (["O", "H", "H"], [0.0, 0.0, 0.0, 0.0, 1.4304, 1.1071, 0.0, -1.4304, 1.1071], 4, 4),
+}
+
+STAGES = ["integrals", "active_space", "mapping", "excitations"]
+
+
+def compute_integrals(molecule, outpath, basis="sto-3g"):
+    """Runs the Hartree-Fock calculation of a molecule and stores the electronic integrals.
+
+    The calculation reuses the integrals of an earlier calculation stored in the same directory,
+    so the directory must be new for the calculation to be repeated.
+
+    Args:
+            molecule (str): name of the molecule in ``MOLECULES``
+            outpath (str): directory in which the integrals are stored, which has to outlive the
+                    use of the returned path
+            basis (str): atomic basis set
+
+    Returns:
+            str: path to the file with the integrals, without extension
+    """
+    symbols, coordinates, _, _ = MOLECULES[molecule]
+    return qchem_meanfield(symbols, coordinates, molecule, basis, outpath)
+
+
+def reduce_active_space(molecule, hf_file):
+    """Splits the orbitals of a molecule into core and active orbitals.
+
+    Args:
+            molecule (str): name of the molecule in ``MOLECULES``
+            hf_file (str): path to the file with the integrals
+
+    Returns:
+            tuple[list, list]: the indices of the core and active orbitals
+    """
+    _, _, active_electrons, active_orbitals = MOLECULES[molecule]
+    data = qchem_molecular_data(hf_file)
+    return qchem_package().active_space(
+        data.n_electrons,
+        data.n_orbitals,
+        active_electrons=active_electrons,
+        active_orbitals=active_orbitals,
+    )
+
+
+def map_hamiltonian(hf_file, core, active, mapping="jordan_wigner"):
+    """Maps the electronic Hamiltonian in the active space to a qubit Hamiltonian.
+
+    Args:
+            hf_file (str): path to the file with the integrals
+            core (list): indices of the core orbitals
+            active (list): indices of the active orbitals
+            mapping (str): fermion-to-qubit mapping
+
+    Returns:
+            ~.Hamiltonian: the qubit Hamiltonian
+    """
+    return qchem_qubit_hamiltonian(hf_file, mapping, core, active)
+
+
+def generate_excitations(molecule, hf_file, active):
+    """Generates the single and double excitations of the active space, and the wires on which
+    `UCCSD` applies them.
+
+    Args:
+            molecule (str): name of the molecule in ``MOLECULES``
+            hf_file (str): path to the file with the integrals
+            active (list): indices of the active orbitals
+
+    Returns:
+            tuple[list, list]: the ``s_wires`` and ``d_wires`` arguments of `UCCSD`
+    """
+    active_electrons = MOLECULES[molecule][2]
+    if active_electrons is None:
+        active_electrons = qchem_molecular_data(hf_file).n_electrons
+
+    qchem = qchem_package()
+    singles, doubles = qchem.excitations(active_electrons, 2 * len(active))
+    return qchem.excitations_to_wires(singles, doubles)
+
+
+def benchmark_qchem(hyperparams={}):
+    """Builds the qubit Hamiltonian and the UCCSD excitations of a molecule from its geometry, and
+    times every stage.
+
+    Args:
+    hyperparams (dict): hyperparameters to configure this benchmark
+
+            * 'molecule': name of the molecule in ``MOLECULES``. Defaults to 'h2'.
+
+            * 'basis': atomic basis set. Defaults to 'sto-3g'.
+
+            * 'mapping': fermion-to-qubit mapping. Defaults to 'jordan_wigner'.
+
+            * 'outpath': directory in which the integrals are stored. Defaults to a temporary
+              directory.
+
+    Returns:
+            dict: the wall time in seconds of every stage in ``STAGES``, the number of terms
+            ('n_terms') and qubits ('n_qubits') of the Hamiltonian, and the number of
+            excitations ('n_excitations')
+    """
+    molecule, basis, mapping, outpath = _qchem_defaults(hyperparams)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        start = time.perf_counter()
+        hf_file = compute_integrals(molecule, outpath or tmpdir, basis)
+        results["integrals"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        core, active = reduce_active_space(molecule, hf_file)
+        results["active_space"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hamiltonian = map_hamiltonian(hf_file, core, active, mapping)
+        results["mapping"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        s_wires, d_wires = generate_excitations(molecule, hf_file, active)
+        results["excitations"] = time.perf_counter() - start
+
+    results["n_terms"] = len(hamiltonian.ops)
+    results["n_qubits"] = 2 * len(active)
+    results["n_excitations"] = len(s_wires) + len(d_wires)
+    return results
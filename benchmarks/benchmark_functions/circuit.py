@@ -43,30 +43,58 @@ def benchmark_circuit(hyperparams={}, num_repeats=1):
                     * 'interface': name of the interface to use
 
                     * 'template': Template to use. The template must take the trainable parameters as its only argument.
+                      Alternatively, the name of a circuit family in `circuit_families.CIRCUIT_FAMILIES`.
 
                     * 'params': Numpy array of trainable parameters that is fed into the template.
 
                     * 'measurement': measurement function like `qml.expval(qml.PauliZ(0)))`
 
+                    * 'reuse_qnode': If True, the QNode is created once and evaluated in every repetition.
+                      Otherwise a fresh QNode is created in every repetition. Defaults to False.
+
             num_repeats (int): How often the same circuit is evaluated in a for loop. Default is 1.
     """
+    hyperparams.setdefault("reuse_qnode", False)
+    circuit = prepare_circuit(hyperparams)
+
+    for _ in range(num_repeats):
+        circuit()
+
+
+def prepare_circuit(hyperparams={}):
+    """Constructs the device of `benchmark_circuit` and converts the parameters to the tensor type
+    of the interface, so that only the evaluation of the circuit is timed.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_circuit`.
+                    Unlike there, 'reuse_qnode' defaults to True.
+
+    Returns:
+            callable: function without arguments that evaluates the circuit, creating a fresh QNode
+            in every call unless 'reuse_qnode' is True
+    """
+    reuse_qnode = hyperparams.pop("reuse_qnode", True)
 
     device, diff_method, interface, params, template, measurement = _core_defaults(hyperparams)
 
-    for _ in range(num_repeats):
+    def circuit_fn(params_):
+        template(params_)
+        measurement.queue()
+        return measurement
+
+    # turn parameters into tensor from interface
+    if interface == "autograd":
+        params = pnp.array(params, requires_grad=True)
+    elif interface == "tf":
+        params = tf.Variable(params)
+    elif interface == "torch":
+        params = torch.tensor(params)
+
+    def make_qnode():
+        return qml.QNode(circuit_fn, device, interface=interface, diff_method=diff_method)
+
+    if reuse_qnode:
+        circuit = make_qnode()
+        return lambda: circuit(params)
 
-        @qml.qnode(device, interface=interface, diff_method=diff_method)
-        def circuit(params_):
-            template(params_)
-            measurement.queue()
-            return measurement
-
-        # turn parameters into tensor from interface
-        if interface == "autograd":
-            params = pnp.array(params, requires_grad=True)
-        elif interface == "tf":
-            params = tf.Variable(params)
-        elif interface == "torch":
-            params = torch.tensor(params)
-
-        circuit(params)
+    return lambda: make_qnode()(params)
@@ -0,0 +1,186 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Library of parametrized circuit families that can be selected by name through the 'template'
+hyperparameter of the core benchmark functions.
+"""
+import numpy as np
+
+import pennylane as qml
+from pennylane.templates import BasicEntanglerLayers, StronglyEntanglingLayers
+from .compat import device as create_device
+
+# seed fixing the gate structure of the random brickwork family
+BRICKWORK_SEED = 42
+
+
+def basic_entangler(params, wires):
+    """Layers of single-qubit RX rotations followed by a ring of CNOTs."""
+    BasicEntanglerLayers(params, wires=wires)
+
+
+def strongly_entangling(params, wires):
+    """Layers of general single-qubit rotations followed by CNOTs of increasing range."""
+    StronglyEntanglingLayers(params, wires=wires)
+
+
+def qft(params, wires):
+    """Layers of RY rotations, each followed by a quantum Fourier transform decomposed into
+    Hadamard, controlled phase shift and SWAP gates."""
+    n_wires = len(wires)
+    for layer in params:
+        for i in range(n_wires):
+            qml.RY(layer[i], wires=wires[i])
+        for i in range(n_wires):
+            qml.Hadamard(wires=wires[i])
+            for k, j in enumerate(range(i + 1, n_wires), start=2):
+                qml.ControlledPhaseShift(np.pi / 2 ** (k - 1), wires=[wires[j], wires[i]])
+        for i in range(n_wires // 2):
+            qml.SWAP(wires=[wires[i], wires[n_wires - i - 1]])
+
+
+def brickwork(params, wires):
+    """Brickwork of randomly chosen single-qubit rotations and alternating nearest-neighbour CZ
+    gates. The gate choice is drawn from a generator with a fixed seed, so that the structure only
+    depends on the number of wires and layers."""
+    rng = np.random.default_rng(BRICKWORK_SEED)
+    rotations = [qml.RX, qml.RY, qml.RZ]
+    n_wires = len(wires)
+    for l, layer in enumerate(params):
+        choice = rng.integers(len(rotations), size=n_wires)
+        for i in range(n_wires):
+            rotations[choice[i]](layer[i], wires=wires[i])
+        for i in range(l % 2, n_wires - 1, 2):
+            qml.CZ(wires=[wires[i], wires[i + 1]])
+
+
+def single_qubit_heavy(params, wires):
+    """Deep layers of RX, RY and RZ rotations on every wire, with a single CNOT per layer."""
+    n_wires = len(wires)
+    for l, layer in enumerate(params):
+        for i in range(n_wires):
+            qml.RX(layer[i, 0], wires=wires[i])
+            qml.RY(layer[i, 1], wires=wires[i])
+            qml.RZ(layer[i, 2], wires=wires[i])
+        if n_wires > 1:
+            i = l % (n_wires - 1)
+            qml.CNOT(wires=[wires[i], wires[i + 1]])
+
+
+def long_range(params, wires):
+    """Layers of RY rotations followed by controlled rotations between wires that are half the
+    register apart."""
+    n_wires = len(wires)
+    for layer in params:
+        for i in range(n_wires):
+            qml.RY(layer[i, 0], wires=wires[i])
+        if n_wires > 1:
+            for i in range(n_wires):
+                qml.CRZ(layer[i, 1], wires=[wires[i], wires[(i + n_wires // 2) % n_wires]])
+
+
+# Maps the name of each family to the function applying the circuit and a function
+# computing the shape of its trainable parameters from the number of layers and wires.
+CIRCUIT_FAMILIES = {
+    "basic_entangler": (basic_entangler, lambda n_layers, n_wires: (n_layers, n_wires)),
+    "strongly_entangling": (strongly_entangling, lambda n_layers, n_wires: (n_layers, n_wires, 3)),
+    "qft": (qft, lambda n_layers, n_wires: (n_layers, n_wires)),
+    "brickwork": (brickwork, lambda n_layers, n_wires: (n_layers, n_wires)),
+    "single_qubit_heavy": (single_qubit_heavy, lambda n_layers, n_wires: (n_layers, n_wires, 3)),
+    "long_range": (long_range, lambda n_layers, n_wires: (n_layers, n_wires, 2)),
+}
+
+
+def circuit_family(name, n_wires, n_layers):
+    """Returns a template of the named circuit family that only takes the parameters as argument,
+    together with a random parameter array of the correct shape.
+
+    Args:
+            name (str): name of the circuit family, one of the keys of ``CIRCUIT_FAMILIES``
+            n_wires (int): number of wires the circuit acts on
+            n_layers (int): number of layers of the circuit
+    """
+    if name not in CIRCUIT_FAMILIES:
+        raise ValueError(
+            "Unknown circuit family {}; choose one of {}.".format(name, list(CIRCUIT_FAMILIES))
+        )
+
+    family, shape = CIRCUIT_FAMILIES[name]
+
+    def Template(params_):
+        family(params_, wires=range(n_wires))
+
+    params = np.random.random(size=shape(n_layers, n_wires))
+
+    return Template, params
+
+
+def circuit_depth(operations):
+    """Computes the depth of a sequence of operations by greedily placing each operation in the
+    first layer after the last operation on any of its wires.
+
+    Args:
+            operations (list[~.Operation]): operations of the circuit
+    """
+    last_layer = {}
+    depth = 0
+    for op in operations:
+        layer = max((last_layer.get(w, 0) for w in op.wires), default=0) + 1
+        for w in op.wires:
+            last_layer[w] = layer
+        depth = max(depth, layer)
+    return depth
+
+
+def circuit_family_metadata(name, n_wires, n_layers, device="default.qubit"):
+    """Records the named circuit family, decomposes it into the gates a device applies natively
+    and returns its gate count and depth.
+
+    Args:
+            name (str): name of the circuit family, one of the keys of ``CIRCUIT_FAMILIES``
+            n_wires (int): number of wires the circuit acts on
+            n_layers (int): number of layers of the circuit
+            device (~.Device or str): device whose native gates are kept, or valid device name
+
+    Returns:
+            dict: dictionary with the keys 'gate_count', 'two_qubit_gate_count' and 'depth'
+    """
+    if isinstance(device, str):
+        device = create_device(device, wires=n_wires)
+
+    template, params = circuit_family(name, n_wires, n_layers)
+
+    with qml.tape.QuantumTape() as tape:
+        template(params)
+
+    operations = tape.expand(
+        depth=10, stop_at=lambda obj: device.supports_operation(obj.name)
+    ).operations
+    return operation_metadata(operations)
+
+
+def operation_metadata(operations):
+    """Returns the gate count and depth of a sequence of primitive operations.
+
+    Args:
+            operations (list[~.Operation]): operations of the circuit
+
+    Returns:
+            dict: dictionary with the keys 'gate_count', 'two_qubit_gate_count' and 'depth'
+    """
+    return {
+        "gate_count": len(operations),
+        "two_qubit_gate_count": sum(len(op.wires) == 2 for op in operations),
+        "depth": circuit_depth(operations),
+    }
@@ -0,0 +1,395 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compatibility layer that picks the right PennyLane API for the installed version, so that the
+same benchmark functions can run over the history of PennyLane commits.
+
+All version-dependent code of the benchmark functions should go through this module.
+"""
+import inspect
+
+import pennylane as qml
+from packaging import version
+
+PL_VERSION = version.parse(qml.__version__)
+
+# version from which the QNode accepts execution options like ``cache``, Hamiltonians can be
+# measured with `qml.expval` and `qml.ExpvalCost` is no longer needed
+NEW_EXECUTION_VERSION = version.parse("0.17")
+
+# version from which devices accept ``shots=None`` for analytic execution
+ANALYTIC_SHOTS_VERSION = version.parse("0.15")
+
+try:
+    from pennylane.templates.decorator import template as _template_decorator
+except ImportError:
+    _template_decorator = None
+
+try:
+    from pennylane.templates.subroutines import UCCSD
+except ImportError:
+    UCCSD = qml.UCCSD
+
+try:
+    from pennylane.operation import Tensor as _Tensor
+except ImportError:
+    _Tensor = None
+
+
+def new_execution_pipeline():
+    """Returns whether the installed PennyLane version uses the new execution pipeline."""
+    return PL_VERSION > NEW_EXECUTION_VERSION
+
+
+def template(func):
+    """Decorates a function queuing operations as a template. The ``template`` decorator was
+    required by older versions and removed later, in which case the function is returned as is.
+
+    Args:
+            func (callable): function queuing operations
+    """
+    if _template_decorator is None:
+        return func
+    return _template_decorator(func)
+
+
+def device(name, wires, **kwargs):
+    """Creates a device, translating the arguments to those accepted by the installed version.
+
+    Args:
+            name (str): name of the device
+            wires (int or Iterable): wires of the device
+            **kwargs: further keyword arguments passed to the device. ``shots=None`` requests
+                    analytic execution. If ``shots`` is not given, the device default is used.
+    """
+    if name == "cirq.pasqal":
+        kwargs.setdefault("control_radius", 1.5)
+
+    if "shots" in kwargs and kwargs["shots"] is None and PL_VERSION < ANALYTIC_SHOTS_VERSION:
+        del kwargs["shots"]
+        kwargs["analytic"] = True
+
+    return qml.device(name, wires=wires, **kwargs)
+
+
+def is_analytic(dev):
+    """Returns whether a device computes exact expectation values.
+
+    Args:
+            dev (~.Device): device
+    """
+    return getattr(dev, "analytic", dev.shots is None)
+
+
+def cached_device_and_qnode_kwargs(name, wires, cachesize):
+    """Returns a device and keyword arguments for QNodes that together cache executions.
+
+    Newer versions cache executions in a mapping passed to the QNode, older versions cache them
+    on the device.
+
+    Args:
+            name (str): name of the device
+            wires (int or Iterable): wires of the device
+            cachesize (int): maximum number of cached executions for older versions
+
+    Returns:
+            tuple: the device, keyword arguments for the QNode, and the cache mapping, which is
+            None for older versions
+    """
+    if new_execution_pipeline():
+        cache = {}
+        return device(name, wires), {"cache": cache}, cache
+
+    return device(name, wires, cache=cachesize), {}, None
+
+
+def expval_cost(ansatz, hamiltonian, dev, interface="autograd", diff_method="best", optimize=False):
+    """Returns a cost function that evaluates the expectation value of a Hamiltonian for an ansatz.
+
+    Newer versions measure the Hamiltonian in a single QNode, and group its terms if ``optimize``
+    is True. Older versions use `qml.ExpvalCost`.
+
+    Args:
+            ansatz (callable): ansatz taking the parameters as first and the wires as keyword argument
+            hamiltonian (~.Hamiltonian): Hamiltonian to measure
+            dev (~.Device): device on which the circuits are run
+            interface (str): name of the interface to use
+            diff_method (str): name of the differentiation method
+            optimize (bool): whether to measure qubit-wise commuting terms together
+    """
+    if new_execution_pipeline():
+        if optimize:
+            hamiltonian.compute_grouping()
+
+        @qml.qnode(dev, interface=interface, diff_method=diff_method)
+        def cost_fn(weights):
+            ansatz(weights, wires=dev.wires)
+            return qml.expval(hamiltonian)
+
+        return cost_fn
+
+    return qml.ExpvalCost(
+        ansatz, hamiltonian, dev, interface=interface, diff_method=diff_method, optimize=optimize
+    )
+
+
+def metric_tensor(qnode):
+    """Returns a function that computes the metric tensor of a QNode for given parameters.
+
+    Args:
+            qnode (~.QNode): QNode, or cost function created by `expval_cost`
+    """
+    if new_execution_pipeline():
+        return qml.metric_tensor(qnode)
+    return qnode.metric_tensor
+
+
+def reset_tape_parameters(tape):
+    """Extracts all parameters of a tape and sets them again.
+
+    Args:
+            tape (~.QuantumTape): tape
+
+    Raises:
+            NotImplementedError: if the installed version cannot set the parameters of a tape in
+                    place
+    """
+    for name in ["get_parameters", "set_parameters"]:
+        method = getattr(tape, name, None)
+        if method is None or "trainable_only" not in inspect.signature(method).parameters:
+            raise NotImplementedError(
+                "QuantumTape.{} with trainable_only is not available in this version.".format(name)
+            )
+
+    tape.set_parameters(tape.get_parameters(trainable_only=False), trainable_only=False)
+
+
+def apply_operations(dev, operations):
+    """Resets a device and applies operations to it directly, without a tape or QNode.
+
+    Args:
+            dev (~.Device): device
+            operations (list[~.Operation]): operations to apply
+
+    Raises:
+            NotImplementedError: if the device does not apply operations one by one, like the
+                    devices of newer versions that only execute whole circuits
+    """
+    if not callable(getattr(dev, "reset", None)) or not callable(getattr(dev, "apply", None)):
+        raise NotImplementedError("The device does not support applying operations directly.")
+
+    dev.reset()
+    dev.apply(operations)
+
+
+def inverse(op):
+    """Inverts an operation that has just been queued. Older versions invert it in place with
+    ``inv``, newer versions, which removed ``inv``, replace it in the queue by `qml.adjoint`.
+
+    Args:
+            op (~.Operation): operation
+
+    Returns:
+            ~.Operation: the inverted operation
+    """
+    if hasattr(op, "inv"):
+        return op.inv()
+    return qml.adjoint(op)
+
+
+def qnode_tape(qnode):
+    """Returns the tape of the last evaluation of a QNode, which older versions store as ``qtape``.
+
+    Args:
+            qnode (~.QNode): QNode that has been evaluated
+    """
+    tape = getattr(qnode, "tape", None)
+    if tape is None:
+        tape = qnode.qtape
+    return tape
+
+
+def tensor_product(factors):
+    """Returns the tensor product of observables, which is a `Tensor` in older versions and an
+    operator product in newer versions that removed `Tensor`.
+
+    Args:
+            factors (list[~.Observable]): observables on distinct wires
+    """
+    if _Tensor is None:
+        return qml.prod(*factors)
+    return _Tensor(*factors)
+
+
+def hamiltonian_matrix(hamiltonian, wires):
+    """Returns the dense matrix of a Hamiltonian.
+
+    Args:
+            hamiltonian (~.Hamiltonian): Hamiltonian
+            wires (Iterable): wire order of the matrix
+    """
+    if hasattr(qml, "matrix"):
+        return qml.matrix(hamiltonian, wire_order=wires)
+    return qml.utils.sparse_hamiltonian(hamiltonian, wires=wires).toarray()
+
+
+def higher_order_qnode_kwargs(order):
+    """Returns keyword arguments for QNodes whose derivatives of the given order are computed.
+
+    Newer versions only make the parameter-shift rules differentiable up to ``max_diff``, older
+    versions support derivatives of any order without further arguments.
+
+    Args:
+            order (int): highest order of the derivatives
+    """
+    if "max_diff" in inspect.signature(qml.QNode).parameters:
+        return {"max_diff": order}
+    return {}
+
+
+def transform_qfunc(transform, qfunc):
+    """Applies a circuit transform with its default arguments to a quantum function.
+
+    Older versions implement transforms with arguments, like `qml.compile`, as functions that
+    take the arguments and return the actual transform, while newer versions take the quantum
+    function directly.
+
+    Args:
+            transform (callable): transform like `qml.transforms.cancel_inverses` or `qml.compile`
+            qfunc (callable): quantum function
+    """
+    tape_fn = getattr(transform, "tape_fn", None)
+    if tape_fn is not None and len(inspect.signature(tape_fn).parameters) > 1:
+        return transform()(qfunc)
+    return transform(qfunc)
+
+
+def param_shift(tape):
+    """Returns the shifted tapes of the parameter-shift gradient of a tape and the function that
+    computes the gradient from their results.
+
+    Args:
+            tape (~.QuantumTape): tape to differentiate
+
+    Raises:
+            NotImplementedError: if the installed version lacks `qml.gradients.param_shift`
+    """
+    gradients = getattr(qml, "gradients", None)
+    if gradients is None or not hasattr(gradients, "param_shift"):
+        raise NotImplementedError("qml.gradients.param_shift is not available in this version.")
+    return gradients.param_shift(tape)
+
+
+def num_executions(cost_fn):
+    """Returns the number of circuit executions of a QNode or of a cost function created by
+    `expval_cost`.
+
+    The executions are read from the devices the QNodes actually use, which differ from the device
+    they were created with if the QNode swaps it for a passthru device like
+    'default.qubit.autograd' to support backpropagation.
+
+    Args:
+            cost_fn (~.QNode): QNode, or cost function created by `expval_cost`
+    """
+    qnodes = getattr(cost_fn, "qnodes", None)
+    if qnodes is None:
+        return cost_fn.device.num_executions
+
+    # the QNodes of older cost functions share a device unless each swapped it for its own one
+    devices = {id(qnode.device): qnode.device for qnode in qnodes}
+    return sum(dev.num_executions for dev in devices.values())
+
+
+def qchem_package():
+    """Returns the qchem package if it provides the file-based Hamiltonian construction of older
+    versions, in which the Hartree-Fock calculation writes the integrals to an OpenFermion file.
+
+    Raises:
+            NotImplementedError: if qchem or OpenFermion are not installed, or if qchem lacks the
+                    file-based API
+    """
+    try:
+        from pennylane import qchem
+        import openfermion  # pylint: disable=unused-import
+    except ImportError as e:
+        raise NotImplementedError("The qchem package and OpenFermion are not installed.") from e
+
+    if not all(hasattr(qchem, name) for name in ["meanfield", "decompose", "convert_observable"]):
+        raise NotImplementedError(
+            "The installed qchem package lacks the file-based Hamiltonian construction."
+        )
+    return qchem
+
+
+def qchem_available():
+    """Returns whether the installed qchem package supports the Hamiltonian construction of
+    `qchem_meanfield` and `qchem_qubit_hamiltonian`."""
+    try:
+        qchem_package()
+    except NotImplementedError:
+        return False
+    return True
+
+
+def qchem_meanfield(symbols, coordinates, name, basis, outpath):
+    """Runs the Hartree-Fock calculation of a molecule with PySCF and stores the electronic
+    integrals in an OpenFermion file.
+
+    Args:
+            symbols (list[str]): atomic symbols
+            coordinates (list[float]): atomic coordinates in Bohr
+            name (str): name of the molecule, used for the file name
+            basis (str): atomic basis set
+            outpath (str): directory in which the integrals are stored
+
+    Returns:
+            str: path to the file with the integrals, without extension
+
+    Raises:
+            NotImplementedError: if the installed qchem package lacks the file-based API
+    """
+    qchem = qchem_package()
+    return qchem.meanfield(
+        symbols, coordinates, name=name, basis=basis, package="pyscf", outpath=outpath
+    )
+
+
+def qchem_molecular_data(hf_file):
+    """Loads the OpenFermion molecular data stored by `qchem_meanfield`.
+
+    Args:
+            hf_file (str): path to the file with the integrals, without extension
+    """
+    qchem_package()
+    from openfermion import MolecularData
+
+    return MolecularData(filename=hf_file)
+
+
+def qchem_qubit_hamiltonian(hf_file, mapping, core, active):
+    """Maps the electronic Hamiltonian stored by `qchem_meanfield` in an active space to a qubit
+    Hamiltonian.
+
+    Args:
+            hf_file (str): path to the file with the integrals, without extension
+            mapping (str): fermion-to-qubit mapping
+            core (list): indices of the core orbitals
+            active (list): indices of the active orbitals
+
+    Returns:
+            ~.Hamiltonian: the qubit Hamiltonian
+    """
+    qchem = qchem_package()
+    qubit_op = qchem.decompose(hf_file, mapping=mapping, core=core, active=active)
+    return qchem.convert_observable(qubit_op)
@@ -0,0 +1,225 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for circuit optimization transforms, comparing the cost of applying a transform
+pipeline with the time it saves in the execution and gradient of the transformed circuit.
+"""
+import time
+
+import networkx as nx
+import numpy as np
+
+import pennylane as qml
+from pennylane import qaoa
+from .circuit_families import CIRCUIT_FAMILIES, circuit_family, operation_metadata
+from .compat import UCCSD, param_shift, transform_qfunc
+from .decomposition import excitation_wires
+from .default_settings import _compilation_defaults
+
+COMPILATION_WORKLOADS = list(CIRCUIT_FAMILIES) + ["qaoa", "uccsd"]
+
+# pipelines of transforms in `qml.transforms` applied from left to right, where 'compile' stands for
+# `qml.compile`
+TRANSFORM_PIPELINES = {
+    "cancel_inverses": ["cancel_inverses"],
+    "merge_rotations": ["merge_rotations"],
+    "commute_controlled": ["commute_controlled"],
+    "commute_cancel_merge": ["commute_controlled", "cancel_inverses", "merge_rotations"],
+    "compile": ["compile"],
+}
+
+
+def _qaoa_workload(n_wires, n_layers):
+    """Returns the QAOA circuit for the minimum vertex cover problem on a random graph, together
+    with its random parameters."""
+    graph = nx.gnp_random_graph(n_wires, 0.5, seed=42)
+    cost_h, mixer_h = qaoa.min_vertex_cover(graph, constrained=False)
+
+    def qaoa_layer(gamma, alpha):
+        qaoa.cost_layer(gamma, cost_h)
+        qaoa.mixer_layer(alpha, mixer_h)
+
+    def circuit(params_):
+        for w in range(n_wires):
+            qml.Hadamard(wires=w)
+        qml.layer(qaoa_layer, n_layers, params_[0], params_[1])
+
+    return circuit, np.random.random(size=(2, n_layers))
+
+
+def _uccsd_workload(n_wires):
+    """Returns UCCSD at half filling with all spin-conserving excitations, together with its
+    random parameters."""
+    n_electrons = n_wires // 2
+    s_wires, d_wires = excitation_wires(n_electrons, n_wires)
+    init_state = np.array([1] * n_electrons + [0] * (n_wires - n_electrons))
+
+    def circuit(params_):
+        UCCSD(
+            params_, wires=range(n_wires), s_wires=s_wires, d_wires=d_wires, init_state=init_state
+        )
+
+    return circuit, np.random.random(len(s_wires) + len(d_wires))
+
+
+def make_workload(name, n_wires, n_layers):
+    """Returns a function without arguments that queues the primitive gates of a workload with
+    random parameters, followed by measuring the Pauli-Z observable of the first wire.
+
+    The templates are decomposed before any transform is applied, since the transforms only act
+    on primitive gates.
+
+    Args:
+            name (str): name of the workload in ``COMPILATION_WORKLOADS``, either a circuit family
+                    of `circuit_families.CIRCUIT_FAMILIES`, the QAOA circuit for the minimum
+                    vertex cover problem or UCCSD at half filling
+            n_wires (int): number of wires
+            n_layers (int): number of layers, ignored by UCCSD
+    """
+    if name == "qaoa":
+        circuit, params = _qaoa_workload(n_wires, n_layers)
+    elif name == "uccsd":
+        circuit, params = _uccsd_workload(n_wires)
+    elif name in CIRCUIT_FAMILIES:
+        circuit, params = circuit_family(name, n_wires, n_layers)
+    else:
+        raise ValueError(
+            "Unknown workload {}; choose one of {}.".format(name, COMPILATION_WORKLOADS)
+        )
+
+    with qml.tape.QuantumTape() as tape:
+        circuit(params)
+    operations = tape.expand(depth=10).operations
+
+    def workload():
+        for op in operations:
+            op.queue()
+        return qml.expval(qml.PauliZ(0))
+
+    return workload
+
+
+def apply_pipeline(pipeline, qfunc):
+    """Applies a pipeline of transforms to a quantum function.
+
+    Args:
+            pipeline (list[str]): names of transforms in `qml.transforms`, or 'compile' for
+                    `qml.compile`, applied from left to right
+            qfunc (callable): quantum function
+
+    Raises:
+            NotImplementedError: if the installed version lacks a transform of the pipeline
+    """
+    for name in pipeline:
+        transform = getattr(qml if name == "compile" else qml.transforms, name, None)
+        if transform is None:
+            raise NotImplementedError(
+                "The {} transform is not available in this version of PennyLane.".format(name)
+            )
+        qfunc = transform_qfunc(transform, qfunc)
+
+    return qfunc
+
+
+def _record(qfunc):
+    """Records a quantum function without arguments on a new tape."""
+    with qml.tape.QuantumTape() as tape:
+        qfunc()
+    return tape
+
+
+def _mean_time(fn, num_repeats):
+    """Returns the mean wall time of a function without arguments in seconds."""
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        fn()
+    return (time.perf_counter() - start) / num_repeats
+
+
+def _gradient(device, tape):
+    """Computes the parameter-shift gradient of a tape by executing the shifted tapes."""
+    tapes, fn = param_shift(tape)
+    return fn(device.batch_execute(tapes))
+
+
+def benchmark_compilation(hyperparams={}, num_repeats=10):
+    """Applies a transform pipeline to a workload and measures its cost and the time it saves
+    in the execution and the parameter-shift gradient of the circuit.
+
+    The transform time is the time of recording the transformed workload minus the time of
+    recording the workload itself, clamped at zero since timing noise can make it negative for
+    cheap transforms. Executions and gradients run on the device directly with
+    NumPy parameters, so that they do not include the transform, which a QNode would apply in
+    every call.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark
+
+                    * 'workload': name of the workload, see `make_workload`. Defaults to
+                      'basic_entangler'.
+
+                    * 'n_wires': Number of wires. Defaults to 4.
+
+                    * 'n_layers': Number of layers. Defaults to 6.
+
+                    * 'pipeline': name of a pipeline in ``TRANSFORM_PIPELINES``, or a list of
+                      transform names, see `apply_pipeline`. Defaults to 'compile'.
+
+                    * 'device': device on which the circuit is run, or valid device name.
+                      Defaults to 'default.qubit'.
+
+            num_repeats (int): Number of repetitions over which every time is averaged.
+                    Default is 10.
+
+    Returns:
+            dict: the transform time ('transform_time'), the execution and gradient times before
+            and after the transform ('execution_time_before', 'execution_time_after',
+            'gradient_time_before', 'gradient_time_after') in seconds, the gate counts before
+            and after the transform ('gate_count_before', 'gate_count_after'), and the number of
+            executions and gradients after which the transform pays off ('break_even_executions',
+            'break_even_gradients', None if it saves no time, so that asv records no value)
+
+    Raises:
+            NotImplementedError: if the installed version lacks a transform of the pipeline or
+                    the parameter-shift gradient transform
+    """
+    workload, n_wires, n_layers, pipeline, device = _compilation_defaults(hyperparams)
+    if isinstance(pipeline, str):
+        pipeline = TRANSFORM_PIPELINES[pipeline]
+
+    qfunc = make_workload(workload, n_wires, n_layers)
+    transformed = apply_pipeline(pipeline, qfunc)
+
+    tape_before = _record(qfunc)
+    tape_after = _record(transformed)
+
+    transform_time = max(
+        _mean_time(lambda: _record(transformed), num_repeats)
+        - _mean_time(lambda: _record(qfunc), num_repeats),
+        0.0,
+    )
+
+    result = {"transform_time": transform_time}
+    for label, tape in [("before", tape_before), ("after", tape_after)]:
+        result["execution_time_" + label] = _mean_time(
+            lambda: device.batch_execute([tape]), num_repeats
+        )
+        result["gradient_time_" + label] = _mean_time(lambda: _gradient(device, tape), num_repeats)
+        result["gate_count_" + label] = operation_metadata(tape.operations)["gate_count"]
+
+    for key in ["execution", "gradient"]:
+        saving = result[key + "_time_before"] - result[key + "_time_after"]
+        result["break_even_{}s".format(key)] = transform_time / saving if saving > 0 else None
+
+    return result
@@ -0,0 +1,145 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks that run VQE and QAOA optimizations until a target accuracy is reached.
+"""
+import time
+
+import numpy as np
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from pennylane import qaoa
+from .compat import expval_cost, hamiltonian_matrix
+from .default_settings import _qaoa_defaults, _vqe_defaults
+from .optimizers import make_optimizer, optimizer_step
+
+# chemical accuracy in Hartree
+CHEMICAL_ACCURACY = 1.6e-3
+
+
+def _optimize_to_target(cost_fn, params, opt, error_fn, target, max_steps):
+    """Runs an optimizer until the error of the cost reaches the target or the step cap.
+
+    Returns:
+            dict: the keys 'time_to_target', 'steps_to_target', 'final_error' and 'converged'
+    """
+    error = error_fn(cost_fn(params))
+    steps = 0
+
+    start = time.perf_counter()
+    while error > target and steps < max_steps:
+        params, _ = optimizer_step(opt, cost_fn, params)
+        error = error_fn(cost_fn(params))
+        steps += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "time_to_target": elapsed,
+        "steps_to_target": steps,
+        "final_error": float(error),
+        "converged": error <= target,
+    }
+
+
+def benchmark_vqe_to_target(hyperparams={}, target=CHEMICAL_ACCURACY, max_steps=200):
+    """Runs the VQE optimization of `benchmark_vqe` until the energy is within the target of the
+    exact ground state energy, or until the step cap is reached.
+
+    The exact ground state energy is computed by diagonalizing the Hamiltonian before the timer
+    starts. The time includes the energy evaluations used to check convergence.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_vqe`.
+                    The 'n_steps' hyperparameter is ignored.
+
+                    * 'optimizer': name of the optimizer, one of `optimizers.OPTIMIZERS`
+
+                    * 'stepsize': step size of the optimizer. Defaults to 0.4.
+
+                    * 'seed': seed of NumPy's global random number generator. Defaults to 42.
+
+            target (float): tolerated energy error in Hartree. Defaults to chemical accuracy.
+
+            max_steps (int): maximum number of optimization steps
+
+    Returns:
+            dict: the keys 'time_to_target', 'steps_to_target', 'final_error' and 'converged'
+    """
+    optimizer = hyperparams.pop("optimizer", "gradient_descent")
+    stepsize = hyperparams.pop("stepsize", 0.4)
+    np.random.seed(hyperparams.pop("seed", 42))
+
+    ham, ansatz, params, _, device, interface, diff_method, grouping = _vqe_defaults(hyperparams)
+    exact_energy = np.linalg.eigvalsh(hamiltonian_matrix(ham, device.wires))[0]
+
+    cost_fn = expval_cost(ansatz, ham, device, interface, diff_method, optimize=grouping)
+    opt = make_optimizer(optimizer, stepsize)
+
+    return _optimize_to_target(
+        cost_fn, params, opt, lambda energy: energy - exact_energy, target, max_steps
+    )
+
+
+def benchmark_qaoa_to_target(hyperparams={}, target=0.9, max_steps=200):
+    """Optimizes the QAOA circuit of `benchmark_qaoa` for the minimum vertex cover problem until
+    the approximation ratio reaches the target, or until the step cap is reached.
+
+    The approximation ratio is ``(E_max - <H_C>) / (E_max - E_min)``, where ``E_min`` and ``E_max``
+    are the extreme eigenvalues of the cost Hamiltonian ``H_C``, computed before the timer starts.
+    The reported error is one minus the approximation ratio.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_qaoa`
+
+                    * 'optimizer': name of the optimizer, one of `optimizers.OPTIMIZERS`
+
+                    * 'stepsize': step size of the optimizer. Defaults to 0.1.
+
+                    * 'seed': seed of NumPy's global random number generator. Defaults to 42.
+
+            target (float): approximation ratio to reach
+
+            max_steps (int): maximum number of optimization steps
+
+    Returns:
+            dict: the keys 'time_to_target', 'steps_to_target', 'final_error' and 'converged'
+    """
+    optimizer = hyperparams.pop("optimizer", "gradient_descent")
+    stepsize = hyperparams.pop("stepsize", 0.1)
+    np.random.seed(hyperparams.pop("seed", 42))
+
+    graph, n_layers, params, device, options_dict = _qaoa_defaults(hyperparams)
+
+    H_cost, H_mixer = qaoa.min_vertex_cover(graph, constrained=False)
+    eigvals = np.linalg.eigvalsh(hamiltonian_matrix(H_cost, device.wires))
+    e_min, e_max = eigvals[0], eigvals[-1]
+
+    def qaoa_layer(gamma, alpha):
+        qaoa.cost_layer(gamma, H_cost)
+        qaoa.mixer_layer(alpha, H_mixer)
+
+    def ansatz(params_, wires):
+        for w in wires:
+            qml.Hadamard(wires=w)
+        qml.layer(qaoa_layer, n_layers, params_[0], params_[1])
+
+    cost_fn = expval_cost(ansatz, H_cost, device, **options_dict)
+    opt = make_optimizer(optimizer, stepsize)
+    params = pnp.array(params, requires_grad=True)
+
+    def error_fn(energy):
+        return (energy - e_min) / (e_max - e_min)
+
+    return _optimize_to_target(cost_fn, params, opt, error_fn, 1 - target, max_steps)
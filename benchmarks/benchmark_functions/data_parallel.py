@@ -0,0 +1,163 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for a machine learning application whose loss gradient is evaluated data-parallel
+by a pool of processes.
+"""
+import multiprocessing
+import pickle
+import time
+
+import numpy as np
+from numpy.random import random
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from .compat import device as create_device
+from .default_settings import _data_parallel_defaults
+from .machine_learning import load_dataset
+
+# quantum model of the current process, created by `_init_worker`
+_MODEL = None
+
+
+def _init_worker(device_name, n_features, diff_method):
+    """Creates the device and quantum model of a worker process."""
+    global _MODEL
+
+    device = create_device(device_name, wires=n_features)
+
+    @qml.qnode(device, diff_method=diff_method)
+    def quantum_model(x, params):
+        qml.templates.AngleEmbedding(x, wires=range(len(x)))
+        qml.templates.BasicEntanglerLayers(params, wires=range(len(x)))
+        return qml.expval(qml.PauliZ(0))
+
+    _MODEL = quantum_model
+
+
+def _shard_gradient(args):
+    """Computes the gradient of the summed squared loss of a shard of the data.
+
+    Args:
+            args (tuple): the quantum and classical weights, and the features and labels of the shard
+
+    Returns:
+            tuple: the gradients with respect to the quantum and classical weights as NumPy arrays,
+            and the time spent computing them in seconds
+    """
+    w_quantum, w_classical, x_shard, y_shard = args
+    start = time.perf_counter()
+
+    def shard_loss(w_quantum_, w_classical_):
+        c = 0
+        for x, y in zip(x_shard, y_shard):
+            prediction = _MODEL(pnp.dot(w_classical_, x), w_quantum_)
+            c = c + (prediction - y) ** 2
+        return c
+
+    w_quantum = pnp.array(w_quantum, requires_grad=True)
+    w_classical = pnp.array(w_classical, requires_grad=True)
+    grad_qu, grad_class = qml.grad(shard_loss, argnum=[0, 1])(w_quantum, w_classical)
+
+    return np.asarray(grad_qu), np.asarray(grad_class), time.perf_counter() - start
+
+
+def benchmark_data_parallel(hyperparams={}, n_steps=5):
+    """Trains the hybrid quantum-classical model of `benchmark_machine_learning` with full-batch
+    gradient descent, where every gradient is split into shards that are computed by a pool of
+    worker processes, each with its own device, and summed in the main process.
+
+    Args:
+    hyperparams (dict): hyperparameters to configure this benchmark
+
+            * 'n_features': Number of features of each data sample. Defaults to 4.
+
+            * 'n_samples': Number of data samples to use. Defaults to 64.
+
+            * 'n_workers': Number of worker processes. With 0, the gradient is computed serially in
+              the calling process. Defaults to 2.
+
+            * 'diff_method': name of differentiation method. Defaults to 'best'.
+
+            * 'device': name of the device every worker creates. Defaults to 'default.qubit'.
+
+            * 'seed': seed of the dataset. Defaults to 42.
+
+    n_steps (int): Number of gradient descent steps. Defaults to 5.
+
+    Returns:
+            dict: the mean wall time of a step in seconds ('step_time'), the mean time per step
+            not spent computing gradients in the slowest worker, which covers serialization,
+            inter-process communication and scheduling ('overhead_time'), the time to start the
+            pool ('startup_time') and the number of pickled bytes sent to the workers per step
+            ('payload_bytes')
+    """
+    n_features, n_samples, n_workers, device_name, diff_method, seed = _data_parallel_defaults(
+        hyperparams
+    )
+    x, y = load_dataset(n_samples, n_features, seed)
+
+    w_quantum = random(size=(n_features, n_features))
+    w_classical = random(size=(n_features, n_features))
+
+    start = time.perf_counter()
+    if n_workers == 0:
+        _init_worker(device_name, n_features, diff_method)
+        pool = None
+        map_fn = map
+        n_shards = 1
+    else:
+        pool = multiprocessing.Pool(
+            n_workers, initializer=_init_worker, initargs=(device_name, n_features, diff_method)
+        )
+        map_fn = pool.map
+        n_shards = n_workers
+    startup_time = time.perf_counter() - start
+
+    x_shards = np.array_split(x, n_shards)
+    y_shards = np.array_split(y, n_shards)
+
+    step_time = 0.0
+    overhead_time = 0.0
+    payload_bytes = 0
+
+    try:
+        for _ in range(n_steps):
+            args = [(w_quantum, w_classical, xs, ys) for xs, ys in zip(x_shards, y_shards)]
+
+            start = time.perf_counter()
+            results = list(map_fn(_shard_gradient, args))
+            elapsed = time.perf_counter() - start
+
+            grad_qu = sum(r[0] for r in results) / n_samples
+            grad_class = sum(r[1] for r in results) / n_samples
+            w_quantum = w_quantum - 0.05 * grad_qu
+            w_classical = w_classical - 0.05 * grad_class
+
+            step_time += elapsed
+            overhead_time += elapsed - max(r[2] for r in results)
+            if pool is not None:
+                payload_bytes += len(pickle.dumps(args))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return {
+        "step_time": step_time / n_steps,
+        "overhead_time": overhead_time / n_steps,
+        "startup_time": startup_time,
+        "payload_bytes": payload_bytes // n_steps,
+    }
@@ -0,0 +1,161 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the decomposition of templates into primitive gates.
+"""
+import itertools
+
+import networkx as nx
+import numpy as np
+
+import pennylane as qml
+from pennylane import qaoa
+from pennylane.templates import AngleEmbedding, BasicEntanglerLayers, StronglyEntanglingLayers
+from .circuit_families import operation_metadata
+from .compat import UCCSD
+
+TEMPLATES = ["uccsd", "strongly_entangling", "basic_entangler", "angle_embedding", "qaoa"]
+
+# templates whose size is fixed by the number of wires alone
+LAYERLESS_TEMPLATES = ["uccsd", "angle_embedding"]
+
+
+def excitation_wires(n_electrons, n_wires):
+    """Returns the wires of all spin-conserving single and double excitations from the Hartree-Fock
+    state, in the format of the ``s_wires`` and ``d_wires`` arguments of `UCCSD`.
+
+    Even wires hold spin-up and odd wires spin-down orbitals, as in the qchem package. The
+    excitations are generated on every call, since their generation is part of the construction
+    of UCCSD that `UCCSDScaling` times.
+
+    Args:
+            n_electrons (int): number of electrons, which occupy the first wires
+            n_wires (int): number of spin orbitals
+
+    Returns:
+            tuple[list, list]: the ``s_wires`` and ``d_wires``
+    """
+    occupied = range(n_electrons)
+    unoccupied = range(n_electrons, n_wires)
+
+    s_wires = [list(range(r, p + 1)) for r in occupied for p in unoccupied if r % 2 == p % 2]
+    d_wires = [
+        [list(range(r, s + 1)), list(range(p, q + 1))]
+        for r, s in itertools.combinations(occupied, 2)
+        for p, q in itertools.combinations(unoccupied, 2)
+        if r % 2 + s % 2 == p % 2 + q % 2
+    ]
+
+    return s_wires, d_wires
+
+
+def _uccsd(n_wires, n_layers):
+    n_electrons = n_wires // 2
+    s_wires, d_wires = excitation_wires(n_electrons, n_wires)
+    init_state = np.array([1] * n_electrons + [0] * (n_wires - n_electrons))
+    weights = np.random.random(len(s_wires) + len(d_wires))
+
+    def template():
+        UCCSD(
+            weights, wires=range(n_wires), s_wires=s_wires, d_wires=d_wires, init_state=init_state
+        )
+
+    return template
+
+
+def _strongly_entangling(n_wires, n_layers):
+    weights = np.random.random(size=(n_layers, n_wires, 3))
+    return lambda: StronglyEntanglingLayers(weights, wires=range(n_wires))
+
+
+def _basic_entangler(n_wires, n_layers):
+    weights = np.random.random(size=(n_layers, n_wires))
+    return lambda: BasicEntanglerLayers(weights, wires=range(n_wires))
+
+
+def _angle_embedding(n_wires, n_layers):
+    features = np.random.random(size=n_wires)
+    return lambda: AngleEmbedding(features, wires=range(n_wires))
+
+
+def _qaoa(n_wires, n_layers):
+    graph = nx.gnp_random_graph(n_wires, 0.5, seed=42)
+    cost_h, mixer_h = qaoa.min_vertex_cover(graph, constrained=False)
+    gammas, alphas = np.random.random(size=(2, n_layers))
+
+    def qaoa_layer(gamma, alpha):
+        qaoa.cost_layer(gamma, cost_h)
+        qaoa.mixer_layer(alpha, mixer_h)
+
+    return lambda: qml.layer(qaoa_layer, n_layers, gammas, alphas)
+
+
+_TEMPLATE_FACTORIES = {
+    "uccsd": _uccsd,
+    "strongly_entangling": _strongly_entangling,
+    "basic_entangler": _basic_entangler,
+    "angle_embedding": _angle_embedding,
+    "qaoa": _qaoa,
+}
+
+
+def make_template(name, n_wires, n_layers=1):
+    """Returns a function without arguments that queues the named template with random
+    parameters.
+
+    UCCSD uses a half-filled Hartree-Fock state and all spin-conserving excitations, see
+    `excitation_wires`. QAOA alternates the cost and mixer layers of the minimum vertex cover
+    problem on a random graph. The number of layers is ignored for ``LAYERLESS_TEMPLATES``.
+
+    Args:
+            name (str): name of the template in ``TEMPLATES``
+            n_wires (int): number of wires the template acts on
+            n_layers (int): number of layers of the template
+    """
+    if name not in _TEMPLATE_FACTORIES:
+        raise ValueError("Unknown template {}; choose one of {}.".format(name, TEMPLATES))
+    return _TEMPLATE_FACTORIES[name](n_wires, n_layers)
+
+
+def record_template(template):
+    """Records a template created by `make_template` into a new tape without decomposing it.
+
+    Args:
+            template (callable): function without arguments that queues the template
+    """
+    with qml.tape.QuantumTape() as tape:
+        template()
+    return tape
+
+
+def decompose_template(tape):
+    """Decomposes the templates recorded on a tape into primitive gates.
+
+    Args:
+            tape (~.QuantumTape): tape created by `record_template`
+
+    Returns:
+            list[~.Operation]: the primitive gates
+    """
+    return tape.expand(depth=10).operations
+
+
+def template_metadata(name, n_wires, n_layers=1):
+    """Decomposes the named template and returns its gate count and depth, see `make_template`.
+
+    Returns:
+            dict: dictionary with the keys 'gate_count', 'two_qubit_gate_count' and 'depth'
+    """
+    tape = record_template(make_template(name, n_wires, n_layers))
+    return operation_metadata(decompose_template(tape))
@@ -19,12 +19,12 @@ import networkx as nx
 import pennylane as qml
 from pennylane import numpy as np
 
-from numpy.random import random
+from numpy.random import default_rng, random
 from functools import partial
 from pennylane.templates import BasicEntanglerLayers
-from pennylane.templates.decorator import template as template_decorator
-from pennylane.templates.subroutines import UCCSD
+from .compat import UCCSD, device as create_device, template as template_decorator
 from .hamiltonians import ham_h2
+from .circuit_families import circuit_family
 
 
 def _core_defaults(hyperparams):
@@ -37,7 +37,7 @@ def _core_defaults(hyperparams):
     n_wires = hyperparams.pop("n_wires", 4)
     n_layers = hyperparams.pop("n_layers", 6)
     interface = hyperparams.pop("interface", "autograd")
-    params = hyperparams.pop("params", random(size=(n_layers, n_wires)))
+    params = hyperparams.pop("params", None)
     measurement = hyperparams.pop("measurement", qml.expval(qml.PauliZ(0)))
     diff_method = hyperparams.pop("diff_method", "best")
     device = hyperparams.pop("device", "default.qubit")
@@ -45,10 +45,13 @@ def _core_defaults(hyperparams):
 
     # if device name is given, create device
     if isinstance(device, str):
-        if device == "cirq.pasqal":
-            device = qml.device(device, wires=n_wires, control_radius=1.5)
-        else:
-            device = qml.device(device, wires=n_wires)
+        device = create_device(device, wires=n_wires)
+
+    # a string selects a template from the library of circuit families
+    if isinstance(template, str):
+        template, family_params = circuit_family(template, n_wires, n_layers)
+        if params is None:
+            params = family_params
 
     # wrap default template so it only takes the parameters as argument
     if template is None:
@@ -59,9 +62,73 @@ def _core_defaults(hyperparams):
 
         template = Template
 
+    if params is None:
+        params = random(size=(n_layers, n_wires))
+
     return device, diff_method, interface, params, template, measurement
 
 
+def _overhead_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the Python overhead
+    benchmarks.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    n_wires = hyperparams.pop("n_wires", 2)
+    n_ops = hyperparams.pop("n_ops", 1000)
+    device = hyperparams.pop("device", "default.qubit")
+
+    # if device name is given, create device
+    if isinstance(device, str):
+        device = create_device(device, wires=n_wires)
+
+    params = random(size=(n_ops, 3))
+
+    return n_wires, n_ops, device, params
+
+
+def _noise_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the noisy circuit.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    n_wires = hyperparams.pop("n_wires", 4)
+    n_layers = hyperparams.pop("n_layers", 6)
+    params = hyperparams.pop("params", random(size=(n_layers, n_wires)))
+    diff_method = hyperparams.pop("diff_method", "best")
+    device = hyperparams.pop("device", "default.mixed")
+    channel = hyperparams.pop("channel", "depolarizing")
+    density = hyperparams.pop("density", 1.0)
+    noise_strength = hyperparams.pop("noise_strength", 0.1)
+
+    # if device name is given, create device
+    if isinstance(device, str):
+        device = create_device(device, wires=n_wires)
+
+    # wires that receive a noise channel after each layer, spread evenly over the register
+    n_noisy = max(1, int(round(density * n_wires)))
+    noisy_wires = sorted(set(int(w) for w in np.linspace(0, n_wires - 1, n_noisy)))
+
+    return device, diff_method, params, channel, noisy_wires, noise_strength
+
+
+def _replay_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the replay benchmark.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    path = hyperparams.pop("path")
+    device = hyperparams.pop("device", "default.qubit")
+    diff_method = hyperparams.pop("diff_method", None)
+    gradient = hyperparams.pop("gradient", False)
+    max_tapes = hyperparams.pop("max_tapes", None)
+
+    return path, device, diff_method, gradient, max_tapes
+
+
 def _vqe_defaults(hyperparams):
     """Uses hyperparameters or defaults to construct the components of the VQE circuit for the
     hydrogen molecule with the sto-3g basis set.
@@ -89,7 +156,7 @@ def _vqe_defaults(hyperparams):
 
     # if device name is given, create device
     if isinstance(device, str):
-        device = qml.device(device, wires=len(hf_state), shots=None)
+        device = create_device(device, wires=len(hf_state), shots=None)
 
     return ham, ansatz, params, n_steps, device, interface, diff_method, grouping
 
@@ -112,7 +179,7 @@ def _qaoa_defaults(hyperparams):
 
     # if device name is given, create device
     if isinstance(device, str):
-        device = qml.device(device, wires=len(graph.nodes), shots=None)
+        device = create_device(device, wires=len(graph.nodes), shots=None)
 
     options_dict = {"interface": interface, "diff_method": diff_method}
 
@@ -134,7 +201,7 @@ def _ml_defaults(hyperparams):
 
     # if device name is given, create device
     if isinstance(device, str):
-        device = qml.device(device, wires=n_features)
+        device = create_device(device, wires=n_features)
 
     # data
     x0 = np.random.normal(loc=-1, scale=1, size=(n_samples // 2, n_features))
@@ -144,3 +211,165 @@ def _ml_defaults(hyperparams):
     data = list(zip(x, y))
 
     return data, device, diff_method, interface
+
+
+def _streaming_ml_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the streaming machine
+    learning benchmark.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    # get hyperparameters or set default values
+    n_features = hyperparams.pop("n_features", 4)
+    n_samples = hyperparams.pop("n_samples", 10000)
+    batch_size = hyperparams.pop("batch_size", 32)
+    chunk_size = hyperparams.pop("chunk_size", 4096)
+    n_epochs = hyperparams.pop("n_epochs", 1)
+    max_batches = hyperparams.pop("max_batches", None)
+    seed = hyperparams.pop("seed", 42)
+    interface = hyperparams.pop("interface", "autograd")
+    diff_method = hyperparams.pop("diff_method", "best")
+    device = hyperparams.pop("device", "default.qubit")
+
+    # if device name is given, create device
+    if isinstance(device, str):
+        device = create_device(device, wires=n_features)
+
+    dataset = {
+        "n_samples": n_samples,
+        "n_features": n_features,
+        "chunk_size": chunk_size,
+        "seed": seed,
+    }
+    schedule = {"batch_size": batch_size, "n_epochs": n_epochs, "max_batches": max_batches}
+
+    return dataset, schedule, device, diff_method, interface
+
+
+def _data_parallel_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the data-parallel machine
+    learning benchmark.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    # get hyperparameters or set default values
+    n_features = hyperparams.pop("n_features", 4)
+    n_samples = hyperparams.pop("n_samples", 64)
+    n_workers = hyperparams.pop("n_workers", 2)
+    diff_method = hyperparams.pop("diff_method", "best")
+    seed = hyperparams.pop("seed", 42)
+
+    # every worker creates its own device, so only a device name can be passed on
+    device_name = hyperparams.pop("device", "default.qubit")
+    if not isinstance(device_name, str):
+        raise ValueError("The data-parallel benchmark only accepts device names.")
+
+    return n_features, n_samples, n_workers, device_name, diff_method, seed
+
+
+def _qchem_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the Hamiltonian
+    construction benchmark.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    # get hyperparameters or set default values
+    molecule = hyperparams.pop("molecule", "h2")
+    basis = hyperparams.pop("basis", "sto-3g")
+    mapping = hyperparams.pop("mapping", "jordan_wigner")
+    outpath = hyperparams.pop("outpath", None)
+
+    return molecule, basis, mapping, outpath
+
+
+def _pauli_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the Pauli-sum arithmetic
+    benchmarks.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    # get hyperparameters or set default values
+    n_terms = hyperparams.pop("n_terms", 1000)
+    n_wires = hyperparams.pop("n_wires", 20)
+    locality = hyperparams.pop("locality", 4)
+    seed = hyperparams.pop("seed", 42)
+
+    if locality > n_wires:
+        raise ValueError("The locality of the terms cannot exceed the number of wires.")
+
+    return n_terms, n_wires, locality, seed
+
+
+def _estimator_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the estimator precision
+    benchmark.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    # get hyperparameters or set default values
+    hamiltonian = hyperparams.pop("hamiltonian", ham_h2)
+    shots = hyperparams.pop("shots", 1000)
+    grouping = hyperparams.pop("optimize", False)
+    n_layers = hyperparams.pop("n_layers", 2)
+    seed = hyperparams.pop("seed", 42)
+    device = hyperparams.pop("device", "default.qubit")
+
+    # every benchmark measures its own copy, since grouping is stored on the Hamiltonian
+    hamiltonian = qml.Hamiltonian(hamiltonian.coeffs, hamiltonian.ops)
+    n_wires = len(hamiltonian.wires)
+
+    # if device name is given, create device
+    if isinstance(device, str):
+        device = create_device(device, wires=n_wires, shots=shots)
+
+    params = default_rng(seed).random(size=(n_layers, n_wires))
+
+    return hamiltonian, device, grouping, params
+
+
+def _dispatch_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the interface dispatch
+    benchmarks.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    # get hyperparameters or set default values
+    n_wires = hyperparams.pop("n_wires", 1)
+    n_params = hyperparams.pop("n_params", 10)
+    diff_method = hyperparams.pop("diff_method", "parameter-shift")
+    device = hyperparams.pop("device", "default.qubit")
+
+    # if device name is given, create device
+    if isinstance(device, str):
+        device = create_device(device, wires=n_wires)
+
+    params = random(size=n_params)
+
+    return n_wires, device, diff_method, params
+
+
+def _compilation_defaults(hyperparams):
+    """Uses hyperparameters or defaults to construct the components of the transform pipeline
+    benchmark.
+
+    Args:
+            hyperparams (dict): hyperparameters provided by user
+    """
+    # get hyperparameters or set default values
+    workload = hyperparams.pop("workload", "basic_entangler")
+    n_wires = hyperparams.pop("n_wires", 4)
+    n_layers = hyperparams.pop("n_layers", 6)
+    pipeline = hyperparams.pop("pipeline", "compile")
+    device = hyperparams.pop("device", "default.qubit")
+
+    # if device name is given, create device
+    if isinstance(device, str):
+        device = create_device(device, wires=n_wires)
+
+    return workload, n_wires, n_layers, pipeline, device
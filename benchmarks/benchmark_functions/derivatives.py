@@ -0,0 +1,92 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for higher-order derivatives and Jacobians of vector-valued circuits.
+"""
+import pennylane as qml
+from pennylane import numpy as pnp
+from .compat import higher_order_qnode_kwargs
+from .default_settings import _core_defaults
+
+
+def benchmark_hessian(hyperparams={}, num_repeats=1):
+    """Computes the Hessian of a quantum circuit with respect to its flattened parameters.
+
+    Unless otherwise specified by the hyperparameters, the circuit consists of 6 layers of `BasicEntanglerLayers`
+    run on 4 qubits, followed by measuring the Pauli-Z observable of the first wire, and is run using
+    a 'default.qubit' device and the autograd interface. Only the autograd interface is supported.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_gradient`
+
+            num_repeats (int): How often the Hessian is computed in a for loop. Default is 1.
+
+    Returns:
+            int: number of circuit executions on the device used by the QNode
+    """
+    device, diff_method, _, params, template, measurement = _core_defaults(hyperparams)
+    shape = params.shape
+
+    @qml.qnode(device, diff_method=diff_method, **higher_order_qnode_kwargs(2))
+    def circuit(flat_params):
+        template(flat_params.reshape(shape))
+        measurement.queue()
+        return measurement
+
+    params = pnp.array(params.flatten(), requires_grad=True)
+    hessian = qml.jacobian(qml.grad(circuit))
+
+    for _ in range(num_repeats):
+        hessian(params)
+
+    return circuit.device.num_executions
+
+
+def benchmark_probs_jacobian(hyperparams={}, num_repeats=1):
+    """Computes the Jacobian of the probabilities of a quantum circuit, whose cost grows with the
+    number of outputs.
+
+    Unless otherwise specified by the hyperparameters, the circuit consists of 6 layers of `BasicEntanglerLayers`
+    run on 4 qubits, followed by measuring the probabilities of all wires, and is run using a
+    'default.qubit' device and the autograd interface. Only the autograd interface is supported.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_gradient`.
+                    The 'measurement' hyperparameter is ignored.
+
+                    * 'n_measured': Number of wires whose probabilities are measured, so that the
+                      circuit has 2**n_measured outputs. Defaults to all wires.
+
+            num_repeats (int): How often the Jacobian is computed in a for loop. Default is 1.
+
+    Returns:
+            int: number of circuit executions on the device used by the QNode
+    """
+    n_measured = hyperparams.pop("n_measured", None)
+    hyperparams.pop("measurement", None)
+    device, diff_method, _, params, template, _ = _core_defaults(hyperparams)
+    measured_wires = list(device.wires)[:n_measured]
+
+    @qml.qnode(device, diff_method=diff_method)
+    def circuit(params_):
+        template(params_)
+        return qml.probs(wires=measured_wires)
+
+    params = pnp.array(params, requires_grad=True)
+    jac = qml.jacobian(circuit)
+
+    for _ in range(num_repeats):
+        jac(params)
+
+    return circuit.device.num_executions
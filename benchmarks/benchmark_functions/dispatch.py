@@ -0,0 +1,171 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the cost of crossing the interface layer in QNode calls, compared to executing the
+same circuit directly on the device with NumPy parameters.
+"""
+import statistics
+import time
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from .default_settings import _dispatch_defaults
+
+INTERFACES = ["autograd", "tf", "torch", "jax"]
+
+
+def _dispatch_circuit(params, n_wires):
+    """Applies one rotation per parameter, alternating between RX and RY and cycling over the
+    wires."""
+    for i in range(len(params)):
+        gate = qml.RX if i % 2 == 0 else qml.RY
+        gate(params[i], wires=i % n_wires)
+
+
+def _interface_calls(circuit, interface, params):
+    """Returns the forward and backward functions of a QNode for an interface, with the
+    parameters already converted to the tensor type of the interface."""
+    if interface == "autograd":
+        params = pnp.array(params, requires_grad=True)
+        gradient = qml.grad(circuit)
+        return lambda: circuit(params), lambda: gradient(params)
+
+    if interface == "tf":
+        import tensorflow as tf
+
+        params = tf.Variable(params)
+
+        def backward():
+            with tf.GradientTape() as tape:
+                result = circuit(params)
+            tape.gradient(result, params)
+
+        return lambda: circuit(params), backward
+
+    if interface == "torch":
+        import torch
+
+        params = torch.tensor(params, requires_grad=True)
+
+        def backward():
+            circuit(params).backward()
+
+        return lambda: circuit(params), backward
+
+    if interface == "jax":
+        import jax
+        from jax import numpy as jnp
+
+        params = jnp.array(params)
+        gradient = jax.grad(circuit)
+        return lambda: circuit(params), lambda: gradient(params)
+
+    raise ValueError("Unknown interface {}; choose one of {}.".format(interface, INTERFACES))
+
+
+def prepare_dispatch(interface, hyperparams={}, backward=False):
+    """Creates a small QNode for an interface, with parameters that are converted to the tensor
+    type of the interface beforehand, so that only the calls are timed.
+
+    Args:
+            interface (str): name of the interface in ``INTERFACES``
+            hyperparams (dict): hyperparameters to configure this benchmark, see
+                    `benchmark_dispatch`
+            backward (bool): Whether the gradient is computed instead of the forward pass.
+
+    Returns:
+            tuple[callable, ~.QNode, callable]: the function without arguments that calls the
+            QNode, the QNode, and a function without arguments that executes the same circuit on
+            the same device with NumPy parameters
+    """
+    n_wires, device, diff_method, params = _dispatch_defaults(hyperparams)
+
+    @qml.qnode(device, interface=interface, diff_method=diff_method)
+    def circuit(params_):
+        _dispatch_circuit(params_, n_wires)
+        return qml.expval(qml.PauliZ(0))
+
+    forward_fn, backward_fn = _interface_calls(circuit, interface, params)
+    fn = backward_fn if backward else forward_fn
+
+    with qml.tape.QuantumTape() as tape:
+        _dispatch_circuit(params, n_wires)
+        qml.expval(qml.PauliZ(0))
+
+    # warm-up call, since the first call initializes lazily loaded state of the interface and the
+    # device; the tape itself is rebuilt in every call
+    fn()
+
+    return fn, circuit, lambda: device.batch_execute([tape])
+
+
+def _mean_time(fn, num_repeats):
+    """Returns the mean wall time of a function without arguments in seconds."""
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        fn()
+    return (time.perf_counter() - start) / num_repeats
+
+
+def benchmark_dispatch(interface, hyperparams={}, num_repeats=100, backward=False, n_rounds=5):
+    """Calls a small QNode repeatedly through an interface, and compares the calls with executing
+    the same circuit on the device with NumPy parameters.
+
+    Every round times ``num_repeats`` calls followed by as many device executions, so that each
+    ratio of a round comes from one measured pair under the same load of the machine.
+
+    Args:
+            interface (str): name of the interface in ``INTERFACES``
+            hyperparams (dict): hyperparameters to configure this benchmark
+
+                    * 'n_wires': Number of wires. Defaults to 1.
+
+                    * 'n_params': Number of rotation parameters. Defaults to 10.
+
+                    * 'diff_method': name of differentiation method. Defaults to 'parameter-shift',
+                      so that every interface runs the same device.
+
+                    * 'device': device on which the circuit is run, or valid device name.
+                      Defaults to 'default.qubit'.
+
+            num_repeats (int): Number of calls per round. Defaults to 100.
+            backward (bool): Whether the gradient is computed instead of the forward pass.
+            n_rounds (int): Number of rounds. Defaults to 5.
+
+    Returns:
+            dict: the median wall time of a call ('seconds_per_call') and of a device execution
+            ('device_seconds') in seconds, the number of device executions of a call
+            ('executions_per_call'), and the median over the rounds of the time of a call divided
+            by the time of as many device executions as it needs ('relative')
+    """
+    fn, circuit, device_call = prepare_dispatch(interface, hyperparams, backward)
+
+    call_times, device_times = [], []
+    executions = 0
+    for _ in range(n_rounds):
+        before = circuit.device.num_executions
+        call_times.append(_mean_time(fn, num_repeats))
+        executions += circuit.device.num_executions - before
+
+        device_times.append(_mean_time(device_call, num_repeats))
+
+    executions_per_call = executions / (n_rounds * num_repeats)
+    ratios = [c / (executions_per_call * d) for c, d in zip(call_times, device_times)]
+
+    return {
+        "seconds_per_call": statistics.median(call_times),
+        "device_seconds": statistics.median(device_times),
+        "executions_per_call": executions_per_call,
+        "relative": statistics.median(ratios),
+    }
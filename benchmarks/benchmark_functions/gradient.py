@@ -45,6 +45,7 @@ def benchmark_gradient(hyperparams={}, num_repeats=1):
                     * 'interface': name of the interface to use
 
                     * 'template': Template to use. The template must take the trainable parameters as its only argument.
+                      Alternatively, the name of a circuit family in `circuit_families.CIRCUIT_FAMILIES`.
 
                     * 'params': Numpy array of trainable parameters that is fed into the template.
 
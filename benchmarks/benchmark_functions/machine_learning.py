@@ -14,11 +14,15 @@
 """
 Benchmarks for a machine learning application.
 """
+from itertools import chain, islice
+
+import numpy as np
 from numpy.random import random
 
 import pennylane as qml
 from pennylane import numpy as pnp
-from .default_settings import _ml_defaults
+from .artifacts import cached
+from .default_settings import _ml_defaults, _streaming_ml_defaults
 
 
 def _machine_learning_autograd(quantum_model, data):
@@ -164,3 +168,215 @@ def benchmark_machine_learning(hyperparams={}, num_repeats=1):
             _machine_learning_torch(quantum_model, data)
 
         # TODO: jax
+
+
+def stream_dataset(n_samples, n_features, chunk_size=4096, seed=42):
+    """Generates a dataset of two Gaussian blobs in chunks, so that only one chunk is held in
+    memory at a time. The same seed always produces the same samples.
+
+    Args:
+            n_samples (int): total number of samples
+            n_features (int): number of features of each sample
+            chunk_size (int): number of samples generated at once
+            seed (int): seed of the random number generator
+
+    Yields:
+            tuple[array, array]: the features of shape ``(chunk, n_features)`` and the labels
+            in ``{-1, 1}`` of a chunk
+    """
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, n_samples, chunk_size):
+        size = min(chunk_size, n_samples - start)
+        y = rng.choice([-1.0, 1.0], size=size)
+        x = rng.normal(loc=y[:, None], scale=1.0, size=(size, n_features))
+        yield x, y
+
+
+@cached("gaussian_blobs")
+def load_dataset(n_samples, n_features, seed):
+    """Materializes the dataset of `stream_dataset` in memory, stored in the artifact cache.
+
+    Args:
+            n_samples (int): total number of samples
+            n_features (int): number of features of each sample
+            seed (int): seed of the random number generator
+
+    Returns:
+            tuple[array, array]: the features of shape ``(n_samples, n_features)`` and the labels
+    """
+    chunks = list(stream_dataset(n_samples, n_features, seed=seed))
+    x = np.concatenate([x_chunk for x_chunk, _ in chunks])
+    y = np.concatenate([y_chunk for _, y_chunk in chunks])
+    return x, y
+
+
+def iterate_batches(chunks, batch_size):
+    """Splits a stream of chunks into mini-batches of a fixed size. Samples left over at the end
+    of a chunk are carried over into the next batch, only the last batch may be smaller.
+
+    Args:
+            chunks (Iterable[tuple[array, array]]): chunks of features and labels
+            batch_size (int): number of samples per batch
+
+    Yields:
+            tuple[array, array]: the features and labels of a batch
+    """
+    rest_x, rest_y = None, None
+
+    for x, y in chunks:
+        if rest_x is not None:
+            x = np.concatenate([rest_x, x])
+            y = np.concatenate([rest_y, y])
+
+        n_full = len(x) - len(x) % batch_size
+        for start in range(0, n_full, batch_size):
+            yield x[start : start + batch_size], y[start : start + batch_size]
+
+        rest_x, rest_y = x[n_full:], y[n_full:]
+
+    if rest_x is not None and len(rest_x) > 0:
+        yield rest_x, rest_y
+
+
+def _streaming_autograd(quantum_model, batches, n_features):
+    """Mini-batch training with autograd interface."""
+
+    def batch_loss(w_quantum, w_classical, x_batch, y_batch):
+        c = 0
+        for x, y in zip(x_batch, y_batch):
+            prediction = quantum_model(pnp.dot(w_classical, x), w_quantum)
+            c = c + (prediction - y) ** 2
+        return c / len(x_batch)
+
+    w_quantum = pnp.array(random(size=(n_features, n_features)), requires_grad=True)
+    w_classical = pnp.array(random(size=(n_features, n_features)), requires_grad=True)
+
+    gradient_fn = qml.grad(batch_loss, argnum=[0, 1])
+
+    n_trained = 0
+    for x_batch, y_batch in batches:
+        grad_qu, grad_class = gradient_fn(w_quantum, w_classical, x_batch, y_batch)
+        w_quantum = w_quantum - 0.05 * grad_qu
+        w_classical = w_classical - 0.05 * grad_class
+        n_trained += len(x_batch)
+
+    return n_trained
+
+
+def _streaming_tf(quantum_model, batches, n_features):
+    """Mini-batch training with tensorflow interface."""
+
+    import tensorflow as tf
+
+    w_quantum = tf.Variable(random(size=(n_features, n_features)), dtype=tf.double)
+    w_classical = tf.Variable(random(size=(n_features, n_features)), dtype=tf.double)
+
+    n_trained = 0
+    for x_batch, y_batch in batches:
+        x_batch = tf.constant(x_batch, dtype=tf.double)
+        y_batch = tf.constant(y_batch, dtype=tf.double)
+
+        with tf.GradientTape() as tape:
+            c = tf.constant(0, dtype=tf.double)
+            for x, y in zip(x_batch, y_batch):
+                prediction = quantum_model(tf.linalg.matvec(w_classical, x), w_quantum)
+                c = c + (prediction - y) ** 2
+            loss = c / len(x_batch)
+
+        grad_qu, grad_class = tape.gradient(loss, [w_quantum, w_classical])
+        w_quantum.assign_sub(0.05 * grad_qu)
+        w_classical.assign_sub(0.05 * grad_class)
+        n_trained += len(x_batch)
+
+    return n_trained
+
+
+def _streaming_torch(quantum_model, batches, n_features):
+    """Mini-batch training with torch interface."""
+
+    import torch
+
+    w_quantum = torch.tensor(
+        random(size=(n_features, n_features)), requires_grad=True, dtype=torch.double
+    )
+    w_classical = torch.tensor(
+        random(size=(n_features, n_features)), requires_grad=True, dtype=torch.double
+    )
+
+    n_trained = 0
+    for x_batch, y_batch in batches:
+        x_batch = torch.tensor(x_batch, dtype=torch.double)
+        y_batch = torch.tensor(y_batch, dtype=torch.double)
+
+        c = torch.tensor(0, dtype=torch.double)
+        for x, y in zip(x_batch, y_batch):
+            prediction = quantum_model(torch.matmul(w_classical, x), w_quantum)
+            c = c + (prediction - y) ** 2
+        loss = c / len(x_batch)
+        loss.backward()
+
+        w_quantum.data -= 0.05 * w_quantum.grad
+        w_classical.data -= 0.05 * w_classical.grad
+        w_quantum.grad = None
+        w_classical.grad = None
+        n_trained += len(x_batch)
+
+    return n_trained
+
+
+def benchmark_streaming_ml(hyperparams={}, num_repeats=1):
+    """Trains the hybrid quantum-classical model of `benchmark_machine_learning` with mini-batch
+    gradient descent on a dataset that is streamed in chunks instead of held in memory.
+
+    Args:
+    hyperparams (dict): hyperparameters to configure this benchmark
+
+            * 'n_features': Number of features of each data sample. Defaults to 4.
+
+            * 'n_samples': Number of data samples in the dataset. Defaults to 10000.
+
+            * 'batch_size': Number of samples per gradient step. Defaults to 32.
+
+            * 'chunk_size': Number of samples generated at once. Defaults to 4096.
+
+            * 'n_epochs': Number of passes over the dataset. Defaults to 1.
+
+            * 'max_batches': Number of batches after which an epoch is stopped early. Defaults
+              to None, which trains on the full dataset in every epoch.
+
+            * 'seed': seed of the dataset. Defaults to 42.
+
+            * 'diff_method': name of differentiation method. Defaults to 'best'.
+
+            * 'device': device on which the circuit is run, or valid device name. Defaults to 'default.qubit.
+
+            * 'interface': name of the interface to use. Defaults to 'autograd'.
+
+    num_repeats (int): How often the training is repeated in a for loop. Default is 1.
+
+    Returns:
+            int: number of samples trained on in the last repetition
+    """
+
+    dataset, schedule, device, diff_method, interface = _streaming_ml_defaults(hyperparams)
+    n_features = dataset["n_features"]
+
+    @qml.qnode(device, interface=interface, diff_method=diff_method)
+    def quantum_model(x, params):
+        qml.templates.AngleEmbedding(x, wires=range(len(x)))
+        qml.templates.BasicEntanglerLayers(params, wires=range(len(x)))
+        return qml.expval(qml.PauliZ(0))
+
+    def epoch():
+        batches = iterate_batches(stream_dataset(**dataset), schedule["batch_size"])
+        return islice(batches, schedule["max_batches"])
+
+    trainers = {"autograd": _streaming_autograd, "tf": _streaming_tf, "torch": _streaming_torch}
+
+    n_trained = 0
+    for _ in range(num_repeats):
+        batches = chain.from_iterable(epoch() for _ in range(schedule["n_epochs"]))
+        n_trained = trainers[interface](quantum_model, batches, n_features)
+
+    return n_trained
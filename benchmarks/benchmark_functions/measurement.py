@@ -0,0 +1,598 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Helper functions that measure quantities of a workload other than its wall time, used by the
+`track_` benchmarks of the suites.
+"""
+import functools
+import gc
+import glob
+import hashlib
+import math
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+# environment variable selecting the resource metrics recorded next to the wall time, either a
+# comma-separated list of entries of ``RESOURCE_METRICS`` or 'all'
+RESOURCE_VARIABLE = "PL_BENCHMARK_RESOURCES"
+
+# maps the resource metrics to their units
+RESOURCE_METRICS = {
+    "user_time": "seconds",
+    "system_time": "seconds",
+    "voluntary_switches": "switches",
+    "involuntary_switches": "switches",
+    "peak_threads": "threads",
+    "cpu_efficiency": "cpu seconds per second",
+}
+
+# environment variable holding the target relative width of the confidence interval of the median
+# wall time, which enables the adaptive sampling of `with_adaptive_sampling`
+ADAPTIVE_VARIABLE = "PL_BENCHMARK_ADAPTIVE"
+
+# z-value of the two-sided 95% confidence interval
+_Z_95 = 1.96
+
+# environment variable holding the number of iterations of the soak tests, which enables them
+SOAK_VARIABLE = "PL_BENCHMARK_SOAK"
+
+# directory holding the results shared between the benchmarks of a parameter combination
+SHARED_RESULTS_DIR = os.path.join(tempfile.gettempdir(), "pennylane-benchmarks-shared")
+
+# age in seconds after which shared results are removed
+_SHARED_RESULTS_MAX_AGE = 24 * 3600
+
+
+def peak_memory(fn, *args, **kwargs):
+    """Runs a workload and measures the peak memory it allocates.
+
+    The memory is traced with `tracemalloc`, which covers the Python and NumPy allocations of the
+    workload but not memory held by the interpreter before it started. Allocations made by
+    libraries that bypass Python's allocators (like TensorFlow or Torch) are not included.
+
+    Args:
+            fn (callable): workload to run
+            *args: positional arguments passed to the workload
+            **kwargs: keyword arguments passed to the workload
+
+    Returns:
+            tuple: the result of the workload and its peak memory in bytes
+    """
+    tracemalloc.start()
+    try:
+        result = fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, peak
+
+
+def wall_time(fn, *args, **kwargs):
+    """Runs a workload and measures its wall time.
+
+    Args:
+            fn (callable): workload to run
+            *args: positional arguments passed to the workload
+            **kwargs: keyword arguments passed to the workload
+
+    Returns:
+            tuple: the result of the workload and its wall time in seconds
+    """
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+# maps the devices whose state tracemalloc can see, since it is held in NumPy arrays, to the number
+# of complex128 entries of their state on ``n`` wires
+PYTHON_STATE_DEVICES = {
+    "default.qubit": lambda n: 2 ** n,
+    "default.qubit.autograd": lambda n: 2 ** n,
+    "default.mixed": lambda n: 4 ** n,
+}
+
+
+# second difference of the state size over the width in bytes below which `memory_amplification`
+# reports no value
+MIN_AMPLIFICATION_STATE_BYTES = 4 * 1024
+
+
+def state_size(device, n_wires):
+    """Returns the theoretical memory in bytes of the complex128 state of a device on ``n_wires``
+    qubits, which is a state vector or, for 'default.mixed', a density matrix.
+
+    Args:
+            device (str): name of a device in ``PYTHON_STATE_DEVICES``
+            n_wires (int): number of qubits
+
+    Raises:
+            ValueError: if the device keeps its state outside of the memory traced by
+            `tracemalloc`, like devices with native simulators
+    """
+    if device not in PYTHON_STATE_DEVICES:
+        raise ValueError(
+            "The state of {} is not traced by tracemalloc; choose one of {}.".format(
+                device, list(PYTHON_STATE_DEVICES)
+            )
+        )
+    return PYTHON_STATE_DEVICES[device](n_wires) * 16
+
+
+def memory_amplification(fn, n_wires, hyperparams):
+    """Runs a workload and estimates how many copies of the state of the device it keeps alive.
+
+    The workload runs with the same number of layers on ``n_wires``, ``n_wires - 1`` and
+    ``n_wires - 2`` wires. The fixed memory cost of constructing devices, QNodes and tapes cancels
+    in the differences of their peak memory, and the cost of the Python objects of the gates,
+    which grows linearly with the width, cancels in the second difference. The number of copies
+    is the second difference of the peak memory divided by that of the theoretical state size.
+    Below a second difference of the state size of ``MIN_AMPLIFICATION_STATE_BYTES``, no value is
+    returned, since the estimate is dominated by noise.
+
+    Args:
+            fn (callable): workload taking a dictionary of hyperparameters, like `benchmark_circuit`
+            n_wires (int): number of qubits the workload simulates
+            hyperparams (dict): hyperparameters passed to the workload, whose 'n_wires' entry is
+                    replaced. The 'device' entry must be the name of a device in
+                    ``PYTHON_STATE_DEVICES`` and defaults to 'default.qubit'.
+
+    Returns:
+            float: the number of state copies, or None if the state is too small, which asv
+            records as no value
+    """
+    device = hyperparams.get("device", "default.qubit")
+    widths = [n_wires - 2, n_wires - 1, n_wires]
+    if widths[0] < 1:
+        return None
+
+    sizes = [state_size(device, n) for n in widths]
+    size_curvature = sizes[2] - 2 * sizes[1] + sizes[0]
+    if size_curvature < MIN_AMPLIFICATION_STATE_BYTES:
+        return None
+
+    peaks = [peak_memory(fn, dict(hyperparams, n_wires=n))[1] for n in widths]
+    return (peaks[2] - 2 * peaks[1] + peaks[0]) / size_curvature
+
+
+def checked_executions(count):
+    """Returns a number of circuit executions, making sure that it is not zero. A count of zero
+    means that the executions were read from a device the workload did not run on.
+
+    Args:
+            count (int): number of circuit executions
+    """
+    if not count:
+        raise RuntimeError("No circuit executions were counted on the device of the workload.")
+    return count
+
+
+def _run_token():
+    """Returns a token identifying the asv run that launched the benchmark process.
+
+    The token is the process id of the parent process, which asv starts for every run, together
+    with the start time of that process where `/proc` provides it, so that a later run whose
+    parent reuses the process id gets a different token.
+    """
+    ppid = os.getppid()
+    try:
+        with open("/proc/{}/stat".format(ppid)) as f:
+            # the fields after the parenthesized command name start with the third field of the
+            # file, and the start time is the 22nd field
+            start_time = f.read().rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        start_time = None
+    return ppid, start_time
+
+
+def shared_result(benchmark, params, compute):
+    """Computes the result of a workload once per asv run and parameter combination, and shares
+    it between the benchmarks of a class that report different fields of it.
+
+    asv runs every benchmark and parameter combination in a separate process and calls `setup` in
+    each of them, so a result computed in `setup` would be recomputed for every metric, and the
+    metrics would describe different runs. Instead, the first benchmark of a combination computes
+    the result and stores it in ``SHARED_RESULTS_DIR``, keyed by the class, the parameters, the
+    commit, the environment and a token of the asv run, and the following ones load it. Results
+    are not removed by their consumers, since skipped or failing benchmarks and runs of a subset
+    of the benchmarks never consume them; every call removes the results that are older than a
+    day instead.
+
+    Args:
+            benchmark (object): instance of the asv benchmark class
+            params (tuple): parameters of the combination
+            compute (callable): function without arguments that computes the result
+
+    Returns:
+            object: the result
+    """
+    cls = type(benchmark)
+    key = repr(
+        (
+            cls.__module__,
+            cls.__qualname__,
+            params,
+            _run_token(),
+            os.environ.get("ASV_COMMIT"),
+            os.environ.get("ASV_ENV_NAME"),
+        )
+    )
+    path = os.path.join(SHARED_RESULTS_DIR, hashlib.sha256(key.encode()).hexdigest() + ".pkl")
+
+    # includes the temporary files of benchmarks that were killed while writing
+    for stale in glob.glob(os.path.join(SHARED_RESULTS_DIR, "*")):
+        try:
+            if time.time() - os.path.getmtime(stale) > _SHARED_RESULTS_MAX_AGE:
+                os.remove(stale)
+        except OSError:
+            continue
+
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    result = compute()
+
+    # written to a temporary file first, so that a benchmark of a parallel run never reads a
+    # partially written result
+    os.makedirs(SHARED_RESULTS_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=SHARED_RESULTS_DIR, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump(result, f)
+    os.replace(tmp_path, path)
+
+    return result
+
+
+def retained_memory(fn, *args, **kwargs):
+    """Runs a workload and measures the memory that is still allocated when it returns, for
+    example by caches that its result keeps alive.
+
+    Args:
+            fn (callable): workload to run
+            *args: positional arguments passed to the workload
+            **kwargs: keyword arguments passed to the workload
+
+    Returns:
+            tuple: the result of the workload and the memory in bytes it retains
+    """
+    tracemalloc.start()
+    try:
+        result = fn(*args, **kwargs)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, current
+
+
+def _thread_count():
+    """Returns the number of threads of the process, including threads not started by Python."""
+    try:
+        return len(os.listdir("/proc/self/task"))
+    except OSError:
+        return threading.active_count()
+
+
+def resource_usage(fn, *args, **kwargs):
+    """Runs a workload and measures the resources the process uses while running it.
+
+    The CPU times and context switches are taken from `getrusage` and cover all threads of the
+    process. The thread count is sampled every millisecond from `/proc`, not counting the
+    sampling thread itself.
+
+    Args:
+            fn (callable): workload to run
+            *args: positional arguments passed to the workload
+            **kwargs: keyword arguments passed to the workload
+
+    Returns:
+            tuple: the result of the workload and a dictionary with the keys of ``RESOURCE_METRICS``
+    """
+    if resource is None:
+        raise RuntimeError("Resource accounting requires the resource module of Unix systems.")
+
+    peak_threads = [_thread_count()]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(0.001):
+            peak_threads.append(_thread_count() - 1)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+
+    before = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        done.set()
+        sampler.join()
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF)
+
+    user_time = after.ru_utime - before.ru_utime
+    system_time = after.ru_stime - before.ru_stime
+
+    return result, {
+        "user_time": user_time,
+        "system_time": system_time,
+        "voluntary_switches": after.ru_nvcsw - before.ru_nvcsw,
+        "involuntary_switches": after.ru_nivcsw - before.ru_nivcsw,
+        "peak_threads": max(peak_threads),
+        "cpu_efficiency": (user_time + system_time) / elapsed,
+    }
+
+
+def _selected_resource_metrics():
+    """Returns the resource metrics selected by the PL_BENCHMARK_RESOURCES environment variable."""
+    selection = os.environ.get(RESOURCE_VARIABLE, "").strip()
+    if not selection or resource is None:
+        return []
+    if selection.lower() in ("all", "1", "true"):
+        return list(RESOURCE_METRICS)
+    return [m.strip() for m in selection.split(",") if m.strip() in RESOURCE_METRICS]
+
+
+def with_resource_tracking(cls):
+    """Class decorator that adds a `track_` benchmark for every `time_` benchmark of an asv suite
+    and every resource metric selected by the PL_BENCHMARK_RESOURCES environment variable.
+
+    For example, with ``PL_BENCHMARK_RESOURCES=peak_threads,cpu_efficiency`` the method
+    ``time_circuit`` gets the companions ``track_circuit_peak_threads`` and
+    ``track_circuit_cpu_efficiency``. Without the variable, the class is returned unchanged.
+
+    Args:
+            cls (type): asv benchmark class
+    """
+    metrics = _selected_resource_metrics()
+
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("time_") or not callable(method):
+            continue
+
+        for metric in metrics:
+
+            @functools.wraps(method)
+            def track(self, *args, _method=method, _metric=metric):
+                _, usage = resource_usage(_method, self, *args)
+                return usage[_metric]
+
+            track_name = "track_{}_{}".format(name[len("time_") :], metric)
+            track.__name__ = track_name
+            track.__doc__ = "Track the {} of the workload of {}.".format(
+                metric.replace("_", " "), name
+            )
+            track.unit = RESOURCE_METRICS[metric]
+            setattr(cls, track_name, track)
+
+    return cls
+
+
+def median_confidence_interval(samples):
+    """Computes the distribution-free 95% confidence interval of the median of samples from the
+    order statistics that enclose it.
+
+    Args:
+            samples (list[float]): samples
+
+    Returns:
+            tuple: the lower and upper bound, or None if there are too few samples (less than 8)
+    """
+    n = len(samples)
+    low = math.floor((n - _Z_95 * math.sqrt(n)) / 2)
+    high = math.ceil((n + _Z_95 * math.sqrt(n)) / 2)
+    if low < 1 or high > n:
+        return None
+
+    ordered = sorted(samples)
+    return ordered[low - 1], ordered[high - 1]
+
+
+def adaptive_sample(fn, args=(), target=0.05, budget=30.0, max_samples=10000, setup=None):
+    """Times a workload repeatedly until the confidence interval of the median wall time is
+    narrower than the target, or the time budget is used up.
+
+    Args:
+            fn (callable): workload to run
+            args (tuple): positional arguments passed to the workload
+            target (float): width of the confidence interval relative to the median at which the
+                    sampling stops
+            budget (float): time in seconds after which the sampling stops
+            max_samples (int): number of samples after which the sampling stops
+            setup (callable): function called with ``args`` before every sample and not timed,
+                    for workloads that change their operands
+
+    Returns:
+            dict: the median in seconds ('median'), the relative width of its 95% confidence
+            interval ('ci_width', infinite if there were too few samples) and the number of
+            samples ('n_samples')
+    """
+    samples = []
+    width = math.inf
+    start = time.perf_counter()
+
+    while len(samples) < max_samples:
+        if setup is not None:
+            setup(*args)
+
+        sample_start = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - sample_start)
+
+        interval = median_confidence_interval(samples)
+        if interval is not None:
+            median = sorted(samples)[len(samples) // 2]
+            width = (interval[1] - interval[0]) / median if median else 0.0
+            if width <= target:
+                break
+
+        if time.perf_counter() - start >= budget:
+            break
+
+    ordered = sorted(samples)
+    return {"median": ordered[len(ordered) // 2], "ci_width": width, "n_samples": len(samples)}
+
+
+def with_adaptive_sampling(cls):
+    """Class decorator that adds adaptively sampled companions to every `time_` benchmark of an
+    asv suite if the PL_BENCHMARK_ADAPTIVE environment variable is set.
+
+    The variable holds the target relative width of the 95% confidence interval of the median,
+    like ``PL_BENCHMARK_ADAPTIVE=0.05``. The method ``time_circuit`` then gets the companions
+    ``track_circuit_median``, which samples until the target or the time budget is reached, and
+    ``track_circuit_ci_width``, which reports the achieved width of the same run. The budget is the
+    ``sample_budget`` attribute of the class in seconds, and defaults to half of its timeout.
+    Like asv, the sampling calls `setup` before every sample of classes with ``number = 1``.
+    Without the variable, the class is returned unchanged.
+
+    Args:
+            cls (type): asv benchmark class
+    """
+    target = os.environ.get(ADAPTIVE_VARIABLE, "").strip()
+    if not target:
+        return cls
+
+    target = float(target)
+    budget = getattr(cls, "sample_budget", getattr(cls, "timeout", 60) / 2)
+    setup = getattr(cls, "setup", None) if getattr(cls, "number", 0) == 1 else None
+
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("time_") or not callable(method):
+            continue
+
+        for key, unit in [("median", "seconds"), ("ci_width", "relative width")]:
+
+            @functools.wraps(method)
+            def track(self, *args, _name=name, _method=method, _key=key):
+                # both companions report the same sampling run
+                result = shared_result(
+                    self,
+                    (_name,) + args,
+                    lambda: adaptive_sample(_method, (self,) + args, target, budget, setup=setup),
+                )
+                return result[_key]
+
+            track_name = "track_{}_{}".format(name[len("time_") :], key)
+            track.__name__ = track_name
+            track.__doc__ = "Track the adaptively sampled {} of the wall time of {}.".format(
+                "median" if key == "median" else "confidence interval width", name
+            )
+            track.unit = unit
+            setattr(cls, track_name, track)
+
+    return cls
+
+
+def rss_bytes():
+    """Returns the resident set size of the process in bytes.
+
+    Without `/proc`, the peak resident set size reported by `getrusage` is returned instead,
+    which still grows with a leak but never shrinks.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        raise RuntimeError("Measuring the resident set size requires /proc or the resource module.")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _slope(xs, ys):
+    """Returns the least-squares slope of ``ys`` over ``xs``."""
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    if not variance:
+        return 0.0
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / variance
+
+
+def soak(step, n_iterations=10000, n_samples=20, n_top=10):
+    """Runs one iteration of a long-lived workload many times and measures how its memory and
+    latency evolve.
+
+    After every window of ``n_iterations // n_samples`` iterations, garbage is collected and the
+    resident set size, the memory traced by `tracemalloc` and the mean latency of the window are
+    sampled. The first window is treated as warm-up, since it fills caches that are expected to
+    persist. Growth rates are the least-squares slopes over the remaining samples, so a single
+    outlier does not look like a leak. Latencies are measured while `tracemalloc` is tracing and
+    are therefore only comparable between windows of the same run.
+
+    Args:
+            step (callable): function without arguments running one iteration of the workload
+            n_iterations (int): number of iterations
+            n_samples (int): number of samples, at least 3
+            n_top (int): number of source lines reported in 'top_growth'
+
+    Returns:
+            dict: the growth of the resident set size ('rss_growth') and the traced memory
+            ('traced_growth') in bytes per iteration, the relative change of the mean latency
+            between the first window after warm-up and the last window ('latency_drift'), and
+            the source lines whose traced memory grew most after warm-up ('top_growth')
+    """
+    window = max(n_iterations // n_samples, 1)
+    iterations, rss, traced, latencies = [], [], [], []
+    first_snapshot = None
+
+    tracemalloc.start()
+    try:
+        for idx in range(n_samples):
+            start = time.perf_counter()
+            for _ in range(window):
+                step()
+            latencies.append((time.perf_counter() - start) / window)
+
+            gc.collect()
+            iterations.append((idx + 1) * window)
+            rss.append(rss_bytes())
+            traced.append(tracemalloc.get_traced_memory()[0])
+            if idx == 0:
+                first_snapshot = tracemalloc.take_snapshot()
+
+        last_snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    top_growth = [
+        (str(stat.traceback), stat.size_diff)
+        for stat in last_snapshot.compare_to(first_snapshot, "lineno")[:n_top]
+        if stat.size_diff > 0
+    ]
+
+    return {
+        "rss_growth": _slope(iterations[1:], rss[1:]),
+        "traced_growth": _slope(iterations[1:], traced[1:]),
+        "latency_drift": latencies[-1] / latencies[1] - 1,
+        "top_growth": top_growth,
+    }
@@ -0,0 +1,119 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for noisy circuit evaluations on mixed-state devices.
+"""
+import numpy as np
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from pennylane.templates import BasicEntanglerLayers
+from .default_settings import _noise_defaults
+
+CHANNELS = ["depolarizing", "amplitude_damping", "kraus"]
+
+
+def _apply_channel(channel, p, wire):
+    """Applies a noise channel of strength p to a single wire."""
+    if channel == "depolarizing":
+        qml.DepolarizingChannel(p, wires=wire)
+    elif channel == "amplitude_damping":
+        qml.AmplitudeDamping(p, wires=wire)
+    elif channel == "kraus":
+        # custom bit-phase flip channel given by its Kraus operators
+        K0 = np.sqrt(1 - p) * np.eye(2)
+        K1 = np.sqrt(p) * np.array([[0, -1j], [1j, 0]])
+        qml.QubitChannel([K0, K1], wires=wire)
+    else:
+        raise ValueError("Unknown channel {}; choose one of {}.".format(channel, CHANNELS))
+
+
+def benchmark_noisy_circuit(hyperparams={}, num_repeats=1, gradient=False):
+    """Evaluates a circuit with noise channels inserted after each layer.
+
+    Unless otherwise specified by the hyperparameters, the circuit consists of 6 layers of
+    `BasicEntanglerLayers` run on 4 qubits of a 'default.mixed' device, each followed by a
+    depolarizing channel of strength 0.1 on every wire, and measures the Pauli-Z observable of the
+    first wire. The autograd interface is used throughout.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark
+
+                    * 'n_wires': Number of wires to use
+
+                    * 'n_layers': Number of layers. Will be ignored if custom params are provided.
+
+                    * 'diff_method': name of differentiation method
+
+                    * 'device': mixed-state device on which the circuit is run, or valid device name
+
+                    * 'params': Numpy array of trainable parameters of shape (n_layers, n_wires)
+
+                    * 'channel': one of 'depolarizing', 'amplitude_damping' or 'kraus'
+
+                    * 'density': fraction of the wires that receive a channel after each layer
+
+                    * 'noise_strength': parameter of the noise channels
+
+            num_repeats (int): How often the same circuit is evaluated in a for loop. Default is 1.
+
+            gradient (bool): Whether to compute the gradient through the channels instead of
+                    only evaluating the circuit.
+
+    Returns:
+            int: number of channel applications in a single circuit evaluation
+    """
+    circuit, n_channels = prepare_noisy_circuit(hyperparams, gradient=gradient)
+
+    for _ in range(num_repeats):
+        circuit()
+
+    return n_channels
+
+
+def prepare_noisy_circuit(hyperparams={}, gradient=False, noiseless=False):
+    """Constructs the device and QNode of `benchmark_noisy_circuit`, so that only the evaluation
+    or gradient of the circuit is timed.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see
+                    `benchmark_noisy_circuit`
+            gradient (bool): Whether to compute the gradient through the channels instead of
+                    only evaluating the circuit.
+            noiseless (bool): Whether to leave out the channels, which gives the baseline of the
+                    same circuit on the same device for the cost of the channels.
+
+    Returns:
+            tuple[callable, int]: function without arguments that evaluates the circuit or its
+            gradient, and the number of channel applications of the noisy circuit
+    """
+    device, diff_method, params, channel, noisy_wires, p = _noise_defaults(hyperparams)
+    wires = range(len(device.wires))
+    channel_wires = [] if noiseless else noisy_wires
+
+    @qml.qnode(device, interface="autograd", diff_method=diff_method)
+    def circuit(params_):
+        for layer in range(len(params_)):
+            BasicEntanglerLayers(params_[layer : layer + 1], wires=wires)
+            for w in channel_wires:
+                _apply_channel(channel, p, w)
+        return qml.expval(qml.PauliZ(0))
+
+    params = pnp.array(params, requires_grad=True)
+    n_channels = len(params) * len(noisy_wires)
+
+    if gradient:
+        gradient_fn = qml.grad(circuit)
+        return lambda: gradient_fn(params), n_channels
+    return lambda: circuit(params), n_channels
@@ -21,10 +21,37 @@ import tensorflow as tf
 import torch
 from pennylane import numpy as pnp
 from .default_settings import _core_defaults
+from .optimizers import make_optimizer, optimizer_step
+
+
+def prepare_optimization(hyperparams={}, stepsize=0.1):
+    """Constructs the QNode and optimizer of `benchmark_optimization` for the autograd interface, so
+    that the optimization steps can be timed without their construction.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see
+                    `benchmark_optimization`
+            stepsize (float): step size of the gradient-based optimizers
+
+    Returns:
+            tuple: the optimizer, the QNode and its initial trainable parameters
+    """
+    optimizer = hyperparams.pop("optimizer", "gradient_descent")
+
+    device, diff_method, _, params, template, measurement = _core_defaults(hyperparams)
+
+    @qml.qnode(device, interface="autograd", diff_method=diff_method)
+    def circuit(params_):
+        template(params_)
+        measurement.queue()
+        return measurement
+
+    return make_optimizer(optimizer, stepsize), circuit, pnp.array(params, requires_grad=True)
 
 
 def benchmark_optimization(hyperparams={}, n_steps=20, num_repeats=1):
-    """Trains a quantum circuit for n_steps steps with a gradient descent optimizer.
+    """Trains a quantum circuit for n_steps steps with a gradient descent optimizer, or with the
+    optimizer given by the 'optimizer' hyperparameter for the autograd interface.
 
     Args:
     hyperparams (dict): hyperparameters to configure this benchmark
@@ -40,14 +67,22 @@ def benchmark_optimization(hyperparams={}, n_steps=20, num_repeats=1):
             * 'interface': name of the interface to use
 
             * 'template': Template to use. The template must take the trainable parameters as its only argument.
+              Alternatively, the name of a circuit family in `circuit_families.CIRCUIT_FAMILIES`.
 
             * 'params': Numpy array of trainable parameters that is fed into the template.
 
             * 'measurement': measurement function like `qml.expval(qml.PauliZ(0)))`
 
+            * 'optimizer': name of the optimizer, one of `optimizers.OPTIMIZERS`. Only used with the
+              autograd interface. Defaults to 'gradient_descent'.
+
     n_steps (int): number of optimization steps
     num_repeats (int): How often the same circuit is evaluated in a for loop. Default is 1.
+
+    Returns:
+    int: number of circuit executions on the device used by the QNode
     """
+    optimizer = hyperparams.pop("optimizer", "gradient_descent")
 
     device, diff_method, interface, params, template, measurement = _core_defaults(hyperparams)
 
@@ -61,10 +96,10 @@ def benchmark_optimization(hyperparams={}, n_steps=20, num_repeats=1):
 
         if interface == "autograd":
             params = pnp.array(params, requires_grad=True)
-            opt = qml.GradientDescentOptimizer(stepsize=0.1)
+            opt = make_optimizer(optimizer, stepsize=0.1)
 
             for i in range(n_steps):
-                params = opt.step(circuit, params)
+                params, _ = optimizer_step(opt, circuit, params)
 
         elif interface == "tf":
             params = tf.Variable(params)
@@ -90,3 +125,5 @@ def benchmark_optimization(hyperparams={}, n_steps=20, num_repeats=1):
                 opt.step(closure)
 
     # TODO: jax
+
+    return circuit.device.num_executions
@@ -0,0 +1,135 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Construction of the PennyLane optimizers compared by the benchmarks, and benchmarks for the
+metric tensor used by the quantum natural gradient optimizer.
+"""
+import inspect
+import time
+
+import numpy as np
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from .compat import metric_tensor, num_executions
+from .default_settings import _core_defaults
+
+OPTIMIZERS = ["gradient_descent", "adam", "qng", "rotosolve", "spsa"]
+
+
+def make_optimizer(name, stepsize):
+    """Creates one of the optimizers in ``OPTIMIZERS``.
+
+    Args:
+            name (str): name of the optimizer
+            stepsize (float): step size of the gradient-based optimizers. Rotosolve and SPSA use
+                    their default settings.
+    """
+    if name == "gradient_descent":
+        return qml.GradientDescentOptimizer(stepsize=stepsize)
+    if name == "adam":
+        return qml.AdamOptimizer(stepsize=stepsize)
+    if name == "qng":
+        return qml.QNGOptimizer(stepsize=stepsize)
+    if name == "rotosolve":
+        return qml.RotosolveOptimizer()
+    if name == "spsa":
+        if not hasattr(qml, "SPSAOptimizer"):
+            raise ValueError("The SPSA optimizer is not available in this version of PennyLane.")
+        return qml.SPSAOptimizer()
+
+    raise ValueError("Unknown optimizer {}; choose one of {}.".format(name, OPTIMIZERS))
+
+
+def _rotosolve_kwargs(opt, cost_fn, params):
+    """Returns the frequency information that newer versions of the Rotosolve optimizer require.
+    All parameters are assumed to enter the circuit through rotations with a single frequency."""
+    if "nums_frequency" not in inspect.signature(opt.step_and_cost).parameters:
+        return {}
+
+    argname = next(iter(inspect.signature(getattr(cost_fn, "func", cost_fn)).parameters))
+    return {"nums_frequency": {argname: {idx: 1 for idx in np.ndindex(*np.shape(params))}}}
+
+
+def optimizer_step(opt, cost_fn, params):
+    """Performs one optimization step of any of the optimizers in ``OPTIMIZERS``.
+
+    Args:
+            opt (~.GradientDescentOptimizer): optimizer created by `make_optimizer`
+            cost_fn (callable): cost function taking the parameters as only argument
+            params (array): current parameters
+
+    Returns:
+            tuple: the new parameters and the cost before the step
+    """
+    if isinstance(opt, qml.RotosolveOptimizer):
+        return opt.step_and_cost(cost_fn, params, **_rotosolve_kwargs(opt, cost_fn, params))
+
+    return opt.step_and_cost(cost_fn, params)
+
+
+def timed_steps(opt, cost_fn, params, n_steps):
+    """Performs optimization steps with an optimizer and cost function that have already been
+    constructed, and measures the wall time and circuit executions of the same steps.
+
+    Args:
+            opt (~.GradientDescentOptimizer): optimizer created by `make_optimizer`
+            cost_fn (callable): QNode, or cost function created by `expval_cost`
+            params (array): initial parameters
+            n_steps (int): number of optimization steps
+
+    Returns:
+            dict: the wall time of the steps in seconds as 'time', and their circuit executions,
+            counted with `compat.num_executions`, as 'executions'
+    """
+    executions = num_executions(cost_fn)
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        params, _ = optimizer_step(opt, cost_fn, params)
+    elapsed = time.perf_counter() - start
+
+    return {"time": elapsed, "executions": num_executions(cost_fn) - executions}
+
+
+def benchmark_metric_tensor(hyperparams={}, num_repeats=1):
+    """Computes the metric tensor of a quantum circuit, as done in every step of the quantum
+    natural gradient optimizer.
+
+    Unless otherwise specified by the hyperparameters, the circuit consists of 6 layers of `BasicEntanglerLayers`
+    run on 4 qubits, followed by measuring the Pauli-Z observable of the first wire, and is run using
+    a 'default.qubit' device and the autograd interface.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_circuit`
+
+            num_repeats (int): How often the metric tensor is computed in a for loop. Default is 1.
+
+    Returns:
+            int: number of circuit executions on the device used by the QNode
+    """
+    device, diff_method, interface, params, template, measurement = _core_defaults(hyperparams)
+
+    @qml.qnode(device, interface=interface, diff_method=diff_method)
+    def circuit(params_):
+        template(params_)
+        measurement.queue()
+        return measurement
+
+    params = pnp.array(params, requires_grad=True)
+    mt = metric_tensor(circuit)
+
+    for _ in range(num_repeats):
+        mt(params)
+
+    return circuit.device.num_executions
@@ -0,0 +1,109 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the Python overhead of the individual stages of a circuit evaluation.
+"""
+import statistics
+import time
+
+import pennylane as qml
+from .compat import apply_operations, reset_tape_parameters
+from .default_settings import _overhead_defaults
+
+STAGES = ["queuing", "expansion", "parameters", "device_apply"]
+
+
+def _overhead_circuit(params, n_wires):
+    """Queues an alternating sequence of `Rot` and `CNOT` gates, one per row of params."""
+    for k, p in enumerate(params):
+        if k % 2 == 0:
+            qml.Rot(p[0], p[1], p[2], wires=k % n_wires)
+        else:
+            qml.CNOT(wires=[k % n_wires, (k + 1) % n_wires])
+
+
+def _decompose_rot(obj):
+    """Stopping condition for the tape expansion which decomposes `Rot` gates only."""
+    return obj.name != "Rot"
+
+
+def _record_tape(params, n_wires):
+    """Records the overhead circuit followed by a measurement into a new tape."""
+    with qml.tape.QuantumTape() as tape:
+        _overhead_circuit(params, n_wires)
+        qml.expval(qml.PauliZ(0))
+
+    return tape
+
+
+def _run_stage(stage, tape, device, params, n_wires):
+    """Runs a single overhead stage, using the pre-recorded tape for all stages but queuing."""
+    if stage == "queuing":
+        _record_tape(params, n_wires)
+    elif stage == "expansion":
+        tape.expand(depth=1, stop_at=_decompose_rot)
+    elif stage == "parameters":
+        reset_tape_parameters(tape)
+    elif stage == "device_apply":
+        apply_operations(device, tape.operations)
+    else:
+        raise ValueError("Unknown stage {}; choose one of {}.".format(stage, STAGES))
+
+
+def benchmark_overhead_stage(stage, hyperparams={}, num_repeats=1):
+    """Times one stage of the Python overhead of a circuit evaluation and returns the median time
+    spent per operation over the repetitions, after one untimed warm-up run.
+
+    The circuit alternates `Rot` and `CNOT` gates on few wires, so that the simulation cost is
+    negligible compared to the cost of handling the operations in Python. The available stages are
+
+    * 'queuing': recording the operations under the queuing context of a new tape,
+
+    * 'expansion': decomposing every `Rot` gate of the tape into `RZ` and `RY` gates,
+
+    * 'parameters': extracting the parameters of the tape and setting them again,
+
+    * 'device_apply': dispatching the operations to the device's `apply` method.
+
+    Args:
+            stage (str): name of the stage, one of ``STAGES``
+
+            hyperparams (dict): hyperparameters to configure this benchmark
+
+                    * 'n_wires': Number of wires to use. Defaults to 2.
+
+                    * 'n_ops': Number of operations in the circuit. Defaults to 1000.
+
+                    * 'device': device on which the operations are applied, or valid device name
+
+            num_repeats (int): How often the stage is run in a for loop. Default is 1.
+
+    Returns:
+            float: median time per operation in nanoseconds
+
+    Raises:
+            NotImplementedError: if the installed version lacks the API of the stage
+    """
+    n_wires, n_ops, device, params = _overhead_defaults(hyperparams)
+    tape = _record_tape(params, n_wires)
+
+    _run_stage(stage, tape, device, params, n_wires)
+
+    times = []
+    for _ in range(num_repeats):
+        start = time.perf_counter_ns()
+        _run_stage(stage, tape, device, params, n_wires)
+        times.append(time.perf_counter_ns() - start)
+
+    return statistics.median(times) / n_ops
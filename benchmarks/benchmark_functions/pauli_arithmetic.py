@@ -0,0 +1,154 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the arithmetic of large Hamiltonians built from random k-local Pauli words.
+"""
+import numpy as np
+
+import pennylane as qml
+from .compat import tensor_product
+from .default_settings import _pauli_defaults
+
+PAULIS = [qml.PauliX, qml.PauliY, qml.PauliZ]
+
+OPERATIONS = [
+    "construction",
+    "simplify",
+    "addition",
+    "scalar_multiplication",
+    "tensor_multiplication",
+    "wire_mapping",
+    "equality",
+]
+
+
+def random_pauli_terms(n_terms, n_wires, locality=4, seed=42):
+    """Generates the coefficients and Pauli words of a random Hamiltonian, where every word acts
+    non-trivially on ``locality`` distinct wires. The wires and Paulis of all words are drawn at
+    once, only the observables are created one by one.
+
+    Args:
+            n_terms (int): number of terms
+            n_wires (int): number of wires the words are drawn from
+            locality (int): number of wires of every word
+            seed (int): seed of the random number generator
+
+    Returns:
+            tuple[array, list]: the coefficients and the observables
+    """
+    rng = np.random.default_rng(seed)
+
+    # the first ``locality`` entries of a random permutation per term, in ascending order
+    wires = np.sort(np.argsort(rng.random((n_terms, n_wires)), axis=1)[:, :locality], axis=1)
+    paulis = rng.integers(0, len(PAULIS), size=(n_terms, locality))
+    coeffs = rng.normal(size=n_terms)
+
+    ops = []
+    for word_wires, word_paulis in zip(wires.tolist(), paulis.tolist()):
+        factors = [PAULIS[p](wires=w) for w, p in zip(word_wires, word_paulis)]
+        ops.append(factors[0] if len(factors) == 1 else tensor_product(factors))
+
+    return coeffs, ops
+
+
+def random_hamiltonian(n_terms, n_wires, locality=4, seed=42):
+    """Generates a random Hamiltonian of k-local Pauli words, see `random_pauli_terms`.
+
+    Returns:
+            ~.Hamiltonian: the Hamiltonian
+    """
+    return qml.Hamiltonian(*random_pauli_terms(n_terms, n_wires, locality, seed))
+
+
+def prepare_operation(operation, hyperparams={}):
+    """Creates the operands of an operation on random Hamiltonians, so that only the operation
+    itself is timed.
+
+    Args:
+            operation (str): name of the operation in ``OPERATIONS``. The tensor product is taken
+                    with a 4-term Hamiltonian on other wires, so that the result has four times as
+                    many terms. Equality is checked against an identical copy, which compares all
+                    terms.
+            hyperparams (dict): hyperparameters to configure this benchmark
+
+                    * 'n_terms': Number of terms of the Hamiltonian. Defaults to 1000.
+
+                    * 'n_wires': Number of wires the Pauli words are drawn from. Defaults to 20.
+
+                    * 'locality': Number of wires every Pauli word acts on. Defaults to 4.
+
+                    * 'seed': Seed of the random Hamiltonian. Defaults to 42.
+
+    Returns:
+            callable: function without arguments that performs the operation
+
+    Raises:
+            NotImplementedError: if the installed version does not support the operation
+    """
+    n_terms, n_wires, locality, seed = _pauli_defaults(hyperparams)
+
+    if operation == "construction":
+        coeffs, ops = random_pauli_terms(n_terms, n_wires, locality, seed)
+        return lambda: qml.Hamiltonian(coeffs, ops)
+
+    hamiltonian = random_hamiltonian(n_terms, n_wires, locality, seed)
+
+    if operation == "simplify":
+        if not hasattr(hamiltonian, "simplify"):
+            raise NotImplementedError("Hamiltonian.simplify is not available in this version.")
+        return hamiltonian.simplify
+
+    if operation == "addition":
+        other = random_hamiltonian(n_terms, n_wires, locality, seed + 1)
+        return lambda: hamiltonian + other
+
+    if operation == "scalar_multiplication":
+        return lambda: 0.5 * hamiltonian
+
+    if operation == "tensor_multiplication":
+        # older versions only inherit the tensor product of single observables
+        if "__matmul__" not in vars(qml.Hamiltonian):
+            raise NotImplementedError("Hamiltonian.__matmul__ is not available in this version.")
+        a, b = n_wires, n_wires + 1
+        other = qml.Hamiltonian(
+            [0.1, 0.2, 0.3, 0.4],
+            [qml.PauliZ(a), qml.PauliX(a), qml.PauliZ(b), qml.PauliX(a) @ qml.PauliX(b)],
+        )
+        return lambda: hamiltonian @ other
+
+    if operation == "wire_mapping":
+        if not hasattr(hamiltonian, "map_wires"):
+            raise NotImplementedError("Hamiltonian.map_wires is not available in this version.")
+        wire_map = {w: w + n_wires for w in range(n_wires)}
+        return lambda: hamiltonian.map_wires(wire_map)
+
+    if operation == "equality":
+        other = random_hamiltonian(n_terms, n_wires, locality, seed)
+        return lambda: hamiltonian.compare(other)
+
+    raise ValueError("Unknown operation {}; choose one of {}.".format(operation, OPERATIONS))
+
+
+def benchmark_pauli_operation(operation, hyperparams={}, num_repeats=1):
+    """Performs an operation on random Hamiltonians of k-local Pauli words.
+
+    Args:
+            operation (str): name of the operation in ``OPERATIONS``
+            hyperparams (dict): hyperparameters to configure this benchmark, see `prepare_operation`
+            num_repeats (int): How often the operation is performed in a for loop. Default is 1.
+    """
+    fn = prepare_operation(operation, hyperparams)
+
+    for _ in range(num_repeats):
+        fn()
@@ -17,6 +17,7 @@ import pennylane as qml
 import networkx as nx
 from pennylane import numpy as pnp
 from pennylane import qaoa
+from .compat import device as create_device, expval_cost
 from .hamiltonians import ham_h2
 
 
@@ -35,9 +36,9 @@ def benchmark_casual(dev_name, s3=None):
     diff_method = "best"
 
     if dev_name == "local":
-        device = qml.device("braket.local.qubit", wires=n_wires, shots=None)
+        device = create_device("braket.local.qubit", wires=n_wires, shots=None)
     elif dev_name == "sv1":
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/quantum-simulator/amazon/sv1",
             s3_destination_folder=s3,
@@ -46,7 +47,7 @@ def benchmark_casual(dev_name, s3=None):
         )
     elif dev_name == "tn1":
         shots = 1000
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/quantum-simulator/amazon/tn1",
             s3_destination_folder=s3,
@@ -55,7 +56,7 @@ def benchmark_casual(dev_name, s3=None):
         )
     elif dev_name == "ionq":
         shots = 100
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/qpu/ionq/ionQdevice",
             s3_destination_folder=s3,
@@ -91,10 +92,10 @@ def benchmark_power(dev_name, s3=None):
 
     if dev_name == "local":
         n_wires = 15
-        device = qml.device("braket.local.qubit", wires=n_wires, shots=None)
+        device = create_device("braket.local.qubit", wires=n_wires, shots=None)
     elif dev_name == "sv1":
         n_wires = 15
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/quantum-simulator/amazon/sv1",
             s3_destination_folder=s3,
@@ -104,7 +105,7 @@ def benchmark_power(dev_name, s3=None):
     elif dev_name == "tn1":
         shots = 1000
         n_wires = 15
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/quantum-simulator/amazon/tn1",
             s3_destination_folder=s3,
@@ -114,7 +115,7 @@ def benchmark_power(dev_name, s3=None):
     elif dev_name == "ionq":
         shots = 100
         n_wires = 11
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/qpu/ionq/ionQdevice",
             s3_destination_folder=s3,
@@ -157,9 +158,9 @@ def benchmark_qchem(dev_name, s3=None):
     n_wires = 4
 
     if dev_name == "local":
-        device = qml.device("braket.local.qubit", wires=n_wires, shots=None)
+        device = create_device("braket.local.qubit", wires=n_wires, shots=None)
     elif dev_name == "sv1":
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/quantum-simulator/amazon/sv1",
             s3_destination_folder=s3,
@@ -168,7 +169,7 @@ def benchmark_qchem(dev_name, s3=None):
         )
     elif dev_name == "tn1":
         shots = 1000
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/quantum-simulator/amazon/tn1",
             s3_destination_folder=s3,
@@ -177,7 +178,7 @@ def benchmark_qchem(dev_name, s3=None):
         )
     elif dev_name == "ionq":
         shots = 100
-        device = qml.device(
+        device = create_device(
             "braket.aws.qubit",
             device_arn="arn:aws:braket:::device/qpu/ionq/ionQdevice",
             s3_destination_folder=s3,
@@ -195,7 +196,7 @@ def benchmark_qchem(dev_name, s3=None):
         qml.SingleExcitation(params[2], wires=[1, 3])
 
     params = [0.0] * 3
-    cost_fn = qml.ExpvalCost(circuit, ham_h2, device, optimize=True)
+    cost_fn = expval_cost(circuit, ham_h2, device, optimize=True)
     opt = qml.GradientDescentOptimizer(stepsize=0.5)
 
     for _ in range(1):
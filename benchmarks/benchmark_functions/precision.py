@@ -0,0 +1,100 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the precision per time of shot-based estimates of Hamiltonian expectation values.
+"""
+import time
+
+import networkx as nx
+import numpy as np
+
+from pennylane.templates import BasicEntanglerLayers
+from .compat import expval_cost
+from .default_settings import _estimator_defaults
+from .hamiltonians import ham_h2, ham_lih
+from .qaoa import min_vertex_cover_hamiltonians
+
+
+def estimator_hamiltonian(name):
+    """Returns one of the Hamiltonians whose expectation values are estimated.
+
+    Args:
+            name (str): 'h2' or 'lih' for the molecular Hamiltonians, or 'qaoa' for the cost
+                    Hamiltonian of the minimum vertex cover of a random graph with 8 nodes
+    """
+    if name == "h2":
+        return ham_h2
+    if name == "lih":
+        return ham_lih
+    if name == "qaoa":
+        graph = nx.gnp_random_graph(8, 0.5, seed=42)
+        return min_vertex_cover_hamiltonians(list(graph.nodes), list(graph.edges))[0]
+
+    raise ValueError("Unknown Hamiltonian {}; choose one of 'h2', 'lih' or 'qaoa'.".format(name))
+
+
+def benchmark_estimator(hyperparams={}, n_estimates=100):
+    """Repeatedly estimates the expectation value of a Hamiltonian on a shot-based device, and
+    measures the spread of the estimates and the time they take.
+
+    The state is prepared by `BasicEntanglerLayers` with fixed random parameters on all wires of
+    the Hamiltonian. The product of the variance of the estimates and the time per estimate is
+    independent of the number of shots for a given device and grouping strategy, and is lower for
+    the cheaper way to reach a given precision. The sample variance of normally distributed
+    estimates has a relative standard error of ``sqrt(2 / (n_estimates - 1))``, which is about 14%
+    for the default of 100 estimates.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark
+
+                    * 'hamiltonian': Hamiltonian to measure. Defaults to `ham_h2`.
+
+                    * 'shots': Number of shots of every circuit execution. Defaults to 1000.
+
+                    * 'optimize': Whether qubit-wise commuting terms are measured together.
+                      Defaults to False.
+
+                    * 'n_layers': Number of layers of the state preparation. Defaults to 2.
+
+                    * 'seed': Seed of the parameters of the state preparation. Defaults to 42.
+
+                    * 'device': Device on which the circuits are run, or valid device name.
+                      Defaults to 'default.qubit'.
+
+            n_estimates (int): Number of independent estimates. Defaults to 100.
+
+    Returns:
+            dict: the standard deviation of the estimates ('std_error'), the mean wall time of an
+            estimate in seconds ('time_per_estimate'), and their product of variance and time
+            ('variance_time')
+    """
+    hamiltonian, device, grouping, params = _estimator_defaults(hyperparams)
+
+    def ansatz(params_, wires):
+        BasicEntanglerLayers(params_, wires=wires)
+
+    cost_fn = expval_cost(ansatz, hamiltonian, device, optimize=grouping)
+
+    estimates = []
+    start = time.perf_counter()
+    for _ in range(n_estimates):
+        estimates.append(float(cost_fn(params)))
+    time_per_estimate = (time.perf_counter() - start) / n_estimates
+
+    variance = np.var(estimates, ddof=1)
+    return {
+        "std_error": float(np.sqrt(variance)),
+        "time_per_estimate": time_per_estimate,
+        "variance_time": float(variance * time_per_estimate),
+    }
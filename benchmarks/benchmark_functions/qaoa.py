@@ -14,11 +14,29 @@
 """
 Benchmarks for QAOA optimizations.
 """
+import networkx as nx
+
 import pennylane as qml
 from pennylane import qaoa
+from .artifacts import cached
 from .default_settings import _qaoa_defaults
 
 
+@cached("min_vertex_cover")
+def min_vertex_cover_hamiltonians(nodes, edges):
+    """Returns the cost and mixer Hamiltonians of the unconstrained minimum vertex cover problem
+    of a graph, stored in the artifact cache.
+
+    Args:
+            nodes (list): nodes of the graph
+            edges (list): edges of the graph as pairs of nodes
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+    return qaoa.min_vertex_cover(graph, constrained=False)
+
+
 def benchmark_qaoa(hyperparams={}):
     """
     Performs QAOA optimizations.
@@ -37,11 +55,17 @@ def benchmark_qaoa(hyperparams={}):
                     * 'interface': Name of the interface to use
 
                     * 'diff_method': Name of differentiation method
+
+                    * 'hamiltonians': Cost and mixer Hamiltonians of the graph, for example from
+                      `min_vertex_cover_hamiltonians`. Computed from the graph if not provided.
     """
+    hamiltonians = hyperparams.pop("hamiltonians", None)
 
     graph, n_layers, params, device, options_dict = _qaoa_defaults(hyperparams)
 
-    H_cost, H_mixer = qaoa.min_vertex_cover(graph, constrained=False)
+    if hamiltonians is None:
+        hamiltonians = qaoa.min_vertex_cover(graph, constrained=False)
+    H_cost, H_mixer = hamiltonians
 
     n_wires = len(graph.nodes)
 
@@ -0,0 +1,290 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Capture of executed quantum tapes to trace files, and benchmarks replaying those traces.
+
+A trace file stores one JSON record per line, and is gzip-compressed if its name ends with '.gz'.
+Each record describes one executed tape:
+
+* 'ops': list of ``[name, wires, params]`` entries, where the names of inverted operations end
+  with '.inv',
+
+* 'measurements': list of ``[return_type, observable_names, wires, observable_params]`` entries,
+  where ``observable_names`` and ``observable_params`` hold the names and parameters of the
+  factors of the observable, and ``observable_names`` is None for measurements without
+  observable like `qml.probs`,
+
+* 'trainable_params': indices of the trainable tape parameters,
+
+* 'num_wires': number of wires of the device that executed the tape,
+
+* 'shots': shots of the device that executed the tape, or None for analytic execution,
+
+* 'diff_method': differentiation method given when capturing, or None.
+"""
+import contextlib
+import gzip
+import itertools
+import json
+
+import numpy as np
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from .compat import device as create_device, inverse, is_analytic, qnode_tape
+from .default_settings import _replay_defaults
+
+# return types that support differentiation when replaying a tape
+_DIFFERENTIABLE = {"expval", "var", "probs"}
+
+_MEASUREMENTS = {
+    "expval": qml.expval,
+    "var": qml.var,
+    "sample": qml.sample,
+}
+
+
+def _open(path, mode):
+    """Opens a trace file for streaming text, compressed if its name ends with '.gz'."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t")
+    return open(path, mode)
+
+
+def _to_serializable(param):
+    """Unwraps a parameter from the autodiff framework wrapping it and converts it to
+    a JSON-serializable value."""
+    while hasattr(param, "_value"):
+        # autograd ArrayBox
+        param = param._value
+    if hasattr(param, "detach"):
+        param = param.detach()
+    if hasattr(param, "numpy"):
+        param = param.numpy()
+
+    param = np.asarray(param)
+    if np.iscomplexobj(param):
+        return {"real": param.real.tolist(), "imag": param.imag.tolist()}
+    return param.tolist()
+
+
+def _from_serializable(param):
+    """Inverse of ``_to_serializable``."""
+    if isinstance(param, dict):
+        return np.array(param["real"]) + 1j * np.array(param["imag"])
+    if isinstance(param, list):
+        return np.array(param)
+    return param
+
+
+def _observable_factors(obs):
+    """Returns the factors of an observable."""
+    if obs is None:
+        return []
+    return list(getattr(obs, "obs", [obs]))
+
+
+def _operation(name):
+    """Returns a function creating the operation of a trace record name."""
+    if name.endswith(".inv"):
+        op_class = getattr(qml, name[: -len(".inv")])
+        return lambda *args, **kwargs: inverse(op_class(*args, **kwargs))
+    return getattr(qml, name)
+
+
+def tape_to_record(tape, device, diff_method=None):
+    """Converts an executed tape into a JSON-serializable trace record.
+
+    Args:
+            tape (~.QuantumTape): executed tape
+            device (~.Device): device that executed the tape
+            diff_method (str): differentiation method used for the tape, if known
+    """
+    ops = [
+        [op.name, op.wires.tolist(), [_to_serializable(p) for p in op.parameters]]
+        for op in tape.operations
+    ]
+
+    measurements = []
+    for m in tape.measurements:
+        factors = _observable_factors(m.obs)
+        obs_names = [f.name for f in factors] if factors else None
+        obs_params = [[_to_serializable(p) for p in f.parameters] for f in factors]
+        measurements.append([m.return_type.value.lower(), obs_names, m.wires.tolist(), obs_params])
+
+    return {
+        "ops": ops,
+        "measurements": measurements,
+        "trainable_params": sorted(tape.trainable_params),
+        "num_wires": len(device.wires),
+        "shots": None if is_analytic(device) else device.shots,
+        "diff_method": diff_method,
+    }
+
+
+@contextlib.contextmanager
+def capture_tapes(path, device=None, diff_method=None):
+    """Context manager that appends the tape of every QNode evaluation in its body to a trace file.
+
+    Records are written as the QNodes are evaluated, so that the trace never has to fit into
+    memory. Tapes are captured when the QNodes construct them, not when devices execute them, so
+    that the shifted tapes of gradient computations are not recorded; replaying a trace computes
+    the gradients of the recorded tapes itself.
+
+    **Example**
+
+    .. code-block:: python
+
+        with capture_tapes("trace.jsonl.gz", diff_method="parameter-shift"):
+            run_production_workload()
+
+    Args:
+            path (str): trace file to append to
+            device (~.Device): device whose QNodes are captured. Defaults to capturing the
+                    evaluations of all QNodes.
+            diff_method (str): differentiation method stored with the records, since tapes do
+                    not know how they are differentiated
+    """
+    with _open(path, "a") as f:
+        original = qml.QNode.__call__
+
+        def call(qnode, *args, **kwargs):
+            result = original(qnode, *args, **kwargs)
+            if device is None or qnode.device is device:
+                record = tape_to_record(qnode_tape(qnode), qnode.device, diff_method)
+                f.write(json.dumps(record) + "\n")
+            return result
+
+        qml.QNode.__call__ = call
+        try:
+            yield
+        finally:
+            qml.QNode.__call__ = original
+
+
+def read_tapes(path, max_tapes=None):
+    """Streams the records of a trace file one by one.
+
+    Args:
+            path (str): trace file
+            max_tapes (int): maximum number of records to read. Defaults to all records.
+    """
+    with _open(path, "r") as f:
+        for line in itertools.islice(f, max_tapes):
+            if line.strip():
+                yield json.loads(line)
+
+
+def _build_measurement(return_type, obs_names, wires, obs_params):
+    """Recreates a measurement of a trace record."""
+    if return_type == "state":
+        return qml.state()
+    if obs_names is None:
+        if return_type == "probs":
+            return qml.probs(wires=wires)
+        return _MEASUREMENTS[return_type](wires=wires)
+
+    factors = []
+    wire_idx = 0
+    for name, params in zip(obs_names, obs_params):
+        obs_class = getattr(qml, name)
+        n = obs_class.num_wires if isinstance(obs_class.num_wires, int) else len(wires) - wire_idx
+        obs_args = [_from_serializable(p) for p in params]
+        factors.append(obs_class(*obs_args, wires=wires[wire_idx : wire_idx + n]))
+        wire_idx += n
+
+    obs = factors[0]
+    for factor in factors[1:]:
+        obs = obs @ factor
+
+    return _MEASUREMENTS[return_type](obs)
+
+
+def replay_record(record, device, diff_method=None, gradient=False):
+    """Re-executes a single trace record on a device, using the autograd interface.
+
+    Args:
+            record (dict): trace record
+            device (~.Device): device to run the tape on
+            diff_method (str): differentiation method. Defaults to the one of the record, or 'best'.
+            gradient (bool): Whether to compute the Jacobian with respect to the trainable
+                    parameters instead of only evaluating the tape.
+    """
+    diff_method = diff_method or record["diff_method"] or "best"
+    gradient = gradient and all(m[0] in _DIFFERENTIABLE for m in record["measurements"])
+
+    op_params = [_from_serializable(p) for _, _, params in record["ops"] for p in params]
+    trainable = [i for i in record["trainable_params"] if i < len(op_params)]
+
+    @qml.qnode(device, interface="autograd", diff_method=diff_method)
+    def circuit(trainable_params):
+        params = list(op_params)
+        for i, p in zip(trainable, trainable_params):
+            params[i] = p
+
+        idx = 0
+        for name, wires, p in record["ops"]:
+            _operation(name)(*params[idx : idx + len(p)], wires=wires)
+            idx += len(p)
+
+        measurements = [_build_measurement(*m) for m in record["measurements"]]
+        return measurements[0] if len(measurements) == 1 else measurements
+
+    trainable_params = pnp.array([op_params[i] for i in trainable], requires_grad=True)
+
+    if gradient and trainable:
+        return qml.jacobian(circuit)(trainable_params)
+    return circuit(trainable_params)
+
+
+def benchmark_replay(hyperparams={}, num_repeats=1):
+    """Replays the tapes of a trace file captured with `capture_tapes`.
+
+    The tapes are run with the autograd interface. The trace is streamed, so that traces with
+    millions of tapes can be replayed without loading them into memory. Devices are created once for
+    each combination of width and shots.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark
+
+                    * 'path': trace file to replay. Required.
+
+                    * 'device': name of the device on which the tapes are run. Defaults to 'default.qubit'.
+
+                    * 'diff_method': differentiation method overriding the one stored in the trace
+
+                    * 'gradient': Whether to compute Jacobians instead of only evaluating the tapes.
+
+                    * 'max_tapes': maximum number of tapes to replay. Defaults to all tapes.
+
+            num_repeats (int): How often the trace is replayed in a for loop. Default is 1.
+
+    Returns:
+            int: number of tapes replayed in the last repetition
+    """
+    path, device_name, diff_method, gradient, max_tapes = _replay_defaults(hyperparams)
+
+    devices = {}
+
+    for _ in range(num_repeats):
+        n_tapes = 0
+        for record in read_tapes(path, max_tapes):
+            key = (record["num_wires"], record["shots"])
+            if key not in devices:
+                devices[key] = create_device(device_name, wires=key[0], shots=key[1])
+
+            replay_record(record, devices[key], diff_method, gradient)
+            n_tapes += 1
+
+    return n_tapes
@@ -0,0 +1,252 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Long-lived versions of the core workloads for soak tests.
+
+Unlike the benchmark functions, which construct a fresh device and QNode in every call, the
+workloads here construct their device, QNode, parameters and optimizer once and return a function
+that runs a single iteration on them, like a training service would. Memory that the objects
+retain from one iteration to the next therefore accumulates instead of being released.
+"""
+from numpy.random import random
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from .default_settings import _core_defaults, _ml_defaults
+from .optimizers import make_optimizer, optimizer_step
+
+SOAK_WORKLOADS = ["circuit", "gradient", "optimization", "machine_learning"]
+
+
+def _to_interface(params, interface, requires_grad=True):
+    """Converts parameters to the tensor type of an interface."""
+    if interface == "autograd":
+        return pnp.array(params, requires_grad=requires_grad)
+    if interface == "tf":
+        import tensorflow as tf
+
+        return tf.Variable(params)
+    if interface == "torch":
+        import torch
+
+        return torch.tensor(params, requires_grad=requires_grad)
+    if interface == "jax":
+        from jax import numpy as jnp
+
+        return jnp.array(params)
+
+    raise ValueError("Unknown interface {}.".format(interface))
+
+
+def _gradient_step(circuit, interface, params):
+    """Returns one iteration of `benchmark_gradient` for persistent parameters."""
+    if interface == "autograd":
+        jac = qml.jacobian(circuit)
+        return lambda: jac(params)
+
+    if interface == "tf":
+        import tensorflow as tf
+
+        def step():
+            with tf.GradientTape() as tape:
+                result = circuit(params)
+            tape.gradient(result, [params])
+
+        return step
+
+    if interface == "torch":
+
+        def step():
+            circuit(params).backward()
+            params.grad = None
+
+        return step
+
+    import jax
+
+    jac = jax.jacobian(circuit)
+    return lambda: jac(params)
+
+
+def _optimization_step(circuit, interface, params, optimizer):
+    """Returns one step of `benchmark_optimization` that updates persistent parameters."""
+    if interface == "autograd":
+        opt = make_optimizer(optimizer, stepsize=0.1)
+        state = {"params": params}
+
+        def step():
+            state["params"], _ = optimizer_step(opt, circuit, state["params"])
+
+        return step
+
+    if interface == "tf":
+        import tensorflow as tf
+
+        opt = tf.keras.optimizers.SGD(learning_rate=0.1)
+
+        def step():
+            with tf.GradientTape() as tape:
+                loss = circuit(params)
+            gradients = tape.gradient(loss, [params])
+            opt.apply_gradients(zip(gradients, [params]))
+
+        return step
+
+    if interface == "torch":
+        import torch
+
+        opt = torch.optim.SGD([params], lr=0.1)
+
+        def closure():
+            opt.zero_grad()
+            loss = circuit(params)
+            loss.backward()
+            return loss
+
+        return lambda: opt.step(closure)
+
+    raise ValueError(
+        "The optimization workload does not support the {} interface.".format(interface)
+    )
+
+
+def _machine_learning_step(quantum_model, interface, data):
+    """Returns one gradient descent step of `benchmark_machine_learning` that updates persistent
+    weights."""
+    n_features = len(data[0][0])
+    w_quantum = random(size=(n_features, n_features))
+    w_classical = random(size=(n_features, n_features))
+
+    if interface == "autograd":
+        state = {
+            "w_quantum": pnp.array(w_quantum, requires_grad=True),
+            "w_classical": pnp.array(w_classical, requires_grad=True),
+        }
+
+        def average_loss(w_quantum_, w_classical_):
+            c = 0
+            for x, y in data:
+                c += (quantum_model(pnp.dot(w_classical_, x), w_quantum_) - y) ** 2
+            return c / len(data)
+
+        gradient_fn = qml.grad(average_loss, argnum=[0, 1])
+
+        def step():
+            grad_qu, grad_class = gradient_fn(state["w_quantum"], state["w_classical"])
+            state["w_quantum"] = state["w_quantum"] - 0.05 * grad_qu
+            state["w_classical"] = state["w_classical"] - 0.05 * grad_class
+
+        return step
+
+    if interface == "tf":
+        import tensorflow as tf
+
+        tf_data = [
+            [tf.constant(x, dtype=tf.double), tf.constant(y, dtype=tf.double)] for x, y in data
+        ]
+        w_quantum = tf.Variable(w_quantum, dtype=tf.double)
+        w_classical = tf.Variable(w_classical, dtype=tf.double)
+
+        def step():
+            with tf.GradientTape() as tape:
+                c = tf.constant(0, dtype=tf.double)
+                for x, y in tf_data:
+                    prediction = quantum_model(tf.linalg.matvec(w_classical, x), w_quantum)
+                    c = c + (prediction - y) ** 2
+                loss = c / len(tf_data)
+
+            grad_qu, grad_class = tape.gradient(loss, [w_quantum, w_classical])
+            w_quantum.assign_sub(0.05 * grad_qu)
+            w_classical.assign_sub(0.05 * grad_class)
+
+        return step
+
+    if interface == "torch":
+        import torch
+
+        torch_data = [
+            [torch.tensor(x, dtype=torch.double), torch.tensor(y, dtype=torch.double)]
+            for x, y in data
+        ]
+        w_quantum = torch.tensor(w_quantum, requires_grad=True, dtype=torch.double)
+        w_classical = torch.tensor(w_classical, requires_grad=True, dtype=torch.double)
+
+        def step():
+            c = torch.tensor(0, dtype=torch.double)
+            for x, y in torch_data:
+                c += (quantum_model(torch.matmul(w_classical, x), w_quantum) - y) ** 2
+            loss = c / len(torch_data)
+            loss.backward()
+
+            w_quantum.data -= 0.05 * w_quantum.grad
+            w_classical.data -= 0.05 * w_classical.grad
+            w_quantum.grad = None
+            w_classical.grad = None
+
+        return step
+
+    raise ValueError(
+        "The machine learning workload does not support the {} interface.".format(interface)
+    )
+
+
+def soak_workload(workload, hyperparams={}):
+    """Constructs the long-lived objects of a core workload and returns a function that runs one
+    iteration of it.
+
+    Args:
+            workload (str): one of ``SOAK_WORKLOADS``. The 'circuit', 'gradient' and 'optimization'
+                    workloads evaluate, differentiate and train the circuit of `benchmark_circuit`,
+                    and the 'machine_learning' workload trains the hybrid model of
+                    `benchmark_machine_learning` on all samples per iteration.
+            hyperparams (dict): hyperparameters of the benchmark function of the workload. The
+                    'optimization' workload additionally accepts 'optimizer', see
+                    `benchmark_optimization`.
+
+    Returns:
+            callable: function without arguments that runs one iteration
+    """
+    if workload == "machine_learning":
+        data, device, diff_method, interface = _ml_defaults(hyperparams)
+
+        @qml.qnode(device, interface=interface, diff_method=diff_method)
+        def quantum_model(x, params):
+            qml.templates.AngleEmbedding(x, wires=range(len(x)))
+            qml.templates.BasicEntanglerLayers(params, wires=range(len(x)))
+            return qml.expval(qml.PauliZ(0))
+
+        return _machine_learning_step(quantum_model, interface, data)
+
+    if workload not in SOAK_WORKLOADS:
+        raise ValueError("Unknown workload {}; choose one of {}.".format(workload, SOAK_WORKLOADS))
+
+    optimizer = hyperparams.pop("optimizer", "gradient_descent")
+    device, diff_method, interface, params, template, measurement = _core_defaults(hyperparams)
+
+    @qml.qnode(device, interface=interface, diff_method=diff_method)
+    def circuit(params_):
+        template(params_)
+        measurement.queue()
+        return measurement
+
+    if workload == "circuit":
+        params = _to_interface(params, interface, requires_grad=False)
+        return lambda: circuit(params)
+
+    params = _to_interface(params, interface)
+
+    if workload == "gradient":
+        return _gradient_step(circuit, interface, params)
+
+    return _optimization_step(circuit, interface, params, optimizer)
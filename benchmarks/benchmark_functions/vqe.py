@@ -15,8 +15,45 @@
 Benchmarks for VQE simulations.
 """
 import pennylane as qml
+from .compat import expval_cost, num_executions
 from .default_settings import _vqe_defaults
-from packaging import version
+from .optimizers import make_optimizer, optimizer_step
+
+
+def vqe_cost_function(hyperparams={}):
+    """Constructs the cost function of the VQE benchmark.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_vqe`
+
+    Returns:
+            tuple: the cost function, the initial parameters, the number of steps and the device.
+            Executions should be counted with `compat.num_executions` of the cost function, since
+            the cost function may run on a different device.
+    """
+    ham, ansatz, params, n_steps, device, interface, diff_method, grouping = _vqe_defaults(hyperparams)
+
+    cost_fn = expval_cost(ansatz, ham, device, interface, diff_method, optimize=grouping)
+
+    return cost_fn, params, n_steps, device
+
+
+def prepare_vqe(hyperparams={}, stepsize=0.4):
+    """Constructs the cost function and optimizer of `benchmark_vqe`, so that the optimization
+    steps can be timed without their construction.
+
+    Args:
+            hyperparams (dict): hyperparameters to configure this benchmark, see `benchmark_vqe`
+            stepsize (float): step size of the gradient-based optimizers
+
+    Returns:
+            tuple: the optimizer, the cost function, the initial parameters and the number of steps
+    """
+    optimizer = hyperparams.pop("optimizer", "gradient_descent")
+
+    cost_fn, params, n_steps, _ = vqe_cost_function(hyperparams)
+
+    return make_optimizer(optimizer, stepsize), cost_fn, params, n_steps
 
 
 def benchmark_vqe(hyperparams={}):
@@ -41,23 +78,17 @@ def benchmark_vqe(hyperparams={}):
                     * 'diff_method': Name of differentiation method
 
                     * 'optimize': argument for grouping the observables composing the Hamiltonian
-    """
-
-    ham, ansatz, params, n_steps, device, interface, diff_method, grouping = _vqe_defaults(hyperparams)
 
-    if version.parse(qml.__version__) > version.parse("0.17"):
-        if grouping:
-            ham.compute_grouping()
+                    * 'optimizer': name of the optimizer, one of `optimizers.OPTIMIZERS`. Defaults to
+                      'gradient_descent'.
 
-        @qml.qnode(device)
-        def cost_fn(weights):
-            ansatz(weights, wires=device.wires)
-            return qml.expval(ham)
-
-    else:
-        cost_fn = qml.ExpvalCost(ansatz, ham, device, interface=interface, diff_method=diff_method, optimize=grouping)
+    Returns:
+            int: number of circuit executions on the devices used by the cost function, see
+            `compat.num_executions`
+    """
+    opt, cost_fn, params, n_steps = prepare_vqe(hyperparams)
 
-    opt = qml.GradientDescentOptimizer(stepsize=0.4)
     for _ in range(n_steps):
-        params, energy = opt.step_and_cost(cost_fn, params)
+        params, energy = optimizer_step(opt, cost_fn, params)
 
+    return num_executions(cost_fn)
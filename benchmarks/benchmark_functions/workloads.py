@@ -0,0 +1,188 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Loading and running of declarative workload specifications.
+
+A workload specification is a JSON or YAML mapping with the keys
+
+* 'name': name of the generated benchmark class,
+
+* 'description' (optional): docstring of the generated benchmark class,
+
+* 'function': name of a benchmark function in ``FUNCTIONS``,
+
+* 'params' (optional): mapping from hyperparameter names to the list of values to benchmark,
+
+* 'hyperparams' (optional): hyperparameters that are the same for all benchmarks,
+
+* 'kwargs' (optional): keyword arguments passed to the benchmark function next to the hyperparameters,
+
+* 'policy' (optional): asv attributes of the class like 'timeout', 'repeat' or 'number',
+
+* 'metrics' (optional): list of metrics to record, see ``METRICS``. Defaults to ['time'].
+
+A hyperparameter or keyword argument given as ``{"ref": name}`` is replaced by the object ``REFERENCES[name]``,
+and as ``{"ref": name, "args": [...]}`` by the result of calling it with the arguments.
+"""
+import copy
+import glob
+import json
+import os
+import warnings
+
+import networkx as nx
+
+from .circuit import benchmark_circuit
+from .gradient import benchmark_gradient
+from .hamiltonians import ham_h2, ham_lih
+from .machine_learning import benchmark_machine_learning
+from .noise import benchmark_noisy_circuit
+from .optimization import benchmark_optimization
+from .qaoa import benchmark_qaoa
+from .vqe import benchmark_vqe
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# directory holding the workload specifications shipped with the repository
+WORKLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "workloads")
+
+# environment variable with further directories of workload specifications, separated by os.pathsep
+WORKLOAD_PATH_VARIABLE = "PL_BENCHMARK_WORKLOADS"
+
+FUNCTIONS = {
+    "benchmark_circuit": benchmark_circuit,
+    "benchmark_gradient": benchmark_gradient,
+    "benchmark_optimization": benchmark_optimization,
+    "benchmark_noisy_circuit": benchmark_noisy_circuit,
+    "benchmark_vqe": benchmark_vqe,
+    "benchmark_qaoa": benchmark_qaoa,
+    "benchmark_machine_learning": benchmark_machine_learning,
+}
+
+REFERENCES = {
+    "ham_h2": ham_h2,
+    "ham_lih": ham_lih,
+    "complete_graph": nx.complete_graph,
+    "cycle_graph": nx.cycle_graph,
+}
+
+METRICS = ["time", "peakmem", "peak_workload_memory"]
+
+
+def _read_spec_file(path):
+    """Reads the list of specifications stored in a JSON or YAML file."""
+    with open(path) as f:
+        if path.endswith(".json"):
+            specs = json.load(f)
+        elif yaml is None:
+            warnings.warn("PyYAML is not installed, skipping workload file {}.".format(path))
+            return []
+        else:
+            specs = yaml.safe_load(f)
+
+    if isinstance(specs, dict):
+        specs = [specs]
+
+    return specs
+
+
+def validate_spec(spec):
+    """Checks that a workload specification is complete and only refers to known functions
+    and metrics.
+
+    Args:
+            spec (dict): workload specification
+    """
+    for key in ["name", "function"]:
+        if key not in spec:
+            raise ValueError("Workload specification {} has no '{}' key.".format(spec, key))
+
+    if spec["function"] not in FUNCTIONS:
+        raise ValueError(
+            "Unknown function {} in workload {}; choose one of {}.".format(
+                spec["function"], spec["name"], list(FUNCTIONS)
+            )
+        )
+
+    for metric in spec.get("metrics", ["time"]):
+        if metric not in METRICS:
+            raise ValueError(
+                "Unknown metric {} in workload {}; choose one of {}.".format(
+                    metric, spec["name"], METRICS
+                )
+            )
+
+
+def load_workload_specs(directories=None):
+    """Loads and validates all workload specifications from a list of directories.
+
+    Args:
+            directories (list[str]): directories to search for ``.json``, ``.yaml`` and ``.yml``
+                    files. Defaults to ``WORKLOAD_DIR`` and the directories listed in the
+                    ``PL_BENCHMARK_WORKLOADS`` environment variable.
+
+    Returns:
+            list[dict]: workload specifications, ordered by file name
+    """
+    if directories is None:
+        directories = [WORKLOAD_DIR]
+        extra = os.environ.get(WORKLOAD_PATH_VARIABLE, "")
+        directories += [d for d in extra.split(os.pathsep) if d]
+
+    specs = []
+    for directory in directories:
+        paths = []
+        for pattern in ["*.json", "*.yaml", "*.yml"]:
+            paths += glob.glob(os.path.join(directory, pattern))
+
+        for path in sorted(paths):
+            for spec in _read_spec_file(path):
+                validate_spec(spec)
+                specs.append(spec)
+
+    return specs
+
+
+def resolve_references(value):
+    """Replaces ``{"ref": name}`` entries by the objects they refer to.
+
+    Args:
+            value: value from a workload specification
+    """
+    if isinstance(value, dict) and "ref" in value:
+        obj = REFERENCES[value["ref"]]
+        if "args" in value:
+            obj = obj(*value["args"])
+        return obj
+
+    return value
+
+
+def run_workload(spec, param_values):
+    """Runs the benchmark function of a workload for one point of its parameter grid.
+
+    Args:
+            spec (dict): workload specification
+            param_values (tuple): one value for each entry of the 'params' of the specification
+    """
+    # the benchmark functions consume the hyperparameter dictionary, so it is rebuilt for every call
+    hyperparams = copy.deepcopy(spec.get("hyperparams", {}))
+    hyperparams.update(zip(spec.get("params", {}), param_values))
+    hyperparams = {k: resolve_references(v) for k, v in hyperparams.items()}
+    kwargs = {k: resolve_references(v) for k, v in spec.get("kwargs", {}).items()}
+
+    return FUNCTIONS[spec["function"]](hyperparams, **kwargs)
@@ -0,0 +1,377 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Change-point detection over the asv result history.
+
+Every benchmark, parameter combination, machine and environment forms one series of results
+ordered by commit date. Each series is split recursively at the point where the difference of the
+segment means is most significant, taking into account both the noise measured by asv and the
+scatter within the segments. Splitting whole segments, rather than comparing neighbouring
+commits, also finds slow drifts that are too small to notice from one commit to the next.
+
+Usage:
+
+    python tools/detect_regressions.py --results .asv/results --threshold 0.05
+
+The command prints the detected steps ranked by magnitude, and exits with code 1 if a step that
+worsens a benchmark by more than its threshold was found with enough confidence. Most benchmarks
+measure costs, which get worse when they increase. Benchmarks whose unit is in
+``HIGHER_IS_BETTER_UNITS``, like speedups and throughputs, get worse when they decrease; the
+thresholds file can also set the direction of a benchmark explicitly.
+"""
+import argparse
+import fnmatch
+import glob
+import itertools
+import json
+import math
+import os
+import statistics
+import sys
+
+# z-value of the two-sided 99% confidence interval reported by asv
+_Z_99 = 2.576
+
+# ratio between the interquartile range and the standard deviation of a normal distribution
+_IQR_TO_STD = 1.349
+
+# units of benchmarks for which larger values are better
+HIGHER_IS_BETTER_UNITS = {
+    "speedup",
+    "speedup/worker",
+    "samples/s",
+    "epochs per second",
+    "fraction of gates",
+}
+
+
+def _column(entry, columns, name):
+    """Returns a column of a result entry in the asv results format version 2, or None."""
+    if name not in columns:
+        return None
+    idx = columns.index(name)
+    return entry[idx] if idx < len(entry) else None
+
+
+def _noise(i, ci_a, ci_b, q_25, q_75):
+    """Estimates the standard deviation of the i-th result from the statistics stored by asv."""
+    if ci_a and ci_b and ci_a[i] is not None and ci_b[i] is not None:
+        return (ci_b[i] - ci_a[i]) / (2 * _Z_99)
+    if q_25 and q_75 and q_25[i] is not None and q_75[i] is not None:
+        return (q_75[i] - q_25[i]) / _IQR_TO_STD
+    return None
+
+
+def _parse_result(entry, columns):
+    """Returns the list of (value, noise) pairs and the parameter lists of a result entry."""
+    if columns is not None:
+        values = _column(entry, columns, "result")
+        params = _column(entry, columns, "params") or []
+        stats = [
+            _column(entry, columns, name)
+            for name in ["stats_ci_99_a", "stats_ci_99_b", "stats_q_25", "stats_q_75"]
+        ]
+    elif isinstance(entry, dict):
+        # results format version 1
+        values = entry.get("result")
+        params = entry.get("params", [])
+        stats = [None] * 4
+        entry_stats = entry.get("stats") or []
+        if any(entry_stats):
+            stats = [
+                [s and s["ci_99"][0] for s in entry_stats],
+                [s and s["ci_99"][1] for s in entry_stats],
+                [s and s.get("q_25") for s in entry_stats],
+                [s and s.get("q_75") for s in entry_stats],
+            ]
+    else:
+        values, params, stats = entry, [], [None] * 4
+
+    if values is None:
+        return [], params
+    if not isinstance(values, list):
+        values = [values]
+
+    return [(v, _noise(i, *stats)) for i, v in enumerate(values)], params
+
+
+def load_units(results_dir):
+    """Returns the units of the benchmarks listed in ``benchmarks.json`` of an asv results
+    directory.
+
+    Args:
+            results_dir (str): asv results directory
+
+    Returns:
+            dict: maps benchmark names to units, which are None for timing benchmarks
+    """
+    benchmarks_file = os.path.join(results_dir, "benchmarks.json")
+    if not os.path.exists(benchmarks_file):
+        return {}
+
+    with open(benchmarks_file) as f:
+        return {
+            name: info.get("unit")
+            for name, info in json.load(f).items()
+            if isinstance(info, dict)
+        }
+
+
+def load_series(results_dir):
+    """Collects the result series of all benchmarks from an asv results directory.
+
+    Args:
+            results_dir (str): asv results directory, containing one folder per machine
+
+    Returns:
+            dict: maps (machine, environment, benchmark, parameter label) to a list of
+            (date, commit hash, value, noise) tuples ordered by date
+    """
+    param_names = {}
+    benchmarks_file = os.path.join(results_dir, "benchmarks.json")
+    if os.path.exists(benchmarks_file):
+        with open(benchmarks_file) as f:
+            for name, info in json.load(f).items():
+                if isinstance(info, dict):
+                    param_names[name] = info.get("param_names", [])
+
+    series = {}
+    for path in glob.glob(os.path.join(results_dir, "*", "*.json")):
+        if os.path.basename(path) == "machine.json":
+            continue
+
+        with open(path) as f:
+            data = json.load(f)
+
+        if "results" not in data or "commit_hash" not in data:
+            continue
+
+        machine = os.path.basename(os.path.dirname(path))
+        env = data.get("env_name", "")
+        columns = data.get("result_columns")
+
+        for name, entry in data["results"].items():
+            points, params = _parse_result(entry, columns)
+            names = param_names.get(name, ["p{}".format(i) for i in range(len(params))])
+
+            for (value, noise), combo in zip(points, itertools.product(*params)):
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    # failed or skipped benchmarks store None or NaN
+                    continue
+                if math.isnan(value):
+                    continue
+                label = ", ".join("{}={}".format(n, c) for n, c in zip(names, combo))
+                key = (machine, env, name, label)
+                series.setdefault(key, []).append(
+                    (data.get("date", 0), data["commit_hash"], value, noise)
+                )
+
+    for points in series.values():
+        points.sort()
+
+    return series
+
+
+def _segment_stats(values, noise):
+    """Returns the mean and the squared standard error of the mean of a segment."""
+    n = len(values)
+    mean = sum(values) / n
+    scatter = statistics.variance(values) if n > 1 else 0.0
+    measured = [s ** 2 for s in noise if s is not None]
+    measured = sum(measured) / len(measured) if measured else 0.0
+    return mean, max(scatter, measured) / n
+
+
+def _best_split(values, noise, min_size):
+    """Finds the split of a segment with the largest z-score of the difference of means."""
+    best = None
+    for k in range(min_size, len(values) - min_size + 1):
+        mean_l, se_l = _segment_stats(values[:k], noise[:k])
+        mean_r, se_r = _segment_stats(values[k:], noise[k:])
+        se = math.sqrt(se_l + se_r)
+        if se == 0:
+            z = math.inf if mean_l != mean_r else 0.0
+        else:
+            z = abs(mean_r - mean_l) / se
+        if best is None or z > best[0]:
+            best = (z, k, mean_l, mean_r)
+    return best
+
+
+def detect_change_points(points, min_confidence=0.99, min_size=2, min_magnitude=0.01):
+    """Detects step changes in a series by binary segmentation.
+
+    The confidence of a split is corrected for the number of candidate splits of its segment
+    (Bonferroni correction), since the best of many candidates is significant by chance more often.
+
+    Args:
+            points (list[tuple]): (date, commit hash, value, noise) tuples ordered by date
+            min_confidence (float): confidence a split needs to be accepted
+            min_size (int): minimum number of results on each side of a step
+            min_magnitude (float): minimum relative change of the means a split needs to be accepted
+
+    Returns:
+            list[dict]: detected steps with the last commit before and the first commit after the
+            step, the segment means, the relative magnitude and the confidence
+    """
+    values = [p[2] for p in points]
+    noise = [p[3] for p in points]
+    steps = []
+
+    segments = [(0, len(points))]
+    while segments:
+        start, stop = segments.pop()
+        if stop - start < 2 * min_size:
+            continue
+
+        z, k, mean_l, mean_r = _best_split(values[start:stop], noise[start:stop], min_size)
+        n_candidates = stop - start - 2 * min_size + 1
+        p_value = math.erfc(z / math.sqrt(2)) * n_candidates if math.isfinite(z) else 0.0
+        confidence = max(0.0, 1.0 - p_value)
+        magnitude = (mean_r - mean_l) / abs(mean_l) if mean_l else math.inf
+        if confidence < min_confidence or abs(magnitude) < min_magnitude:
+            continue
+
+        split = start + k
+        steps.append(
+            {
+                "before": points[split - 1][1],
+                "after": points[split][1],
+                "mean_before": mean_l,
+                "mean_after": mean_r,
+                "magnitude": magnitude,
+                "confidence": confidence,
+            }
+        )
+        segments += [(start, split), (split, stop)]
+
+    return steps
+
+
+def load_thresholds(path, default, units=None):
+    """Loads per-benchmark thresholds and directions from a JSON file mapping benchmark name
+    patterns to the relative change that fails the check.
+
+    A value is either a threshold, like ``{"app_suite.VQE_heavy.*": 0.2}``, or an object with the
+    optional keys 'threshold' and 'higher_is_better', like
+    ``{"parallel_suite.*.track_speedup": {"higher_is_better": true}}``. Without an explicit
+    direction, a benchmark is higher-is-better if its unit is in ``HIGHER_IS_BETTER_UNITS``.
+
+    Args:
+            path (str): JSON file, or None
+            default (float): threshold for benchmarks matching no pattern
+            units (dict): maps benchmark names to units, see `load_units`
+
+    Returns:
+            callable: function returning the threshold and whether higher is better for a
+            benchmark name
+    """
+    thresholds = {}
+    if path:
+        with open(path) as f:
+            thresholds = json.load(f)
+    units = units or {}
+
+    def threshold(name):
+        value, higher_is_better = default, None
+        for pattern, setting in thresholds.items():
+            if fnmatch.fnmatch(name, pattern):
+                if isinstance(setting, dict):
+                    value = setting.get("threshold", default)
+                    higher_is_better = setting.get("higher_is_better")
+                else:
+                    value = setting
+                break
+
+        if higher_is_better is None:
+            higher_is_better = units.get(name) in HIGHER_IS_BETTER_UNITS
+        return value, higher_is_better
+
+    return threshold
+
+
+def is_regression(magnitude, threshold, higher_is_better=False):
+    """Returns whether a step of the given relative magnitude worsens a benchmark by more than
+    the threshold.
+
+    Args:
+            magnitude (float): relative change of the means, see `detect_change_points`
+            threshold (float): relative change that fails the check
+            higher_is_better (bool): Whether larger values of the benchmark are better
+    """
+    return (-magnitude if higher_is_better else magnitude) > threshold
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--results", default=".asv/results", help="asv results directory")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="relative worsening of a benchmark that fails the check (default: 0.05)",
+    )
+    parser.add_argument(
+        "--thresholds", help="JSON file mapping benchmark name patterns to thresholds"
+    )
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        default=0.99,
+        help="confidence a step needs to be reported (default: 0.99)",
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=2,
+        help="minimum number of commits on each side of a step (default: 2)",
+    )
+    parser.add_argument(
+        "--min-magnitude",
+        type=float,
+        default=0.01,
+        help="minimum relative change of a step to be reported (default: 0.01)",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    threshold = load_thresholds(args.thresholds, args.threshold, load_units(args.results))
+
+    report = []
+    for (machine, env, name, label), points in load_series(args.results).items():
+        steps = detect_change_points(points, args.min_confidence, args.min_size, args.min_magnitude)
+        for step in steps:
+            step.update(machine=machine, env=env, benchmark=name, params=label)
+            step["regression"] = is_regression(step["magnitude"], *threshold(name))
+            report.append(step)
+
+    report.sort(key=lambda s: abs(s["magnitude"]), reverse=True)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for step in report:
+            print(
+                "{flag} {magnitude:+8.1%} (confidence {confidence:.4f})  {benchmark}({params})\n"
+                "      {before:.8}..{after:.8}  {mean_before:.4g} -> {mean_after:.4g}  "
+                "[{machine}, {env}]".format(flag="!!" if step["regression"] else "  ", **step)
+            )
+        n_regressions = sum(s["regression"] for s in report)
+        print("{} step changes found, {} regressions.".format(len(report), n_regressions))
+
+    return 1 if any(s["regression"] for s in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
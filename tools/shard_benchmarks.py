@@ -0,0 +1,319 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Distribution of asv runs over several nodes and merging of their results.
+
+The work items are all pairs of a commit and a benchmark, since asv runs the parameter
+combinations of a benchmark together. Items are sorted by the median of their past durations
+and assigned one by one to the shard with the least estimated work, which makes the plan
+deterministic for the same inputs and keeps the shards balanced even when a few benchmarks take
+much longer than the rest.
+
+Usage:
+
+    python tools/shard_benchmarks.py plan --commits commits.txt --shards 4 --output plan.json
+    python tools/shard_benchmarks.py run --plan plan.json --shard 0 -- --machine ci-runner
+    python tools/shard_benchmarks.py merge node0/results node1/results --output .asv/results
+
+Nodes with identical hardware should share one asv machine name with identical metadata, so that
+the results of all shards form one series per benchmark. Only different kinds of hardware get
+different names. The merge step refuses to combine results of one machine name whose machine
+metadata differs, so that results of different hardware are never mixed in one series.
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+
+# estimated duration of a benchmark without past results, in seconds
+DEFAULT_DURATION = 60.0
+
+
+def load_benchmarks(results_dir, pattern=None):
+    """Returns the names of the benchmarks listed in ``benchmarks.json`` of an asv results
+    directory.
+
+    Args:
+            results_dir (str): asv results directory
+            pattern (str): regular expression the names must match, or None
+    """
+    with open(os.path.join(results_dir, "benchmarks.json")) as f:
+        benchmarks = json.load(f)
+
+    names = sorted(name for name, info in benchmarks.items() if isinstance(info, dict))
+    if pattern:
+        names = [name for name in names if re.search(pattern, name)]
+    return names
+
+
+def _result_files(results_dir):
+    """Yields the paths of all result files of an asv results directory."""
+    for path in sorted(glob.glob(os.path.join(results_dir, "*", "*.json"))):
+        if os.path.basename(path) != "machine.json":
+            yield path
+
+
+def _durations(data):
+    """Returns the durations in seconds of the benchmarks in a result file."""
+    columns = data.get("result_columns")
+    durations = {}
+
+    if columns is not None and "duration" in columns:
+        idx = columns.index("duration")
+        for name, entry in data.get("results", {}).items():
+            if idx < len(entry) and entry[idx] is not None:
+                durations[name] = entry[idx]
+
+    # results format version 1 stores start and end times in milliseconds
+    started, ended = data.get("started_at", {}), data.get("ended_at", {})
+    for name in started:
+        if name in ended and name not in durations:
+            durations[name] = (ended[name] - started[name]) / 1000
+
+    return durations
+
+
+def load_durations(results_dir):
+    """Collects the median past duration of every benchmark over all machines and commits.
+
+    Args:
+            results_dir (str): asv results directory, or None
+
+    Returns:
+            dict: maps benchmark names to durations in seconds
+    """
+    if results_dir is None:
+        return {}
+
+    samples = {}
+    for path in _result_files(results_dir):
+        with open(path) as f:
+            data = json.load(f)
+        for name, duration in _durations(data).items():
+            samples.setdefault(name, []).append(duration)
+
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def plan_shards(commits, benchmarks, durations, n_shards):
+    """Assigns all (commit, benchmark) pairs to shards, balancing their estimated durations.
+
+    Args:
+            commits (list[str]): commit hashes
+            benchmarks (list[str]): benchmark names
+            durations (dict): past durations of the benchmarks in seconds. Benchmarks without past
+                    durations are estimated with the median of the known durations.
+            n_shards (int): number of shards
+
+    Returns:
+            list[dict]: per shard, the estimated duration in seconds and the runs, each with a
+            commit and the benchmarks to run for it
+    """
+    default = statistics.median(durations.values()) if durations else DEFAULT_DURATION
+    items = [(durations.get(b, default), c, b) for c in commits for b in benchmarks]
+    # longest first, with commit and name as tie breakers so the plan is deterministic
+    items.sort(key=lambda item: (-item[0], item[1], item[2]))
+
+    loads = [0.0] * n_shards
+    assigned = [[] for _ in range(n_shards)]
+    for duration, commit, benchmark in items:
+        shard = loads.index(min(loads))
+        loads[shard] += duration
+        assigned[shard].append((commit, benchmark))
+
+    shards = []
+    for load, pairs in zip(loads, assigned):
+        runs = {}
+        for commit, benchmark in pairs:
+            runs.setdefault(commit, []).append(benchmark)
+        shards.append(
+            {
+                "estimated_seconds": load,
+                "runs": [
+                    {"commit": c, "benchmarks": sorted(runs[c])} for c in commits if c in runs
+                ],
+            }
+        )
+    return shards
+
+
+def run_shard(shard, asv_args):
+    """Runs the benchmarks of a shard with asv, one asv call per commit.
+
+    Args:
+            shard (dict): shard of a plan created by `plan_shards`
+            asv_args (list[str]): further arguments for ``asv run``
+
+    Returns:
+            int: the highest exit code of the asv calls
+    """
+    code = 0
+    for run in shard["runs"]:
+        bench = "^({})$".format("|".join(re.escape(b) for b in run["benchmarks"]))
+        command = ["asv", "run", "--bench", bench] + asv_args + [run["commit"] + "^!"]
+        print(" ".join(command), flush=True)
+        code = max(code, subprocess.call(command))
+    return code
+
+
+def _load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4, sort_keys=True)
+
+
+def _machine_info(data):
+    """Returns the machine metadata without the file format version."""
+    return {k: v for k, v in data.items() if k != "version"}
+
+
+def _merge_result_file(target, source, path):
+    """Adds the results of one result file to those of another for the same commit, environment
+    and machine."""
+    for key in ["version", "commit_hash", "env_name", "params", "result_columns"]:
+        if target.get(key) != source.get(key):
+            raise ValueError("Cannot merge {}: the results differ in '{}'.".format(path, key))
+
+    for key in ["results", "benchmark_version", "started_at", "ended_at", "durations"]:
+        if key in source:
+            target.setdefault(key, {}).update(source[key])
+
+    target["date"] = max(target.get("date", 0), source.get("date", 0))
+
+
+def merge_results(inputs, output):
+    """Merges the asv results directories of several nodes into one.
+
+    Result files of the same commit, environment and machine are combined benchmark by benchmark.
+
+    Args:
+            inputs (list[str]): asv results directories of the nodes
+            output (str): asv results directory to merge into, which may already hold results
+
+    Raises:
+            ValueError: if machine metadata, benchmark versions or result files are inconsistent
+    """
+    os.makedirs(output, exist_ok=True)
+
+    benchmarks_path = os.path.join(output, "benchmarks.json")
+    benchmarks = _load_json(benchmarks_path) if os.path.exists(benchmarks_path) else {}
+
+    for results_dir in inputs:
+        source_benchmarks = os.path.join(results_dir, "benchmarks.json")
+        if os.path.exists(source_benchmarks):
+            for name, info in _load_json(source_benchmarks).items():
+                if name in benchmarks and benchmarks[name] != info:
+                    raise ValueError(
+                        "Benchmark {} differs between the nodes; run all nodes with the same "
+                        "benchmark code.".format(name)
+                    )
+                benchmarks[name] = info
+
+        for machine_path in sorted(glob.glob(os.path.join(results_dir, "*", "machine.json"))):
+            machine = os.path.basename(os.path.dirname(machine_path))
+            target_dir = os.path.join(output, machine)
+            target_machine = os.path.join(target_dir, "machine.json")
+
+            if os.path.exists(target_machine):
+                info, target_info = _load_json(machine_path), _load_json(target_machine)
+                if _machine_info(info) != _machine_info(target_info):
+                    raise ValueError(
+                        "Machine {} has different metadata on different nodes; register every "
+                        "kind of hardware under its own machine name.".format(machine)
+                    )
+            else:
+                os.makedirs(target_dir, exist_ok=True)
+                shutil.copyfile(machine_path, target_machine)
+
+        for path in _result_files(results_dir):
+            machine = os.path.basename(os.path.dirname(path))
+            target_path = os.path.join(output, machine, os.path.basename(path))
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+            if os.path.exists(target_path):
+                target = _load_json(target_path)
+                _merge_result_file(target, _load_json(path), path)
+                _write_json(target_path, target)
+            else:
+                shutil.copyfile(path, target_path)
+
+    _write_json(benchmarks_path, benchmarks)
+
+
+def _read_commits(path):
+    """Reads commit hashes from a file with one hash per line, ignoring blank lines."""
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan_parser = subparsers.add_parser("plan", help="split the commits and benchmarks into shards")
+    plan_parser.add_argument("--commits", required=True, help="file with one commit hash per line")
+    plan_parser.add_argument("--shards", type=int, required=True, help="number of shards")
+    plan_parser.add_argument(
+        "--results",
+        default=".asv/results",
+        help="asv results directory with benchmarks.json and past results",
+    )
+    plan_parser.add_argument("--bench", help="regular expression selecting the benchmarks")
+    plan_parser.add_argument("--output", default="plan.json", help="plan file to write")
+
+    run_parser = subparsers.add_parser("run", help="run one shard of a plan with asv")
+    run_parser.add_argument("--plan", default="plan.json", help="plan file")
+    run_parser.add_argument("--shard", type=int, required=True, help="index of the shard to run")
+    run_parser.add_argument("asv_args", nargs="*", help="further arguments for asv run, after --")
+
+    merge_parser = subparsers.add_parser("merge", help="merge the results of several nodes")
+    merge_parser.add_argument("inputs", nargs="+", help="asv results directories of the nodes")
+    merge_parser.add_argument("--output", default=".asv/results", help="asv results directory")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "plan":
+        commits = _read_commits(args.commits)
+        benchmarks = load_benchmarks(args.results, args.bench)
+        durations = load_durations(args.results)
+        shards = plan_shards(commits, benchmarks, durations, args.shards)
+        _write_json(args.output, {"commits": commits, "shards": shards})
+        for idx, shard in enumerate(shards):
+            n_items = sum(len(r["benchmarks"]) for r in shard["runs"])
+            print(
+                "shard {}: {} items, estimated {:.0f} s".format(
+                    idx, n_items, shard["estimated_seconds"]
+                )
+            )
+        return 0
+
+    if args.command == "run":
+        shards = _load_json(args.plan)["shards"]
+        return run_shard(shards[args.shard], args.asv_args)
+
+    merge_results(args.inputs, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())